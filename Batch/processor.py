@@ -0,0 +1,347 @@
+"""
+Headless batch processing of stat block files.
+
+Goes straight from ParseCreature to export and persistence without building
+any Tk widgets, so it can run on a machine with no display.  Parsing can be
+fanned out over a pool of worker processes, the parsed creatures always come
+back to this process which is the only writer for the database and output/.
+
+When saving, the import manifest (Database/manifest.py) makes re-runs incremental:
+unchanged files are skipped and changed files replace the creature they produced before.
+A bundle export is rewritten from scratch on every run, so with action both and a
+bundle output the unchanged files are still parsed and exported, only not saved again.
+
+With split set, every file (or stdin, given as "-") is a document holding many
+stat blocks, streamed through the StatBlockSplitter one creature at a time.
+
+A run can report its progress and be cancelled from another thread, the GUI runs
+it on a background thread so the window stays responsive.
+
+With profiling on, each worker process sends its parser profile counters back with
+every creature, they are added up here and reported when the run ends.
+
+The database modules, and SQLAlchemy with them, are only imported once a run saves,
+so exports and the worker processes start without loading them.
+"""
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from Parsers.ParseCache import parse_creature, configure_cache
+from Parsers.ParserTrace import configure_trace
+from Parsers.ParserProfile import configure_profile, get_default_profile, DEFAULT_PROFILE_FILE
+from Parsers.StatBlockSplitter import split_stat_blocks
+from Exporters.CreatureExporter import EXPORT_DIRECTORY, ExportError
+from Exporters.ExportTargets import open_export_target, is_bundle
+
+# Files handed to a worker process in one go, keeps the pickling overhead low
+WORKER_CHUNK_SIZE = 8
+# Parsed creatures written to the database per bulk insert transaction
+SAVE_CHUNK_SIZE = 500
+# Stat blocks of a split document queued for the workers at any one time, keeps memory flat
+SPLIT_QUEUE_SIZE = 64
+STDIN_FILE = '-'
+
+
+def parse_file(file):
+    """Parse a single stat block file, runs inside the worker processes."""
+    raw = Path(file).read_text(encoding="utf-8")
+    return file, parse_creature(raw)
+
+
+def parse_block(block):
+    """Parse one (label, text) stat block split out of a document, runs inside the worker processes."""
+    label, text = block
+    return label, parse_creature(text)
+
+
+def parse_file_profiled(file):
+    """parse_file, also returning the profile counters of the parse to the parent process."""
+    return parse_file(file) + (get_default_profile().drain(),)
+
+
+def parse_block_profiled(block):
+    """parse_block, also returning the profile counters of the parse to the parent process."""
+    return parse_block(block) + (get_default_profile().drain(),)
+
+
+def configure_worker(trace_level, trace_file, parse_cache, profile):
+    """Worker processes may not inherit our settings, so they are passed in explicitly."""
+    configure_trace(trace_level, trace_file)
+    configure_cache(parse_cache)
+    configure_profile(profile)
+
+
+class BatchProcessor:
+    def __init__(self, args, log=print, progress=None):
+        self.args = args
+        self.log = log
+        # Called with (creatures processed, creatures expected or None) after every creature
+        self.progress = progress
+        self.cancelled = threading.Event()
+        self.workers = max(1, getattr(args, 'workers', 1) or 1)
+        self.profiling = getattr(args, 'profile', False)
+        self.database_ready = False
+        self.pending_saves = []
+        # Manifest entries of the files being imported, keyed by str(file)
+        self.imports = {}
+        # Unchanged files and blocks kept only so a bundle export holds every creature, never saved
+        self.export_only = set()
+        # Opened on the first export, a directory or a single bundle file, see ExportTargets
+        self.export_target = None
+
+    def run(self):
+        if self.args.action in ("save", "both") and not self.prepare_database():
+            return False
+        if self.args.batch:
+            self.process_batch()
+        elif self.args.file:
+            self.process_single_file()
+        self.report_profile()
+        return True
+
+    def cancel(self):
+        """Stop after the creature being processed, safe to call from any thread."""
+        self.cancelled.set()
+
+    def prepare_database(self):
+        """Make sure the database exists and is current before saving anything to it."""
+        if not self.database_ready:
+            from Database.database import Database
+            database = Database()
+            if not database.is_database_valid():
+                self.log("Database is not initialized, run the application and initialize it first")
+                return False
+            database.verify_database_version()
+            database.disconnect()
+            self.database_ready = True
+        return True
+
+    def process_batch(self):
+        self.log("Processing files in {} with {} worker(s)".format(self.args.path, self.workers))
+        if self.split:
+            self.process_parsed(self.parse_blocks(self.select_changed_blocks(Path(self.args.path).glob("*.txt"))))
+            return
+        self.process_parsed(self.parse_files(self.select_changed_files(Path(self.args.path).glob("*.txt"))))
+
+    def process_single_file(self):
+        self.log("Processing file {}".format(self.args.file))
+        if self.split:
+            self.process_parsed(self.parse_blocks(self.select_changed_blocks([self.args.file])))
+            return
+        self.process_parsed(parse_file(file) for file in self.select_changed_files([self.args.file]))
+
+    @property
+    def split(self):
+        return getattr(self.args, 'split', False)
+
+    @property
+    def rewrites_bundle(self):
+        """Saving and exporting to a bundle, which would lose the creatures the manifest skips."""
+        return self.args.action == "both" and is_bundle(getattr(self.args, 'output', None) or EXPORT_DIRECTORY)
+
+    def process_files(self, file_list):
+        if self.args.action in ("save", "both") and not self.prepare_database():
+            return
+        files = self.select_changed_files(file_list)
+        self.process_parsed(self.parse_files(files), len(files))
+        self.report_profile()
+
+    def select_changed_files(self, files):
+        """Drop the files the manifest says were already saved unchanged, only when saving."""
+        if self.args.action not in ("save", "both"):
+            return list(files)
+
+        from Database.database import engine
+        from Database.manifest import load_manifest, check_file, record_imports
+        with engine.connect() as connection:
+            manifest = load_manifest(connection)
+        changed_files = []
+        touched = []
+        skipped = 0
+        for file in files:
+            entry, changed = check_file(file, manifest)
+            if changed:
+                self.imports[str(file)] = entry
+                changed_files.append(file)
+                continue
+            skipped += 1
+            if entry is not manifest[entry['path']]:
+                # Touched but identical content, just remember the new mtime
+                touched.append(entry)
+            if self.rewrites_bundle:
+                self.export_only.add(str(file))
+                changed_files.append(file)
+        if touched:
+            with engine.begin() as connection:
+                record_imports(connection, touched)
+        if self.rewrites_bundle:
+            self.log("Exporting {} unchanged file(s) without saving, {} new or changed".format(
+                skipped, len(changed_files) - skipped))
+        else:
+            self.log("Skipping {} unchanged file(s), {} new or changed".format(skipped, len(changed_files)))
+        return changed_files
+
+    def worker_pool(self):
+        worker_settings = (getattr(self.args, 'trace', 'off'), getattr(self.args, 'trace_file', None),
+                           not getattr(self.args, 'no_parse_cache', False), self.profiling)
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=configure_worker, initargs=worker_settings)
+
+    def split_documents(self, files):
+        """Yield (file, number, text) for every stat block in the documents, reading them lazily."""
+        for file in files:
+            if str(file) == STDIN_FILE:
+                blocks = split_stat_blocks(sys.stdin)
+                yield from ((file, number, text) for number, text in enumerate(blocks, 1))
+                continue
+            with open(file, encoding="utf-8") as document:
+                yield from ((file, number, text) for number, text in enumerate(split_stat_blocks(document), 1))
+
+    def select_changed_blocks(self, files):
+        """Yield (label, text) for the stat blocks to import, skipping unchanged ones when saving."""
+        saving = self.args.action in ("save", "both")
+        manifest = {}
+        if saving:
+            from Database.database import engine
+            from Database.manifest import load_manifest, check_block, block_path
+            with engine.connect() as connection:
+                manifest = load_manifest(connection)
+        skipped = 0
+        for file, number, text in self.split_documents(files):
+            label = "{}#{}".format(file, number)
+            # Blocks read from stdin have no stable identity, so they are always imported
+            if saving and str(file) != STDIN_FILE:
+                entry, changed = check_block(block_path(file, number), text, manifest)
+                if not changed:
+                    skipped += 1
+                    if not self.rewrites_bundle:
+                        continue
+                    self.export_only.add(label)
+                else:
+                    self.imports[label] = entry
+            yield label, text
+        if saving and self.rewrites_bundle:
+            self.log("Exported {} unchanged stat block(s) without saving".format(skipped))
+        elif saving:
+            self.log("Skipped {} unchanged stat block(s)".format(skipped))
+
+    def parse_blocks(self, blocks):
+        """Yield (label, creature) pairs in document order, never queueing more than SPLIT_QUEUE_SIZE blocks."""
+        if self.workers == 1:
+            for block in blocks:
+                yield parse_block(block)
+            return
+        parse = parse_block_profiled if self.profiling else parse_block
+        with self.worker_pool() as pool:
+            queued = deque()
+            for block in blocks:
+                queued.append(pool.submit(parse, block))
+                if len(queued) >= SPLIT_QUEUE_SIZE:
+                    yield self.merge_profile(queued.popleft().result())
+            while queued:
+                yield self.merge_profile(queued.popleft().result())
+
+    def parse_files(self, files):
+        """Yield (file, creature) pairs, in file order, parsing in a process pool when workers > 1."""
+        if self.workers == 1:
+            for file in files:
+                yield parse_file(file)
+        else:
+            parse = parse_file_profiled if self.profiling else parse_file
+            pool = self.worker_pool()
+            try:
+                yield from map(self.merge_profile, pool.map(parse, files, chunksize=WORKER_CHUNK_SIZE))
+            finally:
+                # When cancelled, drop the files not yet handed to a worker instead of parsing them
+                pool.shutdown(cancel_futures=True)
+
+    def merge_profile(self, result):
+        """Add the profile counters a profiled worker returned to ours and strip them from the result."""
+        if not self.profiling:
+            return result
+        label, creature, counters = result
+        get_default_profile().merge(counters)
+        return label, creature
+
+    def report_profile(self):
+        """Log the parser profile as a table and write it as JSON, then start counting afresh."""
+        if not self.profiling:
+            return
+        profile = get_default_profile()
+        for line in profile.table():
+            self.log(line)
+        profile_file = getattr(self.args, 'profile_file', None) or DEFAULT_PROFILE_FILE
+        try:
+            profile.write_json(profile_file)
+            self.log("Parser profile written to {}".format(profile_file))
+        except IOError as e:
+            self.log(f"Error writing to file: {e}")
+        profile.reset()
+
+    def process_parsed(self, parsed, expected=None):
+        processed = 0
+        try:
+            for file, creature in parsed:
+                self.process_creature(file, creature)
+                processed += 1
+                if self.progress is not None:
+                    self.progress(processed, expected)
+                if self.cancelled.is_set():
+                    self.log("Cancelled after {} creature(s)".format(processed))
+                    break
+        except Exception:
+            self.log("Stopped by an error after {} creature(s)".format(processed))
+            raise
+        finally:
+            parsed.close()
+            try:
+                # What was processed before a cancel or an error is still saved, with its manifest entries
+                self.flush_saves()
+            finally:
+                if self.export_target is not None:
+                    self.export_target.close()
+                    self.export_target = None
+
+    def process_creature(self, file, creature):
+        self.log(str(file))
+        creature.barn_type = self.args.type
+
+        if self.args.action in ("export", "both"):
+            self.export(creature)
+        if self.args.action in ("save", "both") and str(file) not in self.export_only:
+            self.save(file, creature)
+
+    def export(self, creature):
+        try:
+            if self.export_target is None:
+                self.export_target = open_export_target(getattr(self.args, 'output', None) or EXPORT_DIRECTORY)
+            self.log(self.export_target.write(creature))
+        except IOError as e:
+            self.log(f"Error writing to file: {e}")
+        except ExportError as e:
+            # A creature that cannot be exported is still saved, and the batch goes on
+            self.log("Could not export: {}".format(e))
+
+    def save(self, file, creature):
+        self.pending_saves.append((file, creature))
+        if len(self.pending_saves) >= SAVE_CHUNK_SIZE:
+            self.flush_saves()
+
+    def flush_saves(self):
+        """Replace the previous creatures of the pending files and record them in the manifest, all or nothing."""
+        if self.pending_saves:
+            from Database.database import engine
+            from Database.bulk import bulk_save_creatures, bulk_delete_creatures
+            from Database.manifest import record_imports
+            entries = [self.imports.pop(str(file), None) for file, creature in self.pending_saves]
+            replaced = [entry['creature_id'] for entry in entries if entry and entry['creature_id'] is not None]
+            with engine.begin() as connection:
+                bulk_delete_creatures(replaced, connection)
+                creature_ids = bulk_save_creatures([creature for file, creature in self.pending_saves], connection)
+                for entry, creature_id in zip(entries, creature_ids):
+                    if entry:
+                        entry['creature_id'] = creature_id
+                record_imports(connection, [entry for entry in entries if entry])
+            self.log("Saved {} creature(s), replacing {}".format(len(self.pending_saves), len(replaced)))
+            self.pending_saves = []
@@ -0,0 +1,264 @@
+"""
+Benchmark the parser and the database at 1k/10k/100k creature scale.
+
+For every scale a synthetic corpus (Benchmarks/corpus_generator.py) is parsed,
+bulk saved into a fresh scratch database, paged the way CreatureList pages it,
+searched, and exported to a JSONL bundle.  Startup is timed once per run by
+launching fresh interpreters: main.py --version, a headless single file export,
+importing the main window, and the database check the main window runs.  The
+numbers are printed and written to a JSON file, and --compare prints the ratios
+against an earlier results file so regressions show up between versions.
+
+    python -m Benchmarks.benchmark_suite [-n 1k 10k 100k] [-o results.json] [--compare old.json]
+
+The corpus is generated and parsed in chunks, only the chunk being worked on
+is held in memory, and only the parse calls themselves are timed.
+"""
+import argparse
+import json
+import platform
+import statistics
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from sqlalchemy import create_engine, event, func
+from sqlalchemy.orm import Session
+from Benchmarks.corpus_generator import CorpusGenerator, DEFAULT_SEED
+from Benchmarks.parser_benchmark import count_lines
+from Database.bulk import bulk_save_creatures
+from Database.config import apply_pragmas, ENV_PREFIX
+from Database.database import Base, DATABASE_SETTINGS, DATABASE_VERSION, DATABASE_NAME
+from Database.models import Creature
+from Database.search import create_search_index, search_creatures
+from Exporters.DatabaseExporter import stream_creatures
+from Exporters.ExportTargets import JsonLinesTarget
+from Parsers.CreatureParser import ParseCreature
+from Parsers.ParseCache import PARSER_VERSION
+
+SCALES = {'1k': 1000, '10k': 10000, '100k': 100000}
+DEFAULT_SCALES = ['1k', '10k']
+DEFAULT_RESULTS_FILE = 'benchmark_results.json'
+# Stat blocks generated, parsed and saved together
+CHUNK_SIZE = 1000
+# Latency measurements keep the median of this many runs
+LATENCY_RUNS = 5
+LIST_PAGE_SIZE = 200
+SEARCH_TERMS = ('cleric', 'dagger', 'fire', 'sneak attack')
+BARN_TYPES = ('Creature', 'NPC')
+# Interpreter arguments timed by benchmark_startup, run from the repository root.  startup_python_ms
+# is the bare interpreter, the floor under all the others.
+STARTUP_COMMANDS = {
+    'startup_python_ms': ['-c', 'pass'],
+    'startup_version_ms': ['main.py', '--version'],
+    'startup_headless_export_ms': ['main.py', '-f', '{stat_block}', '-o', '{output}', '--no-parse-cache'],
+    'startup_gui_import_ms': ['-c', 'import ttkthemes, Forms.barn'],
+    'startup_database_check_ms': ['-c', 'from Database.schema import Database; Database().is_database_valid()'],
+}
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+
+def scale_count(scale):
+    return SCALES[scale] if scale in SCALES else int(scale)
+
+
+def median_ms(function, runs=LATENCY_RUNS):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return round(statistics.median(timings) * 1000, 3)
+
+
+def scratch_engine(database_path):
+    """An engine on an empty database with every table and the search index, tuned like the real one."""
+    engine = create_engine("sqlite:///" + str(database_path))
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, DATABASE_SETTINGS)
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        create_search_index(connection)
+    return engine
+
+
+def benchmark_parse_and_save(engine, count, seed):
+    generator = CorpusGenerator(seed=seed)
+    lines = 0
+    parse_seconds = 0.0
+    save_seconds = 0.0
+    for start in range(1, count + 1, CHUNK_SIZE):
+        corpus = list(generator.stat_blocks(min(CHUNK_SIZE, count - start + 1), start))
+        lines += count_lines(corpus)
+
+        parse_start = time.perf_counter()
+        creatures = []
+        for raw in corpus:
+            creature_parser = ParseCreature(raw)
+            creature_parser.run()
+            creatures.append(creature_parser.creature)
+        parse_seconds += time.perf_counter() - parse_start
+
+        for index, creature in enumerate(creatures):
+            creature.barn_type = BARN_TYPES[index % len(BARN_TYPES)]
+        save_start = time.perf_counter()
+        with engine.begin() as connection:
+            bulk_save_creatures(creatures, connection)
+        save_seconds += time.perf_counter() - save_start
+
+    return {
+        'parse_seconds': round(parse_seconds, 3),
+        'parse_lines_per_second': round(lines / parse_seconds),
+        'parse_creatures_per_second': round(count / parse_seconds, 1),
+        'save_seconds': round(save_seconds, 3),
+        'save_creatures_per_second': round(count / save_seconds, 1),
+    }
+
+
+def benchmark_list_load(engine):
+    """Latency of the queries CreatureList runs: the row count, a page at the start, middle and end, and a filtered page."""
+    with Session(engine) as session:
+        barn_type = BARN_TYPES[0]
+        total = session.query(func.count(Creature.id)).filter(Creature.barn_type == barn_type).scalar()
+
+        def page(offset):
+            return session.query(Creature.id, Creature.formal_name, Creature.challenge_rating) \
+                .filter(Creature.barn_type == barn_type) \
+                .order_by(Creature.formal_name, Creature.id) \
+                .offset(offset).limit(LIST_PAGE_SIZE).all()
+
+        def filtered_page():
+            return session.query(Creature.id, Creature.formal_name, Creature.challenge_rating) \
+                .filter(Creature.barn_type == barn_type) \
+                .filter(Creature.challenge_rating_value.between(1, 5), Creature.armor_class_value >= 15) \
+                .order_by(Creature.challenge_rating_value, Creature.formal_name, Creature.id) \
+                .limit(LIST_PAGE_SIZE).all()
+
+        return {
+            'list_count_ms': median_ms(
+                lambda: session.query(func.count(Creature.id)).filter(Creature.barn_type == barn_type).scalar()),
+            'list_first_page_ms': median_ms(lambda: page(0)),
+            'list_middle_page_ms': median_ms(lambda: page(total // 2)),
+            'list_last_page_ms': median_ms(lambda: page(max(0, total - LIST_PAGE_SIZE))),
+            'list_filtered_page_ms': median_ms(filtered_page),
+            'search_ms': median_ms(lambda: [search_creatures(session, term) for term in SEARCH_TERMS]),
+        }
+
+
+def benchmark_export(engine, count, work_dir):
+    target = JsonLinesTarget(Path(work_dir) / "export.jsonl")
+    start = time.perf_counter()
+    with engine.connect() as connection:
+        for creature in stream_creatures(connection):
+            target.write(creature)
+    target.close()
+    seconds = time.perf_counter() - start
+    return {
+        'export_seconds': round(seconds, 3),
+        'export_creatures_per_second': round(count / seconds, 1),
+    }
+
+
+def benchmark_startup(seed):
+    """Median wall time of each STARTUP_COMMANDS entry in a fresh interpreter, against an initialized scratch database."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        stat_block = Path(work_dir) / "stat_block.txt"
+        stat_block.write_text(next(CorpusGenerator(seed=seed).stat_blocks(1)), encoding="utf-8")
+        values = {'stat_block': str(stat_block), 'output': str(Path(work_dir) / "output")}
+        environment = dict(os.environ)
+        environment[ENV_PREFIX + 'DATABASE_NAME'] = str(Path(work_dir) / Path(DATABASE_NAME).name)
+
+        def launch(arguments):
+            subprocess.run([sys.executable] + arguments, cwd=REPOSITORY_ROOT, env=environment, check=True,
+                           stdout=subprocess.DEVNULL)
+
+        launch(['-c', 'from Database.create_tables import initialize_repository; initialize_repository(True)'])
+        return {name: median_ms(lambda: launch([argument.format(**values) for argument in arguments]))
+                for name, arguments in STARTUP_COMMANDS.items()}
+
+
+def run_scale(count, seed):
+    with tempfile.TemporaryDirectory() as work_dir:
+        engine = scratch_engine(Path(work_dir) / "benchmark.db")
+        try:
+            results = {'creatures': count}
+            results.update(benchmark_parse_and_save(engine, count, seed))
+            results.update(benchmark_list_load(engine))
+            results.update(benchmark_export(engine, count, work_dir))
+        finally:
+            engine.dispose()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print every metric next to the baseline run and the new/old ratio."""
+    print("Compared with {} ({})".format(baseline.get('git_commit'), baseline.get('timestamp')))
+    sections = dict(results['scales'], startup=results.get('startup', {}))
+    old_sections = dict(baseline.get('scales', {}), startup=baseline.get('startup', {}))
+    for scale, metrics in sections.items():
+        old_metrics = old_sections.get(scale)
+        if not old_metrics:
+            continue
+        for name, value in metrics.items():
+            old_value = old_metrics.get(name)
+            if name == 'creatures' or not old_value:
+                continue
+            print("{:>7} {:<28} {:>14} {:>14} {:>7.2f}x".format(scale, name, old_value, value, value / old_value))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark parsing, saving, list loading and exporting")
+    arg_parser.add_argument("-n", "--scales", nargs="+", default=DEFAULT_SCALES,
+                            help="Corpus sizes: 1k, 10k, 100k or a number, defaults to 1k 10k")
+    arg_parser.add_argument("-o", "--output", default=DEFAULT_RESULTS_FILE,
+                            help="JSON file the results are written to, defaults to benchmark_results.json")
+    arg_parser.add_argument("-s", "--seed", type=int, default=DEFAULT_SEED, help="Corpus random seed, defaults to 1")
+    arg_parser.add_argument("--compare", help="Earlier results file to compare with")
+    args = arg_parser.parse_args()
+
+    results = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parser_version': PARSER_VERSION,
+        'database_version': DATABASE_VERSION,
+        'seed': args.seed,
+        'scales': {},
+    }
+    print("Benchmarking startup")
+    results['startup'] = benchmark_startup(args.seed)
+    for name, value in results['startup'].items():
+        print("  {:<28} {}".format(name, value))
+
+    for scale in args.scales:
+        count = scale_count(scale)
+        print("Benchmarking {} creatures".format(count))
+        metrics = run_scale(count, args.seed)
+        results['scales'][str(count)] = metrics
+        for name, value in metrics.items():
+            print("  {:<28} {}".format(name, value))
+
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print("Results written to {}".format(args.output))
+
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
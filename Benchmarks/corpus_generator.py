@@ -0,0 +1,155 @@
+"""
+Generate synthetic stat blocks from the samples, for benchmarks at scale.
+
+Every generated block starts from a randomly chosen sample in samples/Creatures
+or samples/NPCs (samples/test uses a different layout) and keeps its layout,
+but gets a unique name and a fresh draw of feats, gear, spells and special
+abilities from the pools collected across all the samples, so the parser and
+the database see realistic and varied input.  The same seed always produces
+the same corpus.
+
+    python -m Benchmarks.corpus_generator -n 10000 -o corpus/10k [-s SEED] [-p SAMPLES]
+"""
+import argparse
+import random
+import re
+from pathlib import Path
+
+DEFAULT_SAMPLE_DIRECTORIES = ("samples/Creatures", "samples/NPCs")
+DEFAULT_SEED = 1
+
+RE_HEADER = re.compile(r"^(.+?)(\s*\(?CR\s+[\d/]+\)?.*)$")
+RE_FEATS = re.compile(r"^(Feats )(.+)$")
+RE_GEAR = re.compile(r"((?:Combat |Other )?Gear )([^;]+)")
+RE_SPELL_LIST = re.compile(r"^((?:\d+(?:st|nd|rd|th)|0|At will|Constant|\d+/day)[^—]*—\s*)(.+)$")
+RE_SPECIAL_ABILITY = re.compile(r"^(.+) \((?:Ex|Su|Sp)\)$")
+
+
+def split_list(text):
+    """Split a comma separated list, ignoring the commas inside parentheses."""
+    items = []
+    depth = 0
+    current = []
+    for character in text:
+        if character == '(':
+            depth += 1
+        elif character == ')':
+            depth = max(0, depth - 1)
+        if character == ',' and depth == 0:
+            items.append("".join(current).strip())
+            current = []
+        else:
+            current.append(character)
+    items.append("".join(current).strip())
+    return [item for item in items if item]
+
+
+class CorpusGenerator:
+    def __init__(self, sample_directories=DEFAULT_SAMPLE_DIRECTORIES, seed=DEFAULT_SEED):
+        self.random = random.Random(seed)
+        self.templates = []
+        self.feats = set()
+        self.gear = set()
+        self.spells = set()
+        self.special_abilities = {}
+        for directory in sample_directories:
+            for file in sorted(Path(directory).glob("*.txt")):
+                self.add_sample(file.read_text(encoding="utf-8"))
+        self.feats = sorted(self.feats)
+        self.gear = sorted(self.gear)
+        self.spells = sorted(self.spells)
+        self.special_abilities = sorted(self.special_abilities.items())
+        if not self.templates:
+            raise ValueError("No stat blocks found in {}".format(", ".join(sample_directories)))
+
+    def add_sample(self, raw):
+        lines = raw.replace("\r\n", "\n").split("\n")
+        self.templates.append(lines)
+        text_lines = [line for line in lines if line.strip()]
+        for index, line in enumerate(text_lines):
+            feats = RE_FEATS.match(line)
+            if feats:
+                self.feats.update(split_list(feats.group(2)))
+            for gear in RE_GEAR.finditer(line):
+                self.gear.update(split_list(gear.group(2)))
+            spells = RE_SPELL_LIST.match(line)
+            if spells:
+                self.spells.update(split_list(spells.group(2)))
+            if RE_SPECIAL_ABILITY.match(line) and index + 1 < len(text_lines):
+                self.special_abilities[line] = text_lines[index + 1]
+
+    def draw(self, pool, like):
+        """A random selection from pool about as long as the list it replaces."""
+        count = max(1, min(len(pool), len(like) + self.random.randint(-1, 2)))
+        return ", ".join(self.random.sample(pool, count))
+
+    def generate(self, serial):
+        """Return the text of one synthetic stat block."""
+        template = self.random.choice(self.templates)
+        suffix = " {}".format(serial)
+        lines = []
+        named = False
+        replace_description = False
+        for line in template:
+            if not line.strip():
+                lines.append(line)
+                continue
+            if replace_description:
+                lines.append(replace_description)
+                replace_description = False
+                continue
+            if not named:
+                lines.append(line + suffix)
+                named = True
+                continue
+            lines.append(self.vary(line, suffix))
+            if RE_SPECIAL_ABILITY.match(line) and self.special_abilities:
+                header, description = self.random.choice(self.special_abilities)
+                lines[-1] = header
+                replace_description = description
+        return "\n".join(lines)
+
+    def vary(self, line, suffix):
+        header = RE_HEADER.match(line)
+        if header and "XP" not in line and len(line) < 80:
+            return header.group(1) + suffix + header.group(2)
+        feats = RE_FEATS.match(line)
+        if feats and self.feats:
+            return feats.group(1) + self.draw(self.feats, split_list(feats.group(2)))
+        spells = RE_SPELL_LIST.match(line)
+        if spells and self.spells:
+            return spells.group(1) + self.draw(self.spells, split_list(spells.group(2)))
+        if RE_GEAR.search(line) and self.gear:
+            return RE_GEAR.sub(lambda gear: gear.group(1) + self.draw(self.gear, split_list(gear.group(2))), line)
+        return line
+
+    def stat_blocks(self, count, start=1):
+        """Yield count stat block texts."""
+        for serial in range(start, start + count):
+            yield self.generate(serial)
+
+
+def write_corpus(output_dir, count, seed=DEFAULT_SEED, sample_directories=DEFAULT_SAMPLE_DIRECTORIES):
+    """Write count synthetic stat blocks to output_dir, one .txt file each, and return the directory."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    generator = CorpusGenerator(sample_directories, seed)
+    for serial, text in enumerate(generator.stat_blocks(count), 1):
+        (output_dir / "synthetic_{:06d}.txt".format(serial)).write_text(text, encoding="utf-8")
+    return output_dir
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Generate synthetic stat blocks from the samples")
+    arg_parser.add_argument("-n", "--count", type=int, default=1000, help="Stat blocks to generate, defaults to 1000")
+    arg_parser.add_argument("-o", "--output", required=True, help="Directory the .txt files are written to")
+    arg_parser.add_argument("-s", "--seed", type=int, default=DEFAULT_SEED, help="Random seed, defaults to 1")
+    arg_parser.add_argument("-p", "--path", nargs="+", default=list(DEFAULT_SAMPLE_DIRECTORIES),
+                            help="Sample directories the templates and pools come from")
+    args = arg_parser.parse_args()
+    write_corpus(args.output, args.count, args.seed, args.path)
+    print("Wrote {} stat blocks to {}".format(args.count, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare the per line cost of the ParseCreature FSM dispatch.
+
+Runs every stat block in samples/ through the state indexed dispatch used by
+ParseCreature and through the original linear scan of FSM_MAP, and reports
+the average time spent per input line for each.  The "dispatch" rows skip the
+transition callbacks and tracing so only the transition lookup is measured,
+the "full parse" rows are a complete ParseCreature.run().
+
+    python -m Benchmarks.parser_benchmark [-r REPEAT] [-p SAMPLES]
+"""
+import argparse
+import contextlib
+import io
+import time
+from pathlib import Path
+from Parsers.CreatureParser import ParseCreature, FSM_MAP
+
+
+class LinearScanParseCreature(ParseCreature):
+    """ParseCreature with the original dispatch that scans all of FSM_MAP for every line."""
+
+    def process_next(self, line):
+        self.current_line = line
+        frozen_state = self.current_state
+        for transition in FSM_MAP:
+            if transition['src'] == frozen_state:
+                if transition['condition_re_compiled'].match(line):
+                    self.update_state(transition['dst'], transition['callback'])
+                    return True
+        return False
+
+
+class DispatchOnly:
+    """Mixin that only moves the FSM to the new state, the callbacks and tracing are skipped."""
+
+    def update_state(self, new_state, callback):
+        self.current_state = new_state
+
+
+class DispatchOnlyParseCreature(DispatchOnly, ParseCreature):
+    pass
+
+
+class DispatchOnlyLinearScanParseCreature(DispatchOnly, LinearScanParseCreature):
+    pass
+
+
+def load_corpus(samples_path):
+    return [file.read_text(encoding="utf-8") for file in sorted(Path(samples_path).glob("**/*.txt"))]
+
+
+def count_lines(corpus):
+    return sum(len([line for line in raw.replace("\r\n", "\n").split("\n") if line]) + 1 for raw in corpus)
+
+
+def time_parser(parser_class, corpus, repeat):
+    """Return the best wall time of `repeat` passes over the corpus."""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for raw in corpus:
+                parser_class(raw).run()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark the ParseCreature FSM dispatch")
+    arg_parser.add_argument("-r", "--repeat", type=int, default=5, help="Passes over the corpus, best is kept")
+    arg_parser.add_argument("-p", "--path", default="samples", help="Directory of stat blocks, defaults to samples")
+    args = arg_parser.parse_args()
+
+    corpus = load_corpus(args.path)
+    lines = count_lines(corpus)
+    print("{} stat blocks, {} lines, best of {}".format(len(corpus), lines, args.repeat))
+
+    for mode, linear_class, indexed_class in (
+            ("dispatch", DispatchOnlyLinearScanParseCreature, DispatchOnlyParseCreature),
+            ("full parse", LinearScanParseCreature, ParseCreature)):
+        results = {}
+        for name, parser_class in (("linear scan", linear_class), ("state indexed", indexed_class)):
+            elapsed = time_parser(parser_class, corpus, args.repeat)
+            results[name] = elapsed
+            print("{:<11} {:<14} {:8.2f} ms total {:8.2f} us/line".format(
+                mode, name, elapsed * 1000, elapsed / lines * 1e6))
+        print("{:<11} speedup {:.2f}x".format(mode, results["linear scan"] / results["state indexed"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# bulk.py
+# Bulk persistence of parsed creatures
+#
+# The ORM path (session.add + commit) emits one INSERT per creature and one per child row.
+# bulk_save_creatures writes a whole batch in a single transaction with one executemany
+# INSERT for the creatures and one per child table, then adds the batch to the search index.
+# bulk_delete_creatures removes creatures, their children and their search rows the same way.
+from sqlalchemy import insert, delete
+from Database.database import engine
+from Database.models import Creature
+from Database.search import reindex_creatures
+
+CREATURE_COLUMNS = [column.key for column in Creature.__table__.columns if column.key != 'id']
+
+# (relationship name, child table, child column names) for every one-to-many relationship on Creature
+CHILD_TABLES = [
+    (relationship.key, relationship.mapper.local_table,
+     [column.key for column in relationship.mapper.local_table.columns if column.key not in ('id', 'creature_id')])
+    for relationship in Creature.__mapper__.relationships
+]
+
+
+def bulk_save_creatures(creatures, connection=None):
+    """Insert a batch of new, unsaved creatures and all their children, returning the new creature ids.
+
+    When no connection is given the batch gets its own transaction, otherwise the caller's
+    connection and transaction are used.
+    """
+    if not creatures:
+        return []
+    if connection is None:
+        with engine.begin() as connection:
+            return bulk_save_creatures(creatures, connection)
+
+    creature_rows = [{key: getattr(creature, key) for key in CREATURE_COLUMNS} for creature in creatures]
+    result = connection.execute(
+        insert(Creature.__table__).returning(Creature.__table__.c.id, sort_by_parameter_order=True),
+        creature_rows)
+    creature_ids = [row.id for row in result]
+
+    for relationship_name, child_table, child_columns in CHILD_TABLES:
+        child_rows = []
+        for creature, creature_id in zip(creatures, creature_ids):
+            for child in getattr(creature, relationship_name):
+                child_row = {key: getattr(child, key) for key in child_columns}
+                child_row['creature_id'] = creature_id
+                child_rows.append(child_row)
+        if child_rows:
+            connection.execute(insert(child_table), child_rows)
+
+    reindex_creatures(connection, creature_ids)
+    return creature_ids
+
+
+# Stay well under SQLite's limit on bound parameters
+DELETE_CHUNK_SIZE = 500
+
+
+def bulk_delete_creatures(creature_ids, connection=None):
+    """Delete creatures, all their children and their search index rows."""
+    creature_ids = list(creature_ids)
+    if not creature_ids:
+        return
+    if connection is None:
+        with engine.begin() as connection:
+            return bulk_delete_creatures(creature_ids, connection)
+
+    for start in range(0, len(creature_ids), DELETE_CHUNK_SIZE):
+        chunk = creature_ids[start:start + DELETE_CHUNK_SIZE]
+        for relationship_name, child_table, child_columns in CHILD_TABLES:
+            connection.execute(delete(child_table).where(child_table.c.creature_id.in_(chunk)))
+        connection.execute(delete(Creature.__table__).where(Creature.__table__.c.id.in_(chunk)))
+        reindex_creatures(connection, chunk)
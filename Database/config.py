@@ -0,0 +1,102 @@
+# config.py
+# Database engine settings
+#
+# Settings are resolved in this order, later ones win:
+#   1. the selected profile ("production" unless CREATURE_BARN_PROFILE or the config file says otherwise)
+#   2. the [database] section of creature_barn.ini (or the file named by CREATURE_BARN_CONFIG)
+#   3. CREATURE_BARN_<SETTING> environment variables, e.g. CREATURE_BARN_ECHO=1
+import configparser
+import os
+
+CONFIG_FILE_ENV = 'CREATURE_BARN_CONFIG'
+DEFAULT_CONFIG_FILE = 'creature_barn.ini'
+ENV_PREFIX = 'CREATURE_BARN_'
+DEFAULT_PROFILE = 'production'
+
+PROFILES = {
+    'production': {
+        'database_name': 'creature_barn.db',
+        'echo': False,
+        'pool_size': 5,
+        'max_overflow': 10,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,       # negative is KiB, so 64 MiB of page cache
+        'mmap_size': 268435456,     # 256 MiB
+    },
+    'debug': {
+        'database_name': 'creature_barn.db',
+        'echo': True,
+        'pool_size': 5,
+        'max_overflow': 10,
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'cache_size': -2000,
+        'mmap_size': 0,
+    },
+}
+
+JOURNAL_MODES = ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')
+SYNCHRONOUS_MODES = ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _to_choice(choices):
+    def convert(value):
+        value = str(value).strip().upper()
+        if value not in choices:
+            raise ValueError("{} is not one of {}".format(value, ", ".join(choices)))
+        return value
+    return convert
+
+
+CONVERTERS = {
+    'database_name': str,
+    'echo': _to_bool,
+    'pool_size': int,
+    'max_overflow': int,
+    'journal_mode': _to_choice(JOURNAL_MODES),
+    'synchronous': _to_choice(SYNCHRONOUS_MODES),
+    'cache_size': int,
+    'mmap_size': int,
+}
+
+
+def load_settings(environ=None):
+    """Return the engine settings dictionary for the current environment and config file."""
+    environ = os.environ if environ is None else environ
+
+    file_settings = {}
+    parser = configparser.ConfigParser()
+    parser.read(environ.get(CONFIG_FILE_ENV, DEFAULT_CONFIG_FILE))
+    if parser.has_section('database'):
+        file_settings = dict(parser.items('database'))
+
+    profile = environ.get(ENV_PREFIX + 'PROFILE', file_settings.pop('profile', DEFAULT_PROFILE)).lower()
+    if profile not in PROFILES:
+        raise ValueError("Unknown database profile {}, expected one of {}".format(profile, ", ".join(PROFILES)))
+
+    settings = dict(PROFILES[profile])
+    settings['profile'] = profile
+    for key, converter in CONVERTERS.items():
+        if key in file_settings:
+            settings[key] = converter(file_settings[key])
+        env_key = ENV_PREFIX + key.upper()
+        if env_key in environ:
+            settings[key] = converter(environ[env_key])
+    return settings
+
+
+def apply_pragmas(dbapi_connection, settings):
+    """Apply the SQLite pragmas from the settings to a raw sqlite3 connection."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode={}".format(settings['journal_mode']))
+    cursor.execute("PRAGMA synchronous={}".format(settings['synchronous']))
+    cursor.execute("PRAGMA cache_size={}".format(int(settings['cache_size'])))
+    cursor.execute("PRAGMA mmap_size={}".format(int(settings['mmap_size'])))
+    cursor.close()
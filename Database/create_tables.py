@@ -5,15 +5,22 @@ from Database.models import Creature, CreatureLanguages, CreatureFeats, Creature
     CreatureACModifiers, CreatureWeaknesses, CreatureImmuneModifiers, CreatureSpellResistenceModifiers, \
     CreatureSpellLikeAbilities, CreatureKnownSpells, CreaturePreparedSpells, CreatureSpeedModifiers, \
     CreatureMeleeAttacks, CreatureRangedAttacks, CreatureSpecialQualities, CreatureSpecialAttacks, \
-    CreatureDefenseAbilities, CreatureSpecialAbilities, CreatureGearItems
+    CreatureDefenseAbilities, CreatureSpecialAbilities, CreatureGearItems, \
+    ImportManifest
+from Database.search import create_search_index, DROP_SEARCH_TABLE
+from sqlalchemy import text
 
 def create_tables():
     """Create all tables defined in models."""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        create_search_index(connection)
     print("Tables created successfully")
 
 def drop_tables():
     """Drop all tables (use with caution!)."""
+    with engine.begin() as connection:
+        connection.execute(text(DROP_SEARCH_TABLE))
     Base.metadata.drop_all(bind=engine)
     print("Tables dropped")
 
@@ -0,0 +1,201 @@
+# encounters.py
+# Build encounters that fit an XP budget
+#
+# The budget follows the Pathfinder encounter rules: the party's average level, adjusted for
+# party size and difficulty, gives the encounter CR, and the XP for that CR is the budget.
+#
+# Candidates are never loaded one by one.  One GROUP BY query over the CR/XP index counts the
+# creatures matching the filters for every (CR, XP) pair, a barn has a few dozen of those
+# however many creatures it holds.  The knapsack is solved over those XP values, and only then
+# is a random creature picked for every slot with an indexed seek into its (CR, XP) group.
+#
+# Environments are free text in the stat blocks, such as "Temperate or cold hills", so they are
+# matched whole, ignoring case, through their own index.  find_environments lists the ones the
+# barn holds to choose from.
+import random
+from sqlalchemy import func
+from Database.models import Creature
+
+BARN_TYPES = ('Creature', 'NPC')
+
+# Encounter CR relative to the average party level
+DIFFICULTIES = {'Easy': -1, 'Average': 0, 'Challenging': 1, 'Hard': 2, 'Epic': 3}
+DEFAULT_DIFFICULTY = 'Challenging'
+
+# XP awarded for CR 1 to 30
+XP_BY_CHALLENGE_RATING = [
+    400, 600, 800, 1200, 1600, 2400, 3200, 4800, 6400, 9600,
+    12800, 19200, 25600, 38400, 51200, 76800, 102400, 153600, 204800, 307200,
+    409600, 614400, 819200, 1228800, 1638400, 2457600, 3276800, 4915200, 6553600, 9830400,
+]
+# XP for CR 0, -1, -2, ... meaning CR 1/2, 1/3, 1/4, 1/6 and 1/8 and below
+XP_BELOW_CHALLENGE_RATING_1 = [200, 135, 100, 65, 50]
+
+DEFAULT_MAX_CREATURES = 6
+# How far the total XP may be from the budget, as a fraction of it
+DEFAULT_TOLERANCE = 0.1
+# Knapsack states kept per creature count, sums closer than the budget resolution are merged
+SOLVER_RESOLUTION = 40
+
+
+def experience_for_challenge_rating(challenge_rating):
+    if challenge_rating >= 1:
+        return XP_BY_CHALLENGE_RATING[min(challenge_rating, len(XP_BY_CHALLENGE_RATING)) - 1]
+    return XP_BELOW_CHALLENGE_RATING_1[min(-challenge_rating, len(XP_BELOW_CHALLENGE_RATING_1) - 1)]
+
+
+def encounter_budget(party_size, party_level, difficulty=DEFAULT_DIFFICULTY):
+    """XP budget of an encounter for a party of party_size characters of average level party_level."""
+    challenge_rating = party_level + DIFFICULTIES[difficulty]
+    if party_size >= 6:
+        challenge_rating += 1
+    elif party_size <= 3:
+        challenge_rating -= 1
+    return experience_for_challenge_rating(challenge_rating)
+
+
+class EncounterFilter:
+    """Which creatures an encounter may use, every criterion left as None matches everything."""
+
+    def __init__(self, environment=None, creature_type=None, min_challenge_rating=None, max_challenge_rating=None,
+                 barn_types=BARN_TYPES):
+        self.environment = environment
+        self.creature_type = creature_type
+        self.min_challenge_rating = min_challenge_rating
+        self.max_challenge_rating = max_challenge_rating
+        self.barn_types = barn_types
+
+    def conditions(self):
+        # barn_type IN and the CR range use ix_creatures_barn_type_challenge_rating_experience,
+        # a type uses ix_creatures_type_challenge_rating and an environment
+        # ix_creatures_environment_challenge_rating
+        conditions = [Creature.barn_type.in_(self.barn_types), Creature.experience_points_value > 0]
+        if self.min_challenge_rating is not None:
+            conditions.append(Creature.challenge_rating_value >= self.min_challenge_rating)
+        if self.max_challenge_rating is not None:
+            conditions.append(Creature.challenge_rating_value <= self.max_challenge_rating)
+        if self.creature_type:
+            conditions.append(Creature.type.collate('NOCASE') == self.creature_type)
+        if self.environment:
+            conditions.append(Creature.environment.collate('NOCASE') == self.environment)
+        return conditions
+
+
+class EncounterGroup:
+    """The creatures passing a filter that share a CR and an XP value."""
+
+    def __init__(self, challenge_rating_value, experience_points, count):
+        self.challenge_rating_value = challenge_rating_value
+        self.experience_points = experience_points
+        self.count = count
+
+
+class Encounter:
+    def __init__(self, budget, creatures):
+        self.budget = budget
+        # (id, formal_name, challenge_rating, experience_points_value) rows, one per creature in the encounter
+        self.creatures = creatures
+
+    @property
+    def total_experience(self):
+        return sum(creature.experience_points_value for creature in self.creatures)
+
+
+def find_environments(session):
+    """The environments of the creatures in the barn, in order and ignoring case, read from their index."""
+    environment = Creature.environment.collate('NOCASE')
+    return [value for value, in session.query(environment).filter(environment != '').distinct().order_by(environment)]
+
+
+def find_encounter_groups(session, encounter_filter):
+    rows = session.query(Creature.challenge_rating_value, Creature.experience_points_value, func.count(Creature.id)) \
+        .filter(*encounter_filter.conditions()) \
+        .group_by(Creature.challenge_rating_value, Creature.experience_points_value)
+    return [EncounterGroup(challenge_rating_value, experience_points, count)
+            for challenge_rating_value, experience_points, count in rows]
+
+
+def solve_budget(experience_values, budget, min_creatures=1, max_creatures=DEFAULT_MAX_CREATURES,
+                 tolerance=DEFAULT_TOLERANCE, rng=random):
+    """
+    Choose between min_creatures and max_creatures XP values, repeats allowed, totalling about budget.
+
+    A knapsack by creature count: every layer holds the totals reachable with one more creature,
+    at most SOLVER_RESOLUTION per creature allowed, so the cost does not grow with the budget.
+    Totals within tolerance of the budget are picked at random, so each call can give a different
+    answer; when there is none the total closest to the budget is used.  Returns the XP values,
+    an empty list if nothing fits at all.
+    """
+    limit = budget * (1 + tolerance)
+    values = sorted({value for value in experience_values if 0 < value <= limit})
+    if not values:
+        return []
+    resolution = max(1.0, limit / (SOLVER_RESOLUTION * max_creatures))
+
+    # Each layer maps a rounded total to (total, key in the previous layer, value added)
+    layers = [{0: (0, None, None)}]
+    for count in range(1, max_creatures + 1):
+        layer = {}
+        for key, (total, parent_key, parent_value) in layers[-1].items():
+            for value in rng.sample(values, len(values)):
+                new_total = total + value
+                if new_total > limit:
+                    continue
+                layer.setdefault(round(new_total / resolution), (new_total, key, value))
+        if not layer:
+            break
+        layers.append(layer)
+
+    candidates = [(count, key, total)
+                  for count in range(max(1, min_creatures), len(layers))
+                  for key, (total, parent_key, value) in layers[count].items()]
+    if not candidates:
+        return []
+    in_budget = {}
+    for candidate in candidates:
+        if abs(candidate[2] - budget) <= budget * tolerance:
+            in_budget.setdefault(candidate[0], []).append(candidate)
+    if in_budget:
+        # Creature count first, there are many more totals with more creatures
+        count, key, total = rng.choice(in_budget[rng.choice(list(in_budget))])
+    else:
+        count, key, total = min(candidates, key=lambda candidate: abs(candidate[2] - budget))
+
+    chosen = []
+    while count > 0:
+        total, key, value = layers[count][key]
+        chosen.append(value)
+        count -= 1
+    return chosen
+
+
+def pick_creature_id(session, encounter_filter, group, rng=random):
+    """The id of a random creature from a group, found by offset within its (CR, XP) range of the index."""
+    # Any stable order will do, leaving it to the index keeps the offset scan inside the index
+    return session.query(Creature.id) \
+        .filter(*encounter_filter.conditions()) \
+        .filter(Creature.challenge_rating_value == group.challenge_rating_value,
+                Creature.experience_points_value == group.experience_points) \
+        .offset(rng.randrange(group.count)).limit(1).scalar()
+
+
+def build_encounter(session, budget, encounter_filter=None, min_creatures=1, max_creatures=DEFAULT_MAX_CREATURES,
+                    tolerance=DEFAULT_TOLERANCE, rng=random):
+    """Return an Encounter of creatures passing encounter_filter with about budget XP in total."""
+    encounter_filter = encounter_filter or EncounterFilter()
+    groups_by_experience = {}
+    for group in find_encounter_groups(session, encounter_filter):
+        groups_by_experience.setdefault(group.experience_points, []).append(group)
+
+    creature_ids = []
+    for experience in solve_budget(groups_by_experience, budget, min_creatures, max_creatures, tolerance, rng):
+        groups = groups_by_experience[experience]
+        group = rng.choices(groups, weights=[group.count for group in groups])[0]
+        creature_ids.append(pick_creature_id(session, encounter_filter, group, rng))
+
+    rows = {row.id: row for row in session.query(Creature.id, Creature.formal_name, Creature.challenge_rating,
+                                                 Creature.experience_points_value)
+            .filter(Creature.id.in_(set(creature_ids)))}
+    creatures = sorted((rows[creature_id] for creature_id in creature_ids),
+                       key=lambda creature: (-creature.experience_points_value, creature.formal_name))
+    return Encounter(budget, creatures)
@@ -0,0 +1,29 @@
+# loaders.py
+# Load creatures together with all of their child rows
+#
+# Creature has one-to-many relationships to every creature_* table and they are lazy by
+# default, so touching them all (as CreatureForm.on_load and the exporter do) costs one
+# SELECT per relationship per creature.  These helpers select-in load every relationship:
+# one query for the creatures plus one per child table, however many creatures are loaded.
+from sqlalchemy.orm import selectinload
+from Database.models import Creature
+
+CREATURE_EAGER_OPTIONS = [selectinload(getattr(Creature, relationship.key))
+                          for relationship in Creature.__mapper__.relationships]
+
+
+def creature_query(session):
+    """Query for creatures with every child relationship eagerly loaded."""
+    return session.query(Creature).options(*CREATURE_EAGER_OPTIONS)
+
+
+def load_creature(session, creature_id):
+    """Load a single creature and all its children, None if there is no such creature."""
+    return creature_query(session).filter(Creature.id == creature_id).first()
+
+
+def load_creatures(session, creature_ids):
+    """Load several creatures and all their children, in the order of creature_ids."""
+    creatures = {creature.id: creature
+                 for creature in creature_query(session).filter(Creature.id.in_(creature_ids))}
+    return [creatures[creature_id] for creature_id in creature_ids if creature_id in creatures]
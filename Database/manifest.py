@@ -0,0 +1,94 @@
+# manifest.py
+# Import manifest for incremental batch imports
+#
+# Every file a batch save imports is recorded with its size, modification time, content hash
+# and the id of the creature it produced.  On the next run a file whose size and mtime are
+# unchanged is skipped without being read, one whose content hash is unchanged is skipped after
+# hashing, and anything else is parsed again and replaces the creature it produced last time.
+# Stat blocks split out of a larger document are recorded one per block, as "<path>#<number>",
+# and compared on their content hash alone.  An entry whose creature has since been deleted, from
+# the creature form or otherwise, is treated as never imported, so its file is imported again.
+import hashlib
+from pathlib import Path
+from sqlalchemy import select, or_
+from sqlalchemy.dialects.sqlite import insert
+from Database.models import ImportManifest, Creature
+
+HASH_ALGORITHM = 'sha256'
+# Stay well under SQLite's limit on bound parameters
+RECORD_CHUNK_SIZE = 500
+
+
+def manifest_path(file):
+    """The key a source file is recorded under, its absolute path."""
+    return str(Path(file).resolve())
+
+
+def content_hash(file):
+    with open(file, 'rb') as source:
+        return hashlib.file_digest(source, HASH_ALGORITHM).hexdigest()
+
+
+def load_manifest(connection):
+    """Return every manifest entry whose creature still exists as a dictionary keyed by path."""
+    table = ImportManifest.__table__
+    creatures = Creature.__table__
+    query = select(table.c.path, table.c.size, table.c.mtime_ns, table.c.content_hash, table.c.creature_id) \
+        .select_from(table.outerjoin(creatures, creatures.c.id == table.c.creature_id)) \
+        .where(or_(table.c.creature_id.is_(None), creatures.c.id.is_not(None)))
+    return {row.path: row._asdict() for row in connection.execute(query)}
+
+
+def check_file(file, manifest):
+    """
+    Compare a source file with its manifest entry.
+
+    Returns (entry, changed): entry is the up to date manifest entry for the file, with the
+    previous creature_id when there was one, and changed is False when the file can be skipped.
+    """
+    path = manifest_path(file)
+    status = Path(file).stat()
+    previous = manifest.get(path)
+    if previous is not None and previous['size'] == status.st_size and previous['mtime_ns'] == status.st_mtime_ns:
+        return previous, False
+
+    entry = {
+        'path': path,
+        'size': status.st_size,
+        'mtime_ns': status.st_mtime_ns,
+        'content_hash': content_hash(file),
+        'creature_id': previous['creature_id'] if previous is not None else None,
+    }
+    changed = previous is None or previous['content_hash'] != entry['content_hash']
+    return entry, changed
+
+
+def block_path(file, number):
+    """The key the number-th stat block split out of a document is recorded under."""
+    return "{}#{}".format(manifest_path(file), number)
+
+
+def check_block(path, text, manifest):
+    """Like check_file, for the text of a stat block recorded under path."""
+    previous = manifest.get(path)
+    encoded = text.encode('utf-8')
+    entry = {
+        'path': path,
+        'size': len(encoded),
+        'mtime_ns': None,
+        'content_hash': hashlib.new(HASH_ALGORITHM, encoded).hexdigest(),
+        'creature_id': previous['creature_id'] if previous is not None else None,
+    }
+    changed = previous is None or previous['content_hash'] != entry['content_hash']
+    return entry, changed
+
+
+def record_imports(connection, entries):
+    """Insert or update manifest entries, keyed by path."""
+    entries = list(entries)
+    for start in range(0, len(entries), RECORD_CHUNK_SIZE):
+        statement = insert(ImportManifest.__table__).values(entries[start:start + RECORD_CHUNK_SIZE])
+        statement = statement.on_conflict_do_update(
+            index_elements=['path'],
+            set_={key: statement.excluded[key] for key in ('size', 'mtime_ns', 'content_hash', 'creature_id')})
+        connection.execute(statement)
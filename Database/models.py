@@ -1,14 +1,30 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, Float, String, ForeignKey, Index, event, text
 from sqlalchemy.orm import relationship
 
 from Database.database import Base
+from Parsers.NumericStats import set_numeric_values
 
 
 class Creature(Base):
     """ Creature record"""
     __tablename__ = 'creatures'
+    __table_args__ = (
+        # CreatureList filters on barn_type and sorts on formal_name
+        Index('ix_creatures_barn_type_formal_name', 'barn_type', 'formal_name'),
+        # CreatureList can filter on a CR range and sort on CR, AC or HP instead
+        Index('ix_creatures_barn_type_challenge_rating', 'barn_type', 'challenge_rating_value', 'formal_name'),
+        Index('ix_creatures_barn_type_armor_class', 'barn_type', 'armor_class_value'),
+        Index('ix_creatures_barn_type_hit_points', 'barn_type', 'hit_points_value'),
+        # The encounter builder counts and picks creatures by CR and XP without reading the table,
+        # or filters on a type or an environment, ignoring case, and a CR range
+        Index('ix_creatures_barn_type_challenge_rating_experience', 'barn_type', 'challenge_rating_value',
+              'experience_points_value'),
+        Index('ix_creatures_type_challenge_rating', text('type COLLATE NOCASE'), 'challenge_rating_value'),
+        Index('ix_creatures_environment_challenge_rating', text('environment COLLATE NOCASE'),
+              'challenge_rating_value'),
+    )
     id = Column(Integer, primary_key=True)
-    formal_name = Column(String)
+    formal_name = Column(String, index=True)
     common_name = Column(String)
     challenge_rating = Column(String)
     description = Column(String)
@@ -65,6 +81,21 @@ class Creature(Base):
     content = Column(String)
     barn_type = Column(String)
 
+    # Numeric copies of the stats above for sorting and range queries, see Parsers/NumericStats.py
+    challenge_rating_value = Column(Float)
+    experience_points_value = Column(Integer)
+    hit_points_value = Column(Integer)
+    armor_class_value = Column(Integer)
+    fortitude_value = Column(Integer)
+    reflex_value = Column(Integer)
+    will_value = Column(Integer)
+    strength_value = Column(Integer)
+    dexterity_value = Column(Integer)
+    constitution_value = Column(Integer)
+    intelligence_value = Column(Integer)
+    wisdom_value = Column(Integer)
+    charisma_value = Column(Integer)
+
     # Relationships (one-to-many)
     senses = relationship("CreatureSenses", back_populates="creature", cascade="all, delete-orphan")
     auras = relationship("CreatureAuras", back_populates="creature", cascade="all, delete-orphan")
@@ -99,13 +130,20 @@ class Creature(Base):
         return "<Creature: {}>".format(self.__dict__)
 
 
+@event.listens_for(Creature, 'before_insert')
+@event.listens_for(Creature, 'before_update')
+def update_numeric_values(mapper, connection, creature):
+    # Keep the numeric copies in step with the text when a creature is saved through a session
+    set_numeric_values(creature)
+
+
 class CreatureSenses(Base):
     __tablename__ = 'creature_senses'
     id = Column(Integer, primary_key=True)
     sense = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='senses')
@@ -122,7 +160,7 @@ class CreatureAuras(Base):
     save_role = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='auras')
@@ -138,7 +176,7 @@ class CreatureACModifiers(Base):
     modifier_type = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='ac_modifiers')
@@ -154,7 +192,7 @@ class CreatureDamageReductionModifiers(Base):
     reduction_amount = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='dr_modifiers')
@@ -170,7 +208,7 @@ class CreatureSpellResistenceModifiers(Base):
     resist_amount = Column(Integer)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='sr_modifiers')
@@ -185,7 +223,7 @@ class CreatureWeaknesses(Base):
     weakness = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='weaknesses')
@@ -200,7 +238,7 @@ class CreatureImmuneModifiers(Base):
     immune_to = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='immune_modifiers')
@@ -215,7 +253,7 @@ class CreatureDomains(Base):
     domain = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='cleric_domains')
@@ -230,7 +268,7 @@ class CreatureDefenseAbilities(Base):
     ability = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='defensive_abilities')
@@ -245,7 +283,7 @@ class CreatureSpeedModifiers(Base):
     speed_modifier = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='speed_modifiers')
@@ -260,7 +298,7 @@ class CreatureMeleeAttacks(Base):
     attack = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='melee_attacks')
@@ -275,7 +313,7 @@ class CreatureRangedAttacks(Base):
     attack = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='ranged_attacks')
@@ -290,7 +328,7 @@ class CreatureSpecialAttacks(Base):
     attack = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='special_attacks')
@@ -307,7 +345,7 @@ class CreatureSpellLikeAbilities(Base):
     modifiers = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='spell_like_abilities')
@@ -325,7 +363,7 @@ class CreatureKnownSpells(Base):
     modifiers = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='known_spells')
@@ -342,7 +380,7 @@ class CreaturePreparedSpells(Base):
     modifiers = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='prepared_spells')
@@ -357,7 +395,7 @@ class CreatureFeats(Base):
     feat = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='feats')
@@ -373,7 +411,7 @@ class CreatureSkills(Base):
     modifier = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='skills')
@@ -388,7 +426,7 @@ class CreatureLanguages(Base):
     language = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='languages')
@@ -403,7 +441,7 @@ class CreatureSpecialQualities(Base):
     special_quality = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='special_qualities')
@@ -420,7 +458,7 @@ class CreatureSpecialAbilities(Base):
     description = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='special_abilities')
@@ -436,10 +474,26 @@ class CreatureGearItems(Base):
     description = Column(String)
 
     # Foreign key to Creatures
-    creature_id = Column(Integer, ForeignKey('creatures.id'))
+    creature_id = Column(Integer, ForeignKey('creatures.id'), index=True)
 
     # Relationships
     creature = relationship('Creature', back_populates='gear_items')
 
     def __repr__(self):
         return "<CreatureGearItems: {}>".format(self.__dict__)
+
+
+class ImportManifest(Base):
+    """ Source file a batch import turned into a creature, used to skip files that have not changed"""
+    __tablename__ = 'import_manifest'
+    id = Column(Integer, primary_key=True)
+    path = Column(String, nullable=False, unique=True)
+    size = Column(Integer)
+    mtime_ns = Column(Integer)
+    content_hash = Column(String)
+
+    # The creature imported from this file, replaced when the file changes
+    creature_id = Column(Integer, ForeignKey('creatures.id'))
+
+    def __repr__(self):
+        return "<ImportManifest: {}>".format(self.__dict__)
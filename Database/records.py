@@ -0,0 +1,28 @@
+# records.py
+# Map parsed creature records onto ORM rows
+#
+# The parser builds plain ParsedCreature records (Parsers/ParsedCreature.py), which the
+# exporters and bulk_save_creatures use as they are.  Only a creature saved through a
+# session, as the GUI form does, needs to become a Creature with instrumented child rows.
+from Database.models import Creature
+from Parsers.ParsedCreature import ParsedCreature, CREATURE_FIELDS, CHILD_RECORDS
+
+# Relationship name to child model class, for every one-to-many relationship on Creature
+CHILD_MODELS = {relationship.key: relationship.mapper.class_ for relationship in Creature.__mapper__.relationships}
+
+
+def creature_from_record(record):
+    """Return a new, unsaved Creature with the fields and child rows of a ParsedCreature.
+
+    Anything that is not a ParsedCreature, such as a Creature loaded from the database, is returned as it is.
+    """
+    if not isinstance(record, ParsedCreature):
+        return record
+    creature = Creature(**{key: getattr(record, key) for key in CREATURE_FIELDS})
+    for relationship_name, record_class in CHILD_RECORDS:
+        child_model = CHILD_MODELS[relationship_name]
+        # Assigned even when empty, so the saved creature never needs its session to lazy load a collection
+        setattr(creature, relationship_name,
+                [child_model(**{key: getattr(child, key) for key in record_class.__slots__})
+                 for child in getattr(record, relationship_name)])
+    return creature
@@ -0,0 +1,250 @@
+# schema.py
+# Database version check and structure upgrades
+#
+# The version check only uses sqlite3, so the application can check the database at
+# startup without loading SQLAlchemy or the models.  A database that is created or
+# upgraded to the current version gets that version stamped in its header with PRAGMA
+# user_version, and reading it back is all the check costs from then on.  Upgrading
+# from before version 4 is the exception: building the search index loads SQLAlchemy,
+# the engine and the models through Database.search.
+import sqlite3
+from Database.config import load_settings, apply_pragmas
+
+# Engine settings come from the environment or creature_barn.ini, see Database/config.py
+DATABASE_SETTINGS = load_settings()
+
+# For SQLite (file-based)
+DATABASE_NAME = DATABASE_SETTINGS['database_name']
+DATABASE_VERSION = '8'
+
+# Creatures converted per UPDATE batch when backfilling the numeric columns
+BACKFILL_CHUNK_SIZE = 1000
+
+# Every creature_* child table as of database version 3
+CHILD_TABLES_V3 = [
+    'creature_senses', 'creature_auras', 'creature_ac_modifiers', 'creature_damage_modifiers',
+    'creature_spell_resistence_modifiers', 'creature_weaknesses', 'creature_immune_modifiers', 'creature_domains',
+    'creature_defensive_abilities', 'creature_speed_modifiers', 'creature_melee_attacks', 'creature_ranged_attacks',
+    'creature_special_attacks', 'creature_spell_like_abilities', 'creature_known_spells', 'creature_prepared_spells',
+    'creature_feats', 'creature_skills', 'creature_languages', 'creature_special_qualities',
+    'creature_special_abilities', 'creature_gear_items',
+]
+
+
+class Database:
+    version = DATABASE_VERSION
+    con = None
+    cur = None
+
+    def connect(self):
+        if self.con is None:
+            self.con = sqlite3.connect(DATABASE_NAME)
+            self.con.row_factory = sqlite3.Row
+            apply_pragmas(self.con, DATABASE_SETTINGS)
+
+    def is_database_valid(self):
+        if self.get_schema_version() == int(self.version):
+            return True
+        # Not stamped yet, or stamped by an older version: look for the tables themselves
+        if self.is_database_version_valid():
+            return bool(self.fetch_all("select name from sqlite_master where type = 'table' and name = 'creatures'",
+                                       {}))
+        else:
+            return False
+
+    def get_schema_version(self) -> int:
+        """The version stamped in the database header, 0 for a database that was never stamped."""
+        return self.fetch_all("PRAGMA user_version", {})[0][0]
+
+    def set_schema_version(self, version):
+        self.create_cursor()
+        self.cur.execute("PRAGMA user_version = {:d}".format(int(version)))
+        self.commit()
+
+    def is_database_version_valid(self) -> bool:
+        self.create_cursor()
+        try:
+            self.fetch_all("select version from db_version", {})
+            return True
+        except sqlite3.DatabaseError:
+            self.init_database_version()
+            return False
+
+    def get_expected_version(self):
+        return self.version
+
+    def get_actual_version(self):
+        self.create_cursor()
+        version = self.fetch_all("select version from db_version", {})
+        if version:
+            return version[0][0]
+        else:
+            self.cur.execute("insert into db_version (version) values(:ver)",
+                             {"ver": '0'})
+            self.commit()
+            return '0'
+
+    def update_database_version(self, new_database_version):
+        self.cur.execute("update db_version set version = :ver",
+                         {"ver": new_database_version})
+        self.commit()
+
+    def create_cursor(self):
+        self.connect()
+        if self.cur is None:
+            self.cur = self.con.cursor()
+
+    def init_database_version(self):
+        self.create_cursor()
+        self.cur.execute("create table db_version ( version )")
+        self.cur.execute("insert into db_version (version) values(:ver)",
+                         {"ver": self.version})
+        self.commit()
+
+    def execute_query(self, query, parameters):
+        self.create_cursor()
+        self.cur.execute(query, parameters)
+
+    def execute_many_query(self, query, parameters):
+        self.create_cursor()
+        self.cur.executemany(query, parameters)
+
+    def commit(self):
+        self.con.commit()
+
+    def rollback(self):
+        self.con.rollback()
+
+    def fetch_all(self, query, parameters):
+        self.create_cursor()
+        self.cur.execute(query, parameters)
+        return self.cur.fetchall()
+
+    def close_cursor(self, commit=True):
+        if self.cur is not None:
+            if self.con.in_transaction:
+                if commit:
+                    self.con.commit()
+                else:
+                    self.con.rollback()
+            self.cur.close()
+            self.cur = None
+
+    def disconnect(self):
+        if self.con is not None:
+            self.close_cursor()
+            self.con.close()
+            self.con = None
+
+    def verify_database_version(self):
+        expected_version = self.get_expected_version()
+        if self.get_schema_version() == int(expected_version):
+            print("Database version {} is current.".format(expected_version))
+            return
+        actual_version = self.get_actual_version()
+        if actual_version < expected_version:
+            print("Updating from version {} to version {}".format(actual_version, expected_version))
+            # @TODO: Update the data structures
+            if actual_version < '2':
+                self.upgrade_from_1_to_2()
+            if actual_version < '3':
+                self.upgrade_from_2_to_3()
+            if actual_version < '4':
+                self.upgrade_from_3_to_4()
+            if actual_version < '5':
+                self.upgrade_from_4_to_5()
+            if actual_version < '6':
+                self.upgrade_from_5_to_6()
+            if actual_version < '7':
+                self.upgrade_from_6_to_7()
+            if actual_version < '8':
+                self.upgrade_from_7_to_8()
+            # Then update version number in the database
+            self.update_database_version(expected_version)
+            self.set_schema_version(expected_version)
+        elif actual_version > expected_version:
+            print("Error Database version {} is newer than the code {}!".format(actual_version, expected_version))
+            exit(-1)
+        else:
+            print("Database version {} is current.".format(actual_version))
+            self.set_schema_version(expected_version)
+
+    def upgrade_from_1_to_2(self):
+        self.create_cursor()
+        self.cur.execute('ALTER TABLE creature_domainss RENAME TO creature_domains' )
+        self.commit()
+
+    def upgrade_from_2_to_3(self):
+        self.create_cursor()
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_formal_name ON creatures (formal_name)')
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_barn_type_formal_name '
+                         'ON creatures (barn_type, formal_name)')
+        for table in CHILD_TABLES_V3:
+            self.cur.execute('CREATE INDEX IF NOT EXISTS ix_{0}_creature_id ON {0} (creature_id)'.format(table))
+        self.commit()
+
+    def upgrade_from_3_to_4(self):
+        # Imported here, Database.search loads SQLAlchemy, the engine in Database.database and
+        # the models, which the version check does not need
+        from Database.search import CREATE_SEARCH_TABLE, DROP_SEARCH_TABLE, INSERT_SEARCH_ROWS
+        self.create_cursor()
+        self.cur.execute(DROP_SEARCH_TABLE)
+        self.cur.execute(CREATE_SEARCH_TABLE)
+        self.cur.execute(INSERT_SEARCH_ROWS)
+        self.commit()
+
+    def upgrade_from_4_to_5(self):
+        self.create_cursor()
+        self.cur.execute('CREATE TABLE IF NOT EXISTS import_manifest ('
+                         'id INTEGER NOT NULL, path VARCHAR NOT NULL, size INTEGER, mtime_ns INTEGER, '
+                         'content_hash VARCHAR, creature_id INTEGER, PRIMARY KEY (id), UNIQUE (path), '
+                         'FOREIGN KEY(creature_id) REFERENCES creatures (id))')
+        self.commit()
+
+    def upgrade_from_5_to_6(self):
+        # Imported here, the conversions live with the parser that fills the columns for new creatures
+        from Parsers.NumericStats import NUMERIC_STATS
+        self.create_cursor()
+        existing = {row['name'] for row in self.fetch_all("PRAGMA table_info(creatures)", {})}
+        for value_field, text_field, conversion in NUMERIC_STATS:
+            if value_field not in existing:
+                column_type = 'FLOAT' if value_field == 'challenge_rating_value' else 'INTEGER'
+                self.cur.execute('ALTER TABLE creatures ADD COLUMN {} {}'.format(value_field, column_type))
+
+        # Backfill from the text columns, a chunk of creatures at a time
+        text_fields = ", ".join(text_field for value_field, text_field, conversion in NUMERIC_STATS)
+        assignments = ", ".join("{0} = :{0}".format(value_field) for value_field, text_field, conversion in NUMERIC_STATS)
+        rows = self.con.execute("SELECT id, {} FROM creatures".format(text_fields))
+        while True:
+            chunk = rows.fetchmany(BACKFILL_CHUNK_SIZE)
+            if not chunk:
+                break
+            updates = []
+            for row in chunk:
+                values = {value_field: conversion(row[text_field])
+                          for value_field, text_field, conversion in NUMERIC_STATS}
+                values['id'] = row['id']
+                updates.append(values)
+            self.con.executemany("UPDATE creatures SET {} WHERE id = :id".format(assignments), updates)
+
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_barn_type_challenge_rating '
+                         'ON creatures (barn_type, challenge_rating_value, formal_name)')
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_barn_type_armor_class '
+                         'ON creatures (barn_type, armor_class_value)')
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_barn_type_hit_points '
+                         'ON creatures (barn_type, hit_points_value)')
+        self.commit()
+
+    def upgrade_from_6_to_7(self):
+        self.create_cursor()
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_barn_type_challenge_rating_experience '
+                         'ON creatures (barn_type, challenge_rating_value, experience_points_value)')
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_type_challenge_rating '
+                         'ON creatures (type COLLATE NOCASE, challenge_rating_value)')
+        self.commit()
+
+    def upgrade_from_7_to_8(self):
+        self.create_cursor()
+        self.cur.execute('CREATE INDEX IF NOT EXISTS ix_creatures_environment_challenge_rating '
+                         'ON creatures (environment COLLATE NOCASE, challenge_rating_value)')
+        self.commit()
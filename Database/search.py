@@ -0,0 +1,124 @@
+# search.py
+# Full text search over the barn with an SQLite FTS5 index
+#
+# creature_search holds one row per creature, keyed by rowid = creatures.id, with the name,
+# description and tactics plus the text of the abilities, spells and gear child tables.
+# The index is kept in sync in the same transaction as the data:
+#   - ORM flushes (the GUI save, update and delete) reindex every touched creature in after_flush
+#   - bulk_save_creatures reindexes the ids it inserted
+#   - the version 4 upgrade builds the index for the creatures already in the database
+import re
+from sqlalchemy import event, text
+from Database.database import SessionLocal
+from Database.models import Creature
+
+SEARCH_TABLE = 'creature_search'
+
+# Higher weights rank a match in that column above the same match elsewhere
+SEARCH_COLUMNS = [
+    ('name', 10.0),
+    ('description', 2.0),
+    ('tactics', 1.0),
+    ('abilities', 2.0),
+    ('spells', 3.0),
+    ('gear', 1.0),
+]
+
+CREATE_SEARCH_TABLE = "CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5({}, tokenize='porter unicode61')".format(
+    SEARCH_TABLE, ", ".join(name for name, weight in SEARCH_COLUMNS))
+
+DROP_SEARCH_TABLE = "DROP TABLE IF EXISTS {}".format(SEARCH_TABLE)
+
+
+def _child_text(table, expression):
+    return "coalesce((SELECT group_concat({}, ' ') FROM {} WHERE creature_id = c.id), '')".format(expression, table)
+
+
+# One document per creature, built by SQL so the ORM, bulk and migration paths all index the same text
+INDEX_SELECT = """
+SELECT c.id,
+       coalesce(c.formal_name, '') || ' ' || coalesce(c.common_name, ''),
+       coalesce(c.description, ''),
+       coalesce(c.tactics, ''),
+       {special_abilities} || ' ' || {special_attacks} || ' ' || {special_qualities} || ' ' || {defensive_abilities},
+       {spell_like_abilities} || ' ' || {known_spells} || ' ' || {prepared_spells},
+       coalesce(c.gear, '') || ' ' || {gear_items}
+  FROM creatures c""".format(
+    special_abilities=_child_text('creature_special_abilities',
+                                  "coalesce(ability, '') || ' ' || coalesce(description, '')"),
+    special_attacks=_child_text('creature_special_attacks', 'attack'),
+    special_qualities=_child_text('creature_special_qualities', 'special_quality'),
+    defensive_abilities=_child_text('creature_defensive_abilities', 'ability'),
+    spell_like_abilities=_child_text('creature_spell_like_abilities', 'name'),
+    known_spells=_child_text('creature_known_spells', 'name'),
+    prepared_spells=_child_text('creature_prepared_spells', 'name'),
+    gear_items=_child_text('creature_gear_items', "coalesce(name, '') || ' ' || coalesce(description, '')"),
+)
+
+INSERT_SEARCH_ROWS = "INSERT INTO {} (rowid, {}) {}".format(
+    SEARCH_TABLE, ", ".join(name for name, weight in SEARCH_COLUMNS), INDEX_SELECT)
+
+# Stay well under SQLite's limit on bound parameters
+REINDEX_CHUNK_SIZE = 500
+
+RE_SEARCH_TERM = re.compile(r"\w+")
+
+
+def create_search_index(connection):
+    """Create the FTS table and index every creature already in the database."""
+    connection.execute(text(DROP_SEARCH_TABLE))
+    connection.execute(text(CREATE_SEARCH_TABLE))
+    connection.execute(text(INSERT_SEARCH_ROWS))
+
+
+def reindex_creatures(connection, creature_ids):
+    """Bring the index rows of the given creatures up to date, dropping the rows of deleted creatures."""
+    creature_ids = list(creature_ids)
+    for start in range(0, len(creature_ids), REINDEX_CHUNK_SIZE):
+        chunk = creature_ids[start:start + REINDEX_CHUNK_SIZE]
+        names = ", ".join(":id{}".format(index) for index in range(len(chunk)))
+        parameters = {"id{}".format(index): creature_id for index, creature_id in enumerate(chunk)}
+        connection.execute(text("DELETE FROM {} WHERE rowid IN ({})".format(SEARCH_TABLE, names)), parameters)
+        connection.execute(text("{} WHERE c.id IN ({})".format(INSERT_SEARCH_ROWS, names)), parameters)
+
+
+def match_expression(search_text):
+    """Turn free text from the user into an FTS5 query: every word must match, as a prefix."""
+    return " ".join('"{}"*'.format(term) for term in RE_SEARCH_TERM.findall(search_text))
+
+
+def search_creatures(session, search_text, barn_type=None, limit=50):
+    """Return (id, formal_name, challenge_rating, snippet) rows for the best matches, best first."""
+    expression = match_expression(search_text)
+    if not expression:
+        return []
+    weights = ", ".join(str(weight) for name, weight in SEARCH_COLUMNS)
+    query = ("SELECT c.id, c.formal_name, c.challenge_rating, "
+             "snippet({0}, -1, '[', ']', '...', 10) AS snippet "
+             "FROM {0} JOIN creatures c ON c.id = {0}.rowid "
+             "WHERE {0} MATCH :expression").format(SEARCH_TABLE)
+    parameters = {"expression": expression, "limit": limit}
+    if barn_type is not None:
+        query += " AND c.barn_type = :barn_type"
+        parameters["barn_type"] = barn_type
+    query += " ORDER BY bm25({}, {}) LIMIT :limit".format(SEARCH_TABLE, weights)
+    return session.execute(text(query), parameters).all()
+
+
+def _touched_creature_ids(session):
+    creature_ids = set()
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(instance, Creature):
+            creature_id = instance.id
+        else:
+            creature_id = getattr(instance, 'creature_id', None)
+        if creature_id is not None:
+            creature_ids.add(creature_id)
+    return creature_ids
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def reindex_after_flush(session, flush_context):
+    creature_ids = _touched_creature_ids(session)
+    if creature_ids:
+        reindex_creatures(session.connection(), sorted(creature_ids))
@@ -0,0 +1,187 @@
+"""
+Render creatures into the {#TAB} separated export format and write them to disk.
+
+The functions in this module only need an object that looks like a Creature,
+so they can be used from the Tk forms as well as from headless batch runs.
+
+The parser and the database can leave any text field None, the creature's own
+or one of its child rows', and those render as empty text.  A creature without
+a formal name cannot be exported, it has nothing to be filed under, and raises
+ExportError.
+"""
+import re
+from pathlib import Path
+
+EXPORT_DIRECTORY = "output"
+FIELD_SEPARATOR = "{#TAB}"
+LINE_SEPARATOR = "{#ENTER}"
+
+
+class ExportError(Exception):
+    """A creature whose data cannot be exported."""
+
+
+def safe_copy(data):
+    return data if data else ""
+
+def safe_stat_copy(data):
+    return data if data else "&amp;Mdash;"
+
+
+def _join_spells(caster_level, spells, make_key):
+    spell_dictionary = {}
+    for spell in spells:
+        value = safe_copy(spell.name)
+        value += (" (" + spell.modifiers + ")") if spell.modifiers else ""
+        spell_dictionary.setdefault(make_key(spell), []).append(value)
+
+    spell_list = [safe_copy(caster_level)]
+    for rate, spell_names in spell_dictionary.items():
+        spell_list.append(rate + ", ".join(spell_names))
+    return LINE_SEPARATOR.join(spell_list)
+
+
+def render_fields(creature):
+    """Build the ordered list of export fields for a creature."""
+    # Every text field, of the creature and of its child rows, goes through safe_copy as it may be None
+    if creature.senses:
+        senses = ", ".join(sense.sense for sense in creature.senses) + "; Perception " + safe_copy(creature.perception_modifier)
+    else:
+        senses = "Perception " + safe_copy(creature.perception_modifier)
+
+    auras = ", ".join(safe_copy(aura.aura) + " (" + safe_copy(aura.radius) + ", " + safe_copy(aura.save_role) + ")"
+                      for aura in creature.auras)
+
+    if creature.ac_modifiers:
+        ac_modifiers = " (" + ", ".join(safe_copy(ac_mod.modifier_amount) + " " + safe_copy(ac_mod.modifier_type)
+                                        for ac_mod in creature.ac_modifiers) + ")"
+    else:
+        ac_modifiers = ""
+
+    immunity = ", ".join(safe_copy(immune.immune_to) for immune in creature.immune_modifiers)
+    weaknesses = ", ".join(safe_copy(weakness.weakness) for weakness in creature.weaknesses)
+    defense_abilities = ", ".join(safe_copy(defense_ability.ability) for defense_ability in creature.defensive_abilities)
+    # resist_amount is an Integer column, so it is a number once loaded from the database
+    resistance = ", ".join("{} {}".format(safe_copy(resist.resists), resist.resist_amount) for resist in creature.sr_modifiers)
+    languages = ", ".join(safe_copy(language.language) for language in creature.languages)
+    skills = ", ".join(safe_copy(skill.skill) + " " + safe_copy(skill.modifier) for skill in creature.skills)
+
+    if creature.speed:
+        speeds = ", ".join([creature.speed] + [safe_copy(speed.speed_modifier) for speed in creature.speed_modifiers])
+    else:
+        speeds = ""
+
+    feats = ", ".join(safe_copy(feat.feat) for feat in creature.feats)
+    melees = ", ".join(safe_copy(melee.attack) for melee in creature.melee_attacks)
+    ranged = ", ".join(safe_copy(ranged_attack.attack) for ranged_attack in creature.ranged_attacks)
+    special_attacks = ", ".join(safe_copy(special_attack.attack) for special_attack in creature.special_attacks)
+
+    if creature.spell_like_abilities:
+        spell_like_abilities = _join_spells(creature.spell_like_caster_level, creature.spell_like_abilities,
+                                            lambda spell: safe_copy(spell.rate) + "— ")
+    else:
+        spell_like_abilities = ""
+
+    if creature.known_spells:
+        known_spells = _join_spells(creature.spell_known_caster_level, creature.known_spells,
+                                    lambda spell: safe_copy(spell.spell_level) + " " + safe_copy(spell.rate) + "— ")
+    else:
+        known_spells = ""
+
+    if creature.prepared_spells:
+        prepared_spells = _join_spells(creature.spell_prepared_caster_level, creature.prepared_spells,
+                                       lambda spell: safe_copy(spell.spell_level) + "— ")
+    else:
+        prepared_spells = ""
+
+    if creature.description:
+        description = re.sub(r"\n", " ", creature.description)
+    else:
+        description = ""
+
+    special_qualities = ", ".join(safe_copy(special_quality.special_quality)
+                                  for special_quality in creature.special_qualities)
+
+    creature_type = safe_copy(creature.type)
+    creature_type += (" (" + creature.sub_type + ")") if creature.sub_type else ""
+
+    if creature.special_abilities:
+        special_abilities_list = ["Special Abilities"]
+        for ability in creature.special_abilities:
+            special_abilities_list.append(safe_copy(ability.ability) + " (" + safe_copy(ability.type) + ") "
+                                          + safe_copy(ability.description))
+        special_abilities_and_content = LINE_SEPARATOR.join(special_abilities_list)
+        special_abilities_and_content += LINE_SEPARATOR + description.strip()
+    else:
+        special_abilities_and_content = description.strip()
+
+    creature_class = safe_copy(creature.char_class)
+
+    return [
+        safe_copy(creature.common_name),
+        "CR " + safe_copy(creature.challenge_rating),
+        safe_copy(creature.experience_points),
+        safe_copy(creature.alignment),
+        safe_copy(creature.size),
+        creature_type,
+        creature_class,
+        safe_copy(creature.alignment) + " " + safe_copy(creature.size) + " " + safe_copy(creature_type) + " " + safe_copy(creature.initiative),
+        senses,
+        auras,
+        safe_copy(creature.base_armor_class) + ", touch " + safe_copy(creature.touch_armor_class) + ", flat-footed " + safe_copy(creature.flat_footed_armor_class) + ac_modifiers,
+        safe_copy(creature.hit_points) + " (" + safe_copy(creature.hit_dice) + ")",
+        safe_copy(creature.fortitude),
+        safe_copy(creature.reflex),
+        safe_copy(creature.will),
+        safe_copy(creature.damage_reduction),
+        safe_copy(creature.spell_resistence),
+        immunity,
+        resistance,
+        weaknesses,
+        defense_abilities,
+        speeds,
+        safe_copy(creature.space),
+        safe_copy(creature.reach),
+        melees,
+        ranged,
+        special_attacks,
+        spell_like_abilities,
+        known_spells,
+        prepared_spells,
+        safe_stat_copy(creature.strength),
+        safe_stat_copy(creature.dexterity),
+        safe_stat_copy(creature.constitution),
+        safe_stat_copy(creature.intelligence),
+        safe_stat_copy(creature.wisdom),
+        safe_stat_copy(creature.charisma),
+        safe_copy(creature.base_attack),
+        safe_copy(creature.combat_maneuver_bonus),
+        safe_copy(creature.combat_maneuver_defense),
+        feats,
+        skills,
+        safe_copy(creature.racial_modifiers),
+        languages,
+        special_qualities,
+        safe_copy(creature.environment),
+        safe_copy(creature.organization),
+        safe_copy(creature.gear),
+        special_abilities_and_content
+    ]
+
+
+def render_creature(creature):
+    """Render a creature as a single {#TAB} separated export line, ExportError when it has no formal name."""
+    if not creature.formal_name:
+        raise ExportError("{} has no formal name".format(
+            "Creature {}".format(creature.id) if getattr(creature, 'id', None) else "A creature"))
+    return FIELD_SEPARATOR.join(render_fields(creature))
+
+
+def export_creature(creature, output_dir=EXPORT_DIRECTORY):
+    """Write the export line for a creature to <output_dir>/<formal_name>.txt and return the path."""
+    # Rendered first, so a creature that cannot be rendered leaves no empty file behind
+    export = render_creature(creature)
+    file_path = str(Path(output_dir) / (creature.formal_name + '.txt'))
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write(export)
+    return file_path
@@ -0,0 +1,118 @@
+"""
+Export creatures straight from the database, without a GUI.
+
+Creature ids are read a chunk at a time by keyset (id > last id).  Each chunk
+is read with one SELECT for the creatures and one per child table, rendered,
+written and dropped, so memory stays bounded however many creatures are
+exported.  The rows are read with Core rather than the ORM: the renderer only
+needs objects that look like a Creature, and building and tracking ORM
+instances for every child row was most of the cost of an export.
+"""
+from sqlalchemy import select
+from Database.database import engine
+from Database.bulk import CHILD_TABLES
+from Database.models import Creature
+from Exporters.CreatureExporter import EXPORT_DIRECTORY, ExportError
+from Exporters.ExportTargets import open_export_target
+
+# Creatures loaded, rendered and released together
+EXPORT_CHUNK_SIZE = 500
+
+SELECT_ALL = 'all'
+BARN_TYPES = ('NPC', 'Creature')
+
+
+def parse_selection(selection):
+    """
+    Turn a command line selection into (barn_type, creature_ids).
+
+    "all" exports everything, "NPC" or "Creature" one barn type, and a comma
+    separated list of numbers those creature ids.
+    """
+    if selection == SELECT_ALL:
+        return None, None
+    if selection in BARN_TYPES:
+        return selection, None
+    try:
+        return None, [int(creature_id) for creature_id in selection.split(',') if creature_id.strip()]
+    except ValueError:
+        raise ValueError("Export selection must be {}, {} or a comma separated list of ids, not {}".format(
+            SELECT_ALL, " or ".join(BARN_TYPES), selection))
+
+
+class ExportRecord:
+    """Read only stand in for a Creature or one of its child rows, built from a database row."""
+
+    def __init__(self, values):
+        self.__dict__.update(values)
+
+
+def iter_id_chunks(connection, barn_type=None, creature_ids=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield lists of at most chunk_size creature ids, in id order for a barn type or everything."""
+    if creature_ids is not None:
+        for start in range(0, len(creature_ids), chunk_size):
+            yield creature_ids[start:start + chunk_size]
+        return
+
+    creatures = Creature.__table__
+    last_id = 0
+    while True:
+        query = select(creatures.c.id).where(creatures.c.id > last_id)
+        if barn_type is not None:
+            query = query.where(creatures.c.barn_type == barn_type)
+        chunk = list(connection.execute(query.order_by(creatures.c.id).limit(chunk_size)).scalars())
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]
+
+
+def load_records(connection, creature_ids):
+    """Load creatures and their child rows as ExportRecords, in the order of creature_ids."""
+    creatures = Creature.__table__
+    records = {row.id: ExportRecord(row._mapping)
+               for row in connection.execute(select(creatures).where(creatures.c.id.in_(creature_ids)))}
+    for record in records.values():
+        for relationship_name, child_table, child_columns in CHILD_TABLES:
+            setattr(record, relationship_name, [])
+    for relationship_name, child_table, child_columns in CHILD_TABLES:
+        query = select(child_table).where(child_table.c.creature_id.in_(creature_ids)) \
+            .order_by(child_table.c.creature_id, child_table.c.id)
+        for row in connection.execute(query):
+            getattr(records[row.creature_id], relationship_name).append(ExportRecord(row._mapping))
+    return [records[creature_id] for creature_id in creature_ids if creature_id in records]
+
+
+def stream_creatures(connection, barn_type=None, creature_ids=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield creature records with all their children, one chunk in memory at a time."""
+    for chunk in iter_id_chunks(connection, barn_type, creature_ids, chunk_size):
+        yield from load_records(connection, chunk)
+
+
+def export_database(selection=SELECT_ALL, output=EXPORT_DIRECTORY, log=print):
+    """
+    Export the selected creatures and return (written, failed), how many were and were not exported.
+
+    output is a directory for one file per creature, or a .jsonl, .tsv or .zip bundle, see ExportTargets.
+    """
+    barn_type, creature_ids = parse_selection(selection)
+    written = 0
+    failed = 0
+    target = open_export_target(output)
+    try:
+        with engine.connect() as connection:
+            for creature in stream_creatures(connection, barn_type, creature_ids):
+                try:
+                    target.write(creature)
+                    written += 1
+                except (IOError, ExportError) as e:
+                    # One creature that cannot be written must not end the export of all the others
+                    log("Could not export creature {}: {}".format(creature.id, e))
+                    failed += 1
+    finally:
+        target.close()
+    if failed:
+        log("Exported {} creature(s) to {}, {} could not be exported".format(written, output, failed))
+    else:
+        log("Exported {} creature(s) to {}".format(written, output))
+    return written, failed
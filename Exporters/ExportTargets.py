@@ -0,0 +1,168 @@
+"""
+Where exported creatures are written.
+
+An export target is picked from the output path:
+
+    *.jsonl  one JSON object per line: id, formal_name, barn_type and the export line
+    *.tsv    a header row, then id, formal_name, barn_type and the export line per row
+    *.zip    one <formal_name>.txt member per creature, the same content as the directory target
+    other    a directory with one <formal_name>.txt file per creature, the original layout
+
+Bundles are written in a single pass through a large write buffer, so a batch
+costs one file create instead of one per creature.  read_bundle streams the
+records of any bundle back without loading the whole file.
+"""
+import json
+import zipfile
+from pathlib import Path
+from Exporters.CreatureExporter import render_creature, export_creature
+
+# Write buffer of the JSONL and TSV bundles
+BUNDLE_BUFFER_SIZE = 1024 * 1024
+BUNDLE_FIELDS = ('id', 'formal_name', 'barn_type', 'export')
+
+# Backslash first, so the escapes added for the others are not escaped again
+TSV_ESCAPES = (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\r', '\\r'))
+TSV_UNESCAPES = {escaped[1]: character for character, escaped in TSV_ESCAPES}
+
+
+def bundle_record(creature):
+    return {
+        'id': getattr(creature, 'id', None),
+        'formal_name': creature.formal_name,
+        'barn_type': creature.barn_type,
+        'export': render_creature(creature),
+    }
+
+
+def escape_tsv(value):
+    value = "" if value is None else str(value)
+    for character, escaped in TSV_ESCAPES:
+        value = value.replace(character, escaped)
+    return value
+
+
+def unescape_tsv(value):
+    characters = []
+    index = 0
+    while index < len(value):
+        if value[index] == '\\' and index + 1 < len(value):
+            characters.append(TSV_UNESCAPES.get(value[index + 1], value[index + 1]))
+            index += 2
+        else:
+            characters.append(value[index])
+            index += 1
+    return "".join(characters)
+
+
+class DirectoryTarget:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, creature):
+        """Write one creature and return a description of where it went."""
+        return "File '{}' written successfully.".format(export_creature(creature, self.path))
+
+    def close(self):
+        pass
+
+
+class JsonLinesTarget:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.path, 'w', encoding='utf-8', buffering=BUNDLE_BUFFER_SIZE)
+
+    def write(self, creature):
+        self.file.write(json.dumps(bundle_record(creature), ensure_ascii=False, separators=(',', ':')))
+        self.file.write("\n")
+        return "{} added to {}".format(creature.formal_name, self.path)
+
+    def close(self):
+        self.file.close()
+
+
+class TsvTarget(JsonLinesTarget):
+    def __init__(self, path):
+        super().__init__(path)
+        self.file.write("\t".join(BUNDLE_FIELDS) + "\n")
+
+    def write(self, creature):
+        record = bundle_record(creature)
+        self.file.write("\t".join(escape_tsv(record[field]) for field in BUNDLE_FIELDS) + "\n")
+        return "{} added to {}".format(creature.formal_name, self.path)
+
+
+class ZipTarget:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.archive = zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self.names = set()
+
+    def member_name(self, formal_name):
+        # Several creatures can share a formal name, a directory export would overwrite them
+        name = formal_name.replace('/', '-') + '.txt'
+        number = 2
+        while name in self.names:
+            name = "{} ({}).txt".format(formal_name.replace('/', '-'), number)
+            number += 1
+        self.names.add(name)
+        return name
+
+    def write(self, creature):
+        export = render_creature(creature)
+        name = self.member_name(creature.formal_name)
+        self.archive.writestr(name, export)
+        return "{} added to {}".format(name, self.path)
+
+    def close(self):
+        self.archive.close()
+
+
+BUNDLE_TARGETS = {
+    '.jsonl': JsonLinesTarget,
+    '.tsv': TsvTarget,
+    '.zip': ZipTarget,
+}
+
+
+def is_bundle(path):
+    """True when path names a bundle file, which is rewritten whole every time it is opened."""
+    return Path(path).suffix.lower() in BUNDLE_TARGETS
+
+
+def open_export_target(path):
+    """Open the export target for an output path, a bundle for the known suffixes, otherwise a directory."""
+    target_class = BUNDLE_TARGETS.get(Path(path).suffix.lower(), DirectoryTarget)
+    return target_class(path)
+
+
+def read_bundle(path):
+    """
+    Stream the records of a bundle back, one dictionary per creature.
+
+    JSONL and TSV records have the BUNDLE_FIELDS, every TSV value comes back as a string,
+    and zip records only have formal_name and export.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.jsonl':
+        with open(path, encoding='utf-8') as bundle:
+            for line in bundle:
+                yield json.loads(line)
+    elif suffix == '.tsv':
+        with open(path, encoding='utf-8') as bundle:
+            header = bundle.readline().rstrip("\n").split("\t")
+            for line in bundle:
+                yield dict(zip(header, (unescape_tsv(value) for value in line.rstrip("\n").split("\t"))))
+    elif suffix == '.zip':
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                yield {
+                    'formal_name': member.filename[:-len('.txt')],
+                    'export': archive.read(member).decode('utf-8'),
+                }
+    else:
+        raise ValueError("{} is not a .jsonl, .tsv or .zip bundle".format(path))
@@ -0,0 +1,207 @@
+import queue
+import threading
+from pathlib import Path
+import tkinter as tk
+from tkinter import ttk
+from tkinter import filedialog, messagebox
+from Database.schema import DATABASE_VERSION, Database
+
+# The forms, the parser and the batch processor, and through them SQLAlchemy and the models,
+# are imported by the menu entries that use them, so the main window opens without loading them.
+
+# How often the main window picks up the messages of a background batch, and how many per visit
+BATCH_POLL_MS = 100
+BATCH_MESSAGES_PER_POLL = 200
+BATCH_LOG = 'log'
+BATCH_PROGRESS = 'progress'
+BATCH_DONE = 'done'
+
+
+def initialize_database():
+    if messagebox.askyesno("Initialize Database", message="Do you really want to initialize the database?",
+                           detail="This will remove all information currently in the database", icon='question',):
+        from Database.create_tables import initialize_repository
+        initialize_repository(True)
+        messagebox.showinfo("Database", "Database Initialized")
+
+
+class CreatureBarn:
+    def __init__(self, root, args, application_version):
+        self.args = args
+        self.root = root
+        self.application_version = application_version
+        self.newWindow = None
+        self.app = None
+        self.root.title("Creature Stat Block Parser")
+        self.text = tk.Text(root, wrap="word", width=120, height=45)
+        self.text.pack(expand=True, fill="both")
+
+        # Shown while a batch of files is processed in the background
+        self.batch = None
+        self.batch_queue = queue.Queue()
+        self.progress_frame = ttk.Frame(root, padding=3)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, mode='determinate', length=400)
+        self.progress_bar.pack(side="left", padx=5)
+        self.progress_label = ttk.Label(self.progress_frame, text="")
+        self.progress_label.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(self.progress_frame, text="Cancel", command=self.cancel_batch)
+        self.cancel_button.pack(side="right", padx=5)
+
+        self.menu = tk.Menu(root)
+        self.file_menu = tk.Menu(self.menu, tearoff=0)
+        self.file_menu.add_command(label="Open and Parse", command=self.load)
+        self.file_menu.add_command(label="Parse", command=self.parse_screen)
+        self.file_menu.add_command(label="Exit", command=root.quit)
+        self.menu.add_cascade(label="File", menu=self.file_menu)
+
+        self.database_menu = tk.Menu(self.menu, tearoff=0)
+        self.database_menu.add_command(label="Manage Spells", state="disabled")
+        self.database_menu.add_command(label="Manage Creatures", command=self.show_creature_list)
+        self.database_menu.add_command(label="Manage NPCs", command=self.show_npc_list)
+        self.database_menu.add_command(label="Build Encounter", command=self.show_encounter_builder)
+        self.database_menu.add_separator()
+        self.database_menu.add_command(label="Initialize Database", command=initialize_database, state="disabled")
+        self.menu.add_cascade(label="Database", menu=self.database_menu)
+
+        self.help_menu = tk.Menu(self.menu, tearoff=0)
+        self.help_menu.add_command(label="About", command=self.show_about_dialog)
+        self.menu.add_cascade(label="Help", menu=self.help_menu)
+
+        root.config(menu=self.menu)
+        self.database = Database()
+
+        # Ensure the database is valid and the structure is up to date
+        # Ensure the database is valid and the structure is up to date
+        if not self.database.is_database_valid():
+            self.database_menu.entryconfig("Initialize Database", state="normal")
+        else:
+            self.database.verify_database_version()
+
+    # Function to display the "About" dialog box
+    def show_about_dialog(self):
+        """Creates and displays a custom about dialog with specified dimensions."""
+
+        # Create the Toplevel window
+        about_box = tk.Toplevel(self.root)
+        about_box.title("About")
+
+        # Specify the width and height (e.g., 300x200 pixels)
+        about_box.geometry("450x360")
+
+        # Make the window non-resizable
+        about_box.resizable(False, False)
+
+        # Center the dialog over the parent window (optional, but good practice)
+        about_box.transient(self.root) # Makes the dialog box a transient window of the root window
+        about_box.grab_set()     # Makes the dialog modal (forces user interaction)
+
+        # Add content (e.g., Labels, Buttons)
+        # Use a Message widget for multi-line text that wraps properly
+        message_text = "This is a simple creature barn to manage creature and NPC definitions.\n\nVersion {}, Database {}".format(self.application_version, DATABASE_VERSION)
+        about_message = tk.Message(about_box, text=message_text, justify=tk.CENTER,
+                                   width=400)  # width in character units
+        about_message.pack(pady=20, padx=10)
+
+        # Add an OK button to close the dialog
+        ok_button = ttk.Button(about_box, text="OK", command=about_box.destroy)
+        ok_button.pack(pady=10)
+
+    def show_creature_list(self):
+        from Forms.creatures import CreatureList
+        self.newWindow = tk.Toplevel(self.root)
+        self.app = CreatureList(self.newWindow, "Creature")
+
+    def show_npc_list(self):
+        from Forms.creatures import CreatureList
+        self.newWindow = tk.Toplevel(self.root)
+        self.app = CreatureList(self.newWindow, "NPC")
+
+    def show_encounter_builder(self):
+        from Forms.encounters import EncounterBuilder
+        self.newWindow = tk.Toplevel(self.root)
+        self.app = EncounterBuilder(self.newWindow)
+
+    def show_parsed_creature(self, creature):
+        from Forms.creatures import CreatureForm
+        self.app = CreatureForm.show(self.root, creature)
+        self.newWindow = self.app.root
+
+    def load(self):
+        file_list = filedialog.askopenfilenames(filetypes=[("Text Files", "*.txt")], initialdir="./samples")
+        if not file_list:
+            return
+        if len(file_list) == 1:
+            from Parsers.ParseCache import parse_creature
+            raw = Path(file_list[0]).read_text(encoding="utf-8")
+            creature = parse_creature(raw)
+
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, raw)
+            self.show_parsed_creature(creature)
+        else:
+            self.text.delete("1.0", tk.END)
+            self.text.insert(tk.END, "Processing selected files:\n")
+            self.start_batch(file_list)
+
+    def log_to_screen(self, message):
+        self.text.insert(tk.END, message + "\n")
+        self.text.see(tk.END)
+
+    def start_batch(self, file_list):
+        """Parse and save or export the files on a background thread, reporting back through batch_queue."""
+        if self.batch is not None:
+            messagebox.showwarning("Busy", "The previous files are still being processed")
+            return
+        from Batch.processor import BatchProcessor
+        self.batch = BatchProcessor(
+            self.args,
+            log=lambda message: self.batch_queue.put((BATCH_LOG, message)),
+            progress=lambda processed, expected: self.batch_queue.put((BATCH_PROGRESS, (processed, expected))))
+        self.progress_bar.configure(maximum=len(file_list), value=0)
+        self.progress_label.configure(text="0 of {}".format(len(file_list)))
+        self.cancel_button.configure(state="normal")
+        self.progress_frame.pack(side="bottom", fill="x")
+        threading.Thread(target=self.run_batch, args=(self.batch, file_list), daemon=True).start()
+        self.root.after(BATCH_POLL_MS, self.poll_batch)
+
+    def run_batch(self, processor, file_list):
+        # Runs on the background thread, so it must not touch any widget
+        try:
+            processor.process_files(file_list)
+        except Exception as e:
+            self.batch_queue.put((BATCH_LOG, "Processing failed: {}".format(e)))
+        finally:
+            self.batch_queue.put((BATCH_DONE, None))
+
+    def poll_batch(self):
+        for _ in range(BATCH_MESSAGES_PER_POLL):
+            try:
+                kind, value = self.batch_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == BATCH_LOG:
+                self.log_to_screen(value)
+            elif kind == BATCH_PROGRESS:
+                processed, expected = value
+                # Unchanged files are skipped before parsing, so fewer may be expected than were selected
+                self.progress_bar.configure(maximum=expected or processed, value=processed)
+                self.progress_label.configure(text="{} of {}".format(processed, expected or processed))
+            elif kind == BATCH_DONE:
+                self.batch = None
+                self.progress_frame.pack_forget()
+                return
+        self.root.after(BATCH_POLL_MS, self.poll_batch)
+
+    def cancel_batch(self):
+        if self.batch is not None:
+            self.batch.cancel()
+            self.cancel_button.configure(state="disabled")
+            self.progress_label.configure(text="Cancelling...")
+
+    def parse_screen(self):
+        text = self.text.get("1.0", tk.END)
+        if len(text) > 5:
+            from Parsers.ParseCache import parse_creature
+            self.show_parsed_creature(parse_creature(text))
+        else:
+            messagebox.showwarning("No Data", "No text to parse!")
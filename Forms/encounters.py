@@ -0,0 +1,134 @@
+from collections import Counter
+from tkinter import *
+from tkinter import ttk
+from Database.database import session_scope
+from Database.loaders import load_creature
+from Database.encounters import build_encounter, encounter_budget, find_environments, EncounterFilter, \
+    DIFFICULTIES, DEFAULT_DIFFICULTY, DEFAULT_MAX_CREATURES, BARN_TYPES
+from Forms.creatures import CreatureForm
+from Parsers.NumericStats import challenge_rating_value, integer_value
+
+ANY_BARN_TYPE = 'Any'
+# Not the "Any" environment some stat blocks have, which is matched like the others
+ANY_ENVIRONMENT = '(any)'
+
+
+class EncounterBuilder:
+    def __init__(self, root):
+        self.root = root
+        self.newWindow = None
+        self.creature_ids = []
+
+        root.title("Encounter Builder")
+
+        mainframe = ttk.Frame(root, padding=3, borderwidth=2, relief='raised')
+        mainframe.grid(column=0, row=0, padx=10, pady=10, sticky="nsew")
+
+        party_frame = ttk.LabelFrame(mainframe, text="Party")
+        party_frame.grid(row=0, column=0, sticky="ew")
+        self.party_size = StringVar(value='4')
+        self.party_level = StringVar(value='1')
+        self.difficulty = StringVar(value=DEFAULT_DIFFICULTY)
+        self.budget = StringVar()
+        ttk.Label(party_frame, text="Characters").grid(row=0, column=0)
+        ttk.Spinbox(party_frame, textvariable=self.party_size, from_=1, to=12, width=4).grid(row=0, column=1)
+        ttk.Label(party_frame, text="Average level").grid(row=0, column=2)
+        ttk.Spinbox(party_frame, textvariable=self.party_level, from_=1, to=20, width=4).grid(row=0, column=3)
+        ttk.Label(party_frame, text="Difficulty").grid(row=0, column=4)
+        ttk.Combobox(party_frame, textvariable=self.difficulty, values=list(DIFFICULTIES), state='readonly',
+                     width=12).grid(row=0, column=5)
+        ttk.Label(party_frame, text="XP budget").grid(row=0, column=6)
+        ttk.Entry(party_frame, textvariable=self.budget, width=10).grid(row=0, column=7)
+        for child in party_frame.winfo_children():
+            child.grid_configure(padx=2, pady=2)
+        # The budget follows the party, it can still be typed in directly
+        for variable in (self.party_size, self.party_level, self.difficulty):
+            variable.trace_add('write', lambda *args: self.update_budget())
+        self.update_budget()
+
+        filter_frame = ttk.LabelFrame(mainframe, text="Creatures")
+        filter_frame.grid(row=1, column=0, sticky="ew", pady=3)
+        self.environment = StringVar(value=ANY_ENVIRONMENT)
+        self.creature_type = StringVar()
+        self.min_cr = StringVar()
+        self.max_cr = StringVar()
+        self.max_creatures = StringVar(value=str(DEFAULT_MAX_CREATURES))
+        self.barn_type = StringVar(value=ANY_BARN_TYPE)
+        ttk.Label(filter_frame, text="Environment").grid(row=0, column=0)
+        # Environments are matched whole, so only the ones in the barn are offered
+        with session_scope() as session:
+            environments = find_environments(session)
+        ttk.Combobox(filter_frame, textvariable=self.environment, values=[ANY_ENVIRONMENT] + environments,
+                     state='readonly', width=24).grid(row=0, column=1)
+        ttk.Label(filter_frame, text="Type").grid(row=0, column=2)
+        ttk.Entry(filter_frame, textvariable=self.creature_type, width=14).grid(row=0, column=3)
+        ttk.Label(filter_frame, text="From").grid(row=0, column=4)
+        ttk.Combobox(filter_frame, textvariable=self.barn_type, values=[ANY_BARN_TYPE] + list(BARN_TYPES),
+                     state='readonly', width=9).grid(row=0, column=5)
+        ttk.Label(filter_frame, text="CR").grid(row=1, column=0)
+        cr_frame = ttk.Frame(filter_frame)
+        cr_frame.grid(row=1, column=1, sticky="w")
+        ttk.Entry(cr_frame, textvariable=self.min_cr, width=5).grid(row=0, column=0)
+        ttk.Label(cr_frame, text="to").grid(row=0, column=1, padx=2)
+        ttk.Entry(cr_frame, textvariable=self.max_cr, width=5).grid(row=0, column=2)
+        ttk.Label(filter_frame, text="At most").grid(row=1, column=2)
+        ttk.Spinbox(filter_frame, textvariable=self.max_creatures, from_=1, to=20, width=4).grid(row=1, column=3,
+                                                                                                 sticky="w")
+        ttk.Button(filter_frame, text="Generate", command=self.on_generate).grid(row=1, column=5, sticky="e")
+        for child in filter_frame.winfo_children():
+            child.grid_configure(padx=2, pady=2)
+
+        self.encounter_list = Listbox(mainframe, height=12, width=70)
+        self.encounter_list.grid(row=2, column=0, sticky="nsew")
+        self.encounter_list.bind('<Double-Button-1>', lambda event: self.show_creature())
+        self.total_label = ttk.Label(mainframe, text="")
+        self.total_label.grid(row=3, column=0, sticky="w")
+
+    def update_budget(self):
+        party_size = integer_value(self.party_size.get())
+        party_level = integer_value(self.party_level.get())
+        if party_size and party_level:
+            self.budget.set(str(encounter_budget(party_size, party_level, self.difficulty.get())))
+
+    def encounter_filter(self):
+        barn_type = self.barn_type.get()
+        environment = self.environment.get()
+        return EncounterFilter(
+            environment=None if environment == ANY_ENVIRONMENT else environment,
+            creature_type=self.creature_type.get().strip() or None,
+            min_challenge_rating=challenge_rating_value(self.min_cr.get()),
+            max_challenge_rating=challenge_rating_value(self.max_cr.get()),
+            barn_types=BARN_TYPES if barn_type == ANY_BARN_TYPE else (barn_type,))
+
+    def on_generate(self):
+        budget = integer_value(self.budget.get())
+        if not budget:
+            self.total_label.configure(text="Enter an XP budget")
+            return
+        with session_scope() as session:
+            encounter = build_encounter(session, budget, self.encounter_filter(),
+                                        max_creatures=integer_value(self.max_creatures.get()) or DEFAULT_MAX_CREATURES)
+
+        # One line per creature, with how many of it the encounter has
+        counts = Counter(creature.id for creature in encounter.creatures)
+        self.encounter_list.delete(0, END)
+        self.creature_ids = []
+        for creature in encounter.creatures:
+            if creature.id in self.creature_ids:
+                continue
+            self.creature_ids.append(creature.id)
+            self.encounter_list.insert(END, "{} x {}  CR {}, {:,} XP".format(
+                counts[creature.id], creature.formal_name, creature.challenge_rating,
+                creature.experience_points_value))
+        if encounter.creatures:
+            self.total_label.configure(text="{} creature(s), {:,} XP for a budget of {:,} XP".format(
+                len(encounter.creatures), encounter.total_experience, budget))
+        else:
+            self.total_label.configure(text="No creatures match")
+
+    def show_creature(self):
+        selection = self.encounter_list.curselection()
+        if selection:
+            with session_scope() as session:
+                creature = load_creature(session, self.creature_ids[selection[0]])
+            CreatureForm.show(self.root, creature)
@@ -1,8 +1,12 @@
-from Database.models import Creature, CreatureLanguages, CreatureFeats, CreatureSkills, CreatureSenses, CreatureAuras, \
-    CreatureACModifiers, CreatureWeaknesses, CreatureImmuneModifiers, CreatureSpellResistenceModifiers, \
-    CreatureSpellLikeAbilities, CreatureKnownSpells, CreaturePreparedSpells, CreatureSpeedModifiers, \
-    CreatureMeleeAttacks, CreatureRangedAttacks, CreatureSpecialQualities, CreatureSpecialAttacks, \
-    CreatureDefenseAbilities, CreatureSpecialAbilities, CreatureGearItems
+from Parsers.ParsedCreature import ParsedCreature, ParsedLanguage, ParsedFeat, ParsedSkill, ParsedSense, ParsedAura, \
+    ParsedACModifier, ParsedWeakness, ParsedImmunity, ParsedSpellResistance, ParsedSpellLikeAbility, ParsedKnownSpell, \
+    ParsedPreparedSpell, ParsedSpeedModifier, ParsedAttack, ParsedSpecialQuality, ParsedDefensiveAbility, \
+    ParsedSpecialAbility, ParsedGearItem
+from Parsers.NumericStats import set_numeric_values
+from Parsers.ParserTrace import get_default_trace
+from Parsers.ParserProfile import get_default_profile
+from time import perf_counter
+from types import FunctionType
 import re
 
 
@@ -21,13 +25,13 @@ def transition_parse_formal_name(fsm_obj):
     fsm_obj.creature.formal_name = fsm_obj.current_line.strip()
 
 def transition_parse_common_name(fsm_obj):
-    name_match = re.match(R_COMMON_NAME, fsm_obj.current_line)
+    name_match = RE_COMMON_NAME.match(fsm_obj.current_line)
     if name_match:
         fsm_obj.creature.common_name = name_match.group(1).strip()
         if fsm_obj.creature.formal_name == '':
             fsm_obj.creature.formal_name = fsm_obj.creature.common_name
 
-    cr_match = re.search(r"CR\s+([\d/]+)", fsm_obj.current_line, re.IGNORECASE)
+    cr_match = RE_CHALLENGE_RATING.search(fsm_obj.current_line)
     if cr_match:
         fsm_obj.creature.challenge_rating = cr_match.group(1)
 
@@ -42,27 +46,23 @@ def transition_parse_description(fsm_obj):
     fsm_obj.creature.description = description
 
 def transition_parse_experience_points(fsm_obj):
-    xp_match = re.search(R_EXPERIENCE, fsm_obj.current_line, re.IGNORECASE)
+    xp_match = RE_EXPERIENCE.search(fsm_obj.current_line)
     if xp_match:
         fsm_obj.creature.experience_points = xp_match.group(1)
 
 def transition_parse_alignment(fsm_obj):
-    type_match = re.match(
-        r"(?P<alignment>[LNCEG]{1,2})\s+(?P<size>\w+)?\s+(?P<type>[^\n]+)",
-        fsm_obj.current_line,
-        re.IGNORECASE,
-    )
+    type_match = RE_ALIGNMENT_SIZE_TYPE.match(fsm_obj.current_line)
     if type_match:
         fsm_obj.creature.alignment = type_match.group("alignment").upper()
         fsm_obj.creature.size = type_match.group("size") or ""
         type_sub_type = type_match.group("type").strip().title()
-        matches = re.match("(.+) (\\((.+)\\))", type_sub_type)
+        matches = RE_TYPE_SUB_TYPE.match(type_sub_type)
         if matches:
             fsm_obj.creature.type = matches.group(1)
             if matches.group(3):
                 fsm_obj.creature.sub_type = matches.group(3)
         else:
-            matches = re.match("(.+)", type_sub_type)
+            matches = RE_TYPE.match(type_sub_type)
             if matches:
                 fsm_obj.creature.type = matches.group(1)
 
@@ -75,48 +75,47 @@ def transition_parse_race(fsm_obj):
 def transition_parse_initiative(fsm_obj):
     parts = fsm_obj.current_line.split(';')
     for part in parts:
-        init_match = re.search(r"Init\s+([^\n;]+)", part, re.IGNORECASE)
+        init_match = RE_INITIATIVE.search(part)
         if init_match:
             fsm_obj.creature.initiative = init_match.group(1).strip()
 
-        perceptions_match = re.search(r"Perception ([+\d]+)", part, re.IGNORECASE)
+        perceptions_match = RE_PERCEPTION.search(part)
         if perceptions_match:
             fsm_obj.creature.perception_modifier = perceptions_match.group(1).strip()
 
-        senses_match = re.search(r"Senses\s+(.*)", part, re.IGNORECASE)
+        senses_match = RE_SENSES.search(part)
         if senses_match:
             senses = _normalize_mixed_case(senses_match.group(1)).split(",")
             for sense in senses:
-                perceptions_match = re.search(r"Perception ([+\d]+)", sense, re.IGNORECASE)
+                perceptions_match = RE_PERCEPTION.search(sense)
                 if perceptions_match:
                     fsm_obj.creature.perception_modifier = perceptions_match.group(1).strip()
                 else:
-                    creature_senses = CreatureSenses()
+                    creature_senses = ParsedSense()
                     creature_senses.sense = sense.strip()
                     fsm_obj.creature.senses.append(creature_senses)
 
-        aura_match = re.search(r"Aura\s+(.+)", part, re.IGNORECASE)
+        aura_match = RE_AURA_IGNORE_CASE.search(part)
         if aura_match:
             fsm_obj.current_line = part
             transition_parse_auras(fsm_obj)
 
 def transition_parse_auras(fsm_obj):
-    aura_match = re.search(r"Aura\s+(.+)", fsm_obj.current_line)
+    aura_match = RE_AURA.search(fsm_obj.current_line)
     if aura_match:
-        aura_details = re.findall(r"([, ]*(.+?)\s\((.+?),\s(.+?)\))+?", aura_match.group(1), re.IGNORECASE)
+        aura_details = RE_AURA_DETAILS.findall(aura_match.group(1))
         if aura_details:
             for aura_detail in aura_details:
-                creature_auras = CreatureAuras()
+                creature_auras = ParsedAura()
                 creature_auras.aura = aura_detail[1].strip()
                 creature_auras.radius = aura_detail[2].strip()
                 creature_auras.save_role = aura_detail[3].strip()
                 fsm_obj.creature.auras.append(creature_auras)
 
 def transition_parse_armor_class(fsm_obj):
-    ac_match = re.search(r"AC\s([+\d]+), touch\s([+\d]+), flat-footed\s([+\d]+) \((.+)\)", fsm_obj.current_line, re.IGNORECASE)
+    ac_match = RE_ARMOR_CLASS_MODIFIED.search(fsm_obj.current_line)
     if not ac_match:
-        ac_match = re.search(r"AC\s([+\d]+), touch\s([+\d]+), flat-footed\s([+\d]+)", fsm_obj.current_line,
-                             re.IGNORECASE)
+        ac_match = RE_ARMOR_CLASS.search(fsm_obj.current_line)
     if ac_match:
         fsm_obj.creature.base_armor_class = ac_match.group(1)
         fsm_obj.creature.touch_armor_class = ac_match.group(2)
@@ -124,15 +123,15 @@ def transition_parse_armor_class(fsm_obj):
         if len(ac_match.groups()) > 3:
             modifiers = ac_match.group(4).split(",")
             for modifier in modifiers:
-                mod_match = re.search(r"(.\d+)\s(.+)", modifier)
+                mod_match = RE_AC_MODIFIER.search(modifier)
                 if mod_match:
-                    creature_ac_modifiers = CreatureACModifiers()
+                    creature_ac_modifiers = ParsedACModifier()
                     creature_ac_modifiers.modifier_amount = mod_match.group(1).strip()
                     creature_ac_modifiers.modifier_type = mod_match.group(2).strip()
                     fsm_obj.creature.ac_modifiers.append(creature_ac_modifiers)
 
 def transition_parse_hit_points(fsm_obj):
-    hp_match = re.search(r"HP\s(\d+)\s\((.+)\)", fsm_obj.current_line, re.IGNORECASE)
+    hp_match = RE_HIT_POINTS.search(fsm_obj.current_line)
     if hp_match:
         fsm_obj.creature.hit_points = hp_match.group(1).strip()
         if hp_match.group(2):
@@ -141,7 +140,7 @@ def transition_parse_hit_points(fsm_obj):
 
 def transition_parse_fortitude(fsm_obj):
     fortitude = fsm_obj.current_line.split(';')
-    match_fortitude = re.findall(r"(Fort|Ref|Will)\s*([+\-]?\d+)", fortitude[0], re.IGNORECASE)
+    match_fortitude = RE_SAVES.findall(fortitude[0])
     for stat, val in match_fortitude:
         stat_name = stat.capitalize()
         if stat_name == "Fort":
@@ -155,153 +154,153 @@ def transition_parse_fortitude(fsm_obj):
         fsm_obj.creature.will_modifiers = fortitude[1].strip()
 
 def transition_parse_weakness(fsm_obj):
-    weakness_match = re.search(r"Weaknesses\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    weakness_match = RE_WEAKNESSES.search(fsm_obj.current_line)
     if weakness_match:
         for weakness in _normalize_mixed_case(weakness_match.group(1)).split(","):
-            creature_weakness = CreatureWeaknesses()
+            creature_weakness = ParsedWeakness()
             creature_weakness.weakness = weakness.strip()
             fsm_obj.creature.weaknesses.append(creature_weakness)
 
 def transition_parse_damage_resistance(fsm_obj):
     parts = fsm_obj.current_line.split(';')
     for part in parts:
-        damage_reduction_match = re.search(r"DR\s+(.+)", part, re.IGNORECASE)
+        damage_reduction_match = RE_DAMAGE_REDUCTION.search(part)
         if damage_reduction_match:
             fsm_obj.creature.damage_reduction = damage_reduction_match.group(1).strip()
 
-        spell_reduction_match = re.search(r"SR\s+(.+)", part, re.IGNORECASE)
+        spell_reduction_match = RE_SPELL_RESISTANCE.search(part)
         if spell_reduction_match:
             fsm_obj.creature.spell_resistence = spell_reduction_match.group(1).strip()
 
-        defence_ability_match = re.search(r"Defensive Abilities\s+(.+)", part, re.IGNORECASE)
+        defence_ability_match = RE_DEFENSIVE_ABILITIES.search(part)
         if defence_ability_match:
             abilities = _normalize_mixed_case(defence_ability_match.group(1)).split(",")
             for ability in abilities:
-                creature_defense_ability = CreatureDefenseAbilities()
+                creature_defense_ability = ParsedDefensiveAbility()
                 creature_defense_ability.ability = ability.strip()
                 fsm_obj.creature.defensive_abilities.append(creature_defense_ability)
 
-        immunity_match = re.search(r"Immune\s+(.+)", part, re.IGNORECASE)
+        immunity_match = RE_IMMUNE.search(part)
         if immunity_match:
             immunities = _normalize_mixed_case(immunity_match.group(1)).split(",")
             for immunity in immunities:
-                creature_immunity = CreatureImmuneModifiers()
+                creature_immunity = ParsedImmunity()
                 creature_immunity.immune_to = immunity.strip()
                 fsm_obj.creature.immune_modifiers.append(creature_immunity)
 
-        resist_match = re.search(r"Resist\s+(.+)", part, re.IGNORECASE)
+        resist_match = RE_RESIST.search(part)
         if resist_match:
             resists = _normalize_mixed_case(resist_match.group(1)).split(",")
             for resist in resists:
-                resistance_match = re.search(r"(.+)\s(\d+)", resist)
+                resistance_match = RE_RESIST_AMOUNT.search(resist)
                 if resistance_match:
-                    creature_resists = CreatureSpellResistenceModifiers()
+                    creature_resists = ParsedSpellResistance()
                     creature_resists.resists = resistance_match.group(1).strip()
                     creature_resists.resist_amount = resistance_match.group(2).strip()
                     fsm_obj.creature.sr_modifiers.append(creature_resists)
 
 def transition_parse_speed(fsm_obj):
-    speed_match = re.search(R_SPEED, fsm_obj.current_line, re.IGNORECASE)
+    speed_match = RE_SPEED.search(fsm_obj.current_line)
     if speed_match:
-        speeds = re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, speed_match.group(1))
+        speeds = RE_SPLIT_COMMA_OUTSIDE_PARENS.split(speed_match.group(1))
         base_speed = speeds[0]
         fsm_obj.creature.speed = base_speed.strip()
         for speed in speeds:
             if speed != base_speed:
-                creature_speed_modifier = CreatureSpeedModifiers()
+                creature_speed_modifier = ParsedSpeedModifier()
                 creature_speed_modifier.speed_modifier = speed.strip()
                 fsm_obj.creature.speed_modifiers.append(creature_speed_modifier)
 
 def transition_parse_melee(fsm_obj):
-    melee_match = re.search(R_MELEE, fsm_obj.current_line, re.IGNORECASE)
+    melee_match = RE_MELEE.search(fsm_obj.current_line)
     if melee_match:
         if " or " in melee_match.group(1):
             melee_attacks = melee_match.group(1).split(" or ")
         else:
-            melee_attacks = re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, melee_match.group(1))
+            melee_attacks = RE_SPLIT_COMMA_OUTSIDE_PARENS.split(melee_match.group(1))
         for melee_attack in melee_attacks:
-            creature_melee = CreatureMeleeAttacks()
+            creature_melee = ParsedAttack()
             creature_melee.attack = melee_attack.strip()
             fsm_obj.creature.melee_attacks.append(creature_melee)
 
 def transition_parse_ranged(fsm_obj):
-    ranged_match = re.search(R_RANGED, fsm_obj.current_line, re.IGNORECASE)
+    ranged_match = RE_RANGED.search(fsm_obj.current_line)
     if ranged_match:
         if " or " in ranged_match.group(1):
             ranged_attacks = ranged_match.group(1).split(" or ")
         else:
-            ranged_attacks = re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, ranged_match.group(1))
+            ranged_attacks = RE_SPLIT_COMMA_OUTSIDE_PARENS.split(ranged_match.group(1))
         for ranged_attack in ranged_attacks:
-            creature_ranged = CreatureRangedAttacks()
+            creature_ranged = ParsedAttack()
             creature_ranged.attack = ranged_attack.strip()
             fsm_obj.creature.ranged_attacks.append(creature_ranged)
 
 def transition_parse_space(fsm_obj):
-    space_match = re.search(R_SPACE, fsm_obj.current_line, re.IGNORECASE)
+    space_match = RE_SPACE.search(fsm_obj.current_line)
     if space_match:
         parts = space_match.group(1).split("; ")
         for part in parts:
-            reach_match = re.search(R_REACH, part, re.IGNORECASE)
+            reach_match = RE_REACH.search(part)
             if reach_match:
                 fsm_obj.creature.reach = reach_match.group(1).strip()
             else:
                 fsm_obj.creature.space = part.strip()
 
 def transition_parse_special_attacks(fsm_obj):
-    special_attack_match = re.search(r"Special Attacks\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    special_attack_match = RE_SPECIAL_ATTACKS.search(fsm_obj.current_line)
     if special_attack_match:
-        for special_attack in re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, special_attack_match.group(1)):
-            creature_special_attack = CreatureSpecialAttacks()
+        for special_attack in RE_SPLIT_COMMA_OUTSIDE_PARENS.split(special_attack_match.group(1)):
+            creature_special_attack = ParsedAttack()
             creature_special_attack.attack = special_attack.strip()
             fsm_obj.creature.special_attacks.append(creature_special_attack)
 
 
 def transition_parse_spell_like_abilities(fsm_obj):
-    spell_like_match = re.search(r"(.*)Spell-Like Abilities\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_like_match = RE_SPELL_LIKE_ABILITIES.search(fsm_obj.current_line)
     if spell_like_match:
         fsm_obj.creature.spell_like_type = spell_like_match.group(1).strip()
         fsm_obj.creature.spell_like_caster_level = spell_like_match.group(2).strip()
 
 def transition_parse_sla_spells(fsm_obj):
-    spell_like_match = re.search(r"(.+)—(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_like_match = RE_SPELL_LIST.search(fsm_obj.current_line)
     if spell_like_match:
         spell_rate = spell_like_match.group(1).strip()
 
-        for spell_like in re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, spell_like_match.group(2)):
-            spells_match = re.search(r"(.+)\((.+)\)", spell_like)
+        for spell_like in RE_SPLIT_COMMA_OUTSIDE_PARENS.split(spell_like_match.group(2)):
+            spells_match = RE_SPELL_MODIFIERS.search(spell_like)
             if spells_match:
                 name = spells_match.group(1).strip()
                 modifiers = spells_match.group(2).strip()
             else:
                 name = spell_like.strip()
                 modifiers = ""
-            creature_spell_like_ability = CreatureSpellLikeAbilities()
+            creature_spell_like_ability = ParsedSpellLikeAbility()
             creature_spell_like_ability.rate = spell_rate
             creature_spell_like_ability.name = name
             creature_spell_like_ability.modifiers = modifiers
             fsm_obj.creature.spell_like_abilities.append(creature_spell_like_ability)
 
 def transition_parse_spells_known(fsm_obj):
-    spell_known_match = re.search(r"(.*)Spells Known\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_known_match = RE_SPELLS_KNOWN.search(fsm_obj.current_line)
     if spell_known_match:
         fsm_obj.creature.spell_known_type = spell_known_match.group(1).strip()
         fsm_obj.creature.spell_known_caster_level = spell_known_match.group(2).strip()
 
 def transition_parse_sk_spells(fsm_obj):
-    spell_known_match = re.search(r"(.+) (\(.+\))?—(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_known_match = RE_KNOWN_SPELL_LIST.search(fsm_obj.current_line)
     if spell_known_match:
         spell_level = spell_known_match.group(1).strip()
         spell_rate = spell_known_match.group(2).strip()
 
-        for spells in re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, spell_known_match.group(3)):
-            spells_match = re.search(r"(.+)\((.+)\)", spells)
+        for spells in RE_SPLIT_COMMA_OUTSIDE_PARENS.split(spell_known_match.group(3)):
+            spells_match = RE_SPELL_MODIFIERS.search(spells)
             if spells_match:
                 name = spells_match.group(1).strip().lower()
                 modifiers = spells_match.group(2).strip()
             else:
                 name = spells.strip().lower()
                 modifiers = ""
-            creature_known_spell = CreatureKnownSpells()
+            creature_known_spell = ParsedKnownSpell()
             creature_known_spell.spell_level = spell_level
             creature_known_spell.rate = spell_rate
             creature_known_spell.name = name
@@ -309,25 +308,25 @@ def transition_parse_sk_spells(fsm_obj):
             fsm_obj.creature.known_spells.append(creature_known_spell)
 
 def transition_parse_spells_prepared(fsm_obj):
-    spell_prepared_match = re.search(r"(.*)Spells Prepared\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_prepared_match = RE_SPELLS_PREPARED.search(fsm_obj.current_line)
     if spell_prepared_match:
         fsm_obj.creature.spell_prepared_type = spell_prepared_match.group(1).strip()
         fsm_obj.creature.spell_prepared_caster_level = spell_prepared_match.group(2).strip()
 
 def transition_parse_sp_spells(fsm_obj):
-    spell_prepared_match = re.search(r"(.+)—(.+)", fsm_obj.current_line, re.IGNORECASE)
+    spell_prepared_match = RE_SPELL_LIST.search(fsm_obj.current_line)
     if spell_prepared_match:
         spell_level = spell_prepared_match.group(1).strip()
 
-        for spells in re.split(R_SPLIT_COMMA_OUTSIDE_PARENS, spell_prepared_match.group(2)):
-            spells_match = re.search(r"(.+)\((.+)\)", spells)
+        for spells in RE_SPLIT_COMMA_OUTSIDE_PARENS.split(spell_prepared_match.group(2)):
+            spells_match = RE_SPELL_MODIFIERS.search(spells)
             if spells_match:
                 name = spells_match.group(1).strip().lower()
                 modifiers = spells_match.group(2).strip()
             else:
                 name = spells.strip().lower()
                 modifiers = ""
-            creature_prepared_spell = CreaturePreparedSpells()
+            creature_prepared_spell = ParsedPreparedSpell()
             creature_prepared_spell.spell_level = spell_level
             creature_prepared_spell.name = name
             creature_prepared_spell.modifiers = modifiers
@@ -342,7 +341,7 @@ def transition_parse_tactics(fsm_obj):
     fsm_obj.creature.tactics = tactics
 
 def transition_parse_strength(fsm_obj):
-    match_strength = re.findall(r"(Str|Dex|Con|Int|Wis|Cha)\s*([+\-]?\d+)", fsm_obj.current_line, re.IGNORECASE)
+    match_strength = RE_ABILITY_SCORES.findall(fsm_obj.current_line)
     for stat, val in match_strength:
         stat_name = stat.capitalize()
         if stat_name == "Str":
@@ -359,7 +358,7 @@ def transition_parse_strength(fsm_obj):
             fsm_obj.creature.charisma = val
 
 def transition_parse_base_attack(fsm_obj):
-    match_attack = re.findall(r"(Base Atk|CMB|CMD)\s*([+\-]?\d+)", fsm_obj.current_line, re.IGNORECASE)
+    match_attack = RE_ATTACK_BONUSES.findall(fsm_obj.current_line)
     for stat, val in match_attack:
         stat_name = stat.capitalize()
         if stat_name == "Base atk":
@@ -370,44 +369,44 @@ def transition_parse_base_attack(fsm_obj):
             fsm_obj.creature.combat_maneuver_defense = val
 
 def transition_parse_feats(fsm_obj):
-    feat_match = re.search(r"Feats\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    feat_match = RE_FEATS.search(fsm_obj.current_line)
     if feat_match:
         for feat in _normalize_mixed_case(feat_match.group(1)).split(","):
-            creature_feat = CreatureFeats()
+            creature_feat = ParsedFeat()
             creature_feat.feat = feat.strip()
             fsm_obj.creature.feats.append(creature_feat)
 
 def transition_parse_skills(fsm_obj):
-    skills_match = re.search(r"Skills\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    skills_match = RE_SKILLS.search(fsm_obj.current_line)
     if skills_match:
         parts = skills_match.group(1).split(";")
         for part in parts:
-            racial_match = re.search(r"Racial Modifiers\s(.+)", part, re.IGNORECASE)
+            racial_match = RE_RACIAL_MODIFIERS.search(part)
             if racial_match:
                 fsm_obj.creature.racial_modifiers = racial_match.group(1).strip()
             else:
                 skills = _normalize_mixed_case(part).split(",")
                 for skill in skills:
-                    skill_match = re.search(r"(.+)\s([+\-]?\d+)", skill, re.IGNORECASE)
+                    skill_match = RE_SKILL_MODIFIER.search(skill)
                     if skill_match:
-                        creature_skill = CreatureSkills()
+                        creature_skill = ParsedSkill()
                         creature_skill.skill = skill_match.group(1).strip()
                         creature_skill.modifier = skill_match.group(2).strip()
                         fsm_obj.creature.skills.append(creature_skill)
 
 def transition_parse_languages(fsm_obj):
-    language_match = re.search(r"Languages\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    language_match = RE_LANGUAGES.search(fsm_obj.current_line)
     if language_match:
         for language in _normalize_mixed_case(language_match.group(1)).split(","):
-            creature_language = CreatureLanguages()
+            creature_language = ParsedLanguage()
             creature_language.language = language.strip()
             fsm_obj.creature.languages.append(creature_language)
 
 def transition_parse_special_qualities(fsm_obj):
-    special_qualities_match = re.search(r"SQ\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    special_qualities_match = RE_SPECIAL_QUALITIES.search(fsm_obj.current_line)
     if special_qualities_match:
         for special_quality in _normalize_mixed_case(special_qualities_match.group(1)).split(","):
-            creature_special_quality = CreatureSpecialQualities()
+            creature_special_quality = ParsedSpecialQuality()
             creature_special_quality.special_quality = special_quality.strip()
             fsm_obj.creature.special_qualities.append(creature_special_quality)
 
@@ -423,15 +422,15 @@ def transition_parse_gear_list(fsm_obj):
 
 
 def transition_parse_gear_item(fsm_obj):
-    gear_item_match = re.search(r"Unique Item: (.+)", fsm_obj.current_line, re.IGNORECASE)
+    gear_item_match = RE_UNIQUE_ITEM.search(fsm_obj.current_line)
     if gear_item_match:
         if fsm_obj.gear_item:
             fsm_obj.creature.gear_items.append(fsm_obj.gear_item)
-        fsm_obj.gear_item = CreatureGearItems()
+        fsm_obj.gear_item = ParsedGearItem()
         fsm_obj.gear_item.name = gear_item_match.group(1).strip()
 
 def transition_parse_gear_description(fsm_obj):
-    gear_item_match = re.search(R_ANYTHING, fsm_obj.current_line, re.IGNORECASE)
+    gear_item_match = RE_ANYTHING.search(fsm_obj.current_line)
     if gear_item_match:
         description = fsm_obj.gear_item.description
         if description:
@@ -447,16 +446,16 @@ def transition_parse_save_gear_item(fsm_obj):
         fsm_obj.gear_item = None
 
 def transition_parse_special_ability_name(fsm_obj):
-    special_ability_match = re.search(r"(.+) (\(.+\))", fsm_obj.current_line, re.IGNORECASE)
+    special_ability_match = RE_SPECIAL_ABILITY_NAME.search(fsm_obj.current_line)
     if special_ability_match:
         if fsm_obj.special_ability:
             fsm_obj.creature.special_abilities.append(fsm_obj.special_ability)
-        fsm_obj.special_ability = CreatureSpecialAbilities()
+        fsm_obj.special_ability = ParsedSpecialAbility()
         fsm_obj.special_ability.ability = special_ability_match.group(1).strip()
         fsm_obj.special_ability.type = special_ability_match.group(2).strip()
 
 def transition_parse_special_ability_description(fsm_obj):
-    special_ability_match = re.search(R_ANYTHING,fsm_obj.current_line, re.IGNORECASE)
+    special_ability_match = RE_ANYTHING.search(fsm_obj.current_line)
     if special_ability_match:
         fsm_obj.special_ability.description = special_ability_match.group(1).strip()
 
@@ -466,17 +465,17 @@ def transition_parse_save_special_ability(fsm_obj):
         fsm_obj.special_ability = None
 
 def transition_parse_environment(fsm_obj):
-    environment_match = re.search(r"Environment\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    environment_match = RE_ENVIRONMENT.search(fsm_obj.current_line)
     if environment_match:
         fsm_obj.creature.environment = _normalize_mixed_case(environment_match.group(1)).strip()
 
 def transition_parse_organization(fsm_obj):
-    organization_match = re.search(r"Organization\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    organization_match = RE_ORGANIZATION.search(fsm_obj.current_line)
     if organization_match:
         fsm_obj.creature.organization = _normalize_mixed_case(organization_match.group(1)).strip()
 
 def transition_parse_treasure(fsm_obj):
-    treasure_match = re.search(r"Treasure\s+(.+)", fsm_obj.current_line, re.IGNORECASE)
+    treasure_match = RE_TREASURE.search(fsm_obj.current_line)
     if treasure_match:
         fsm_obj.creature.treasure = _normalize_mixed_case(treasure_match.group(1)).strip()
 
@@ -588,9 +587,66 @@ R_MELEE = r"^Melee\s+(.+)"
 R_RANGED = r"^Ranged\s+(.+)"
 R_SPACE = r"^Space\s+(.+)"
 R_REACH = r"Reach\s+(.+)"
-R_GEAR_LIST =  r"(.* )*Gear (.+)"
+R_GEAR_LIST = r"(?:.* )?Gear (.+)"
 R_SPLIT_COMMA_OUTSIDE_PARENS = r',\s*(?![^()]*\))'
 
+# Compiled patterns used by the transition callbacks.  Callbacks must only use these,
+# never re.search/re.match/etc. with a literal pattern, so nothing is recompiled or looked
+# up in the re module cache while parsing.
+RE_COMMON_NAME = re.compile(R_COMMON_NAME)
+RE_CHALLENGE_RATING = re.compile(r"CR\s+([\d/]+)", re.IGNORECASE)
+RE_EXPERIENCE = re.compile(R_EXPERIENCE, re.IGNORECASE)
+RE_ALIGNMENT_SIZE_TYPE = re.compile(r"(?P<alignment>[LNCEG]{1,2})\s+(?P<size>\w+)?\s+(?P<type>[^\n]+)", re.IGNORECASE)
+RE_TYPE_SUB_TYPE = re.compile("(.+) (\\((.+)\\))")
+RE_TYPE = re.compile("(.+)")
+RE_INITIATIVE = re.compile(r"Init\s+([^\n;]+)", re.IGNORECASE)
+RE_PERCEPTION = re.compile(r"Perception ([+\d]+)", re.IGNORECASE)
+RE_SENSES = re.compile(r"Senses\s+(.*)", re.IGNORECASE)
+RE_AURA_IGNORE_CASE = re.compile(r"Aura\s+(.+)", re.IGNORECASE)
+RE_AURA = re.compile(r"Aura\s+(.+)")
+RE_AURA_DETAILS = re.compile(r"([, ]*(.+?)\s\((.+?),\s(.+?)\))+?", re.IGNORECASE)
+RE_ARMOR_CLASS_MODIFIED = re.compile(r"AC\s([+\d]+), touch\s([+\d]+), flat-footed\s([+\d]+) \((.+)\)", re.IGNORECASE)
+RE_ARMOR_CLASS = re.compile(r"AC\s([+\d]+), touch\s([+\d]+), flat-footed\s([+\d]+)", re.IGNORECASE)
+RE_AC_MODIFIER = re.compile(r"(.\d+)\s(.+)")
+RE_HIT_POINTS = re.compile(r"HP\s(\d+)\s\((.+)\)", re.IGNORECASE)
+RE_SAVES = re.compile(r"(Fort|Ref|Will)\s*([+\-]?\d+)", re.IGNORECASE)
+RE_WEAKNESSES = re.compile(r"Weaknesses\s+(.+)", re.IGNORECASE)
+RE_DAMAGE_REDUCTION = re.compile(r"DR\s+(.+)", re.IGNORECASE)
+RE_SPELL_RESISTANCE = re.compile(r"SR\s+(.+)", re.IGNORECASE)
+RE_DEFENSIVE_ABILITIES = re.compile(r"Defensive Abilities\s+(.+)", re.IGNORECASE)
+RE_IMMUNE = re.compile(r"Immune\s+(.+)", re.IGNORECASE)
+RE_RESIST = re.compile(r"Resist\s+(.+)", re.IGNORECASE)
+RE_RESIST_AMOUNT = re.compile(r"(.+)\s(\d+)")
+RE_SPEED = re.compile(R_SPEED, re.IGNORECASE)
+RE_SPLIT_COMMA_OUTSIDE_PARENS = re.compile(R_SPLIT_COMMA_OUTSIDE_PARENS)
+RE_MELEE = re.compile(R_MELEE, re.IGNORECASE)
+RE_RANGED = re.compile(R_RANGED, re.IGNORECASE)
+RE_SPACE = re.compile(R_SPACE, re.IGNORECASE)
+RE_REACH = re.compile(R_REACH, re.IGNORECASE)
+RE_SPECIAL_ATTACKS = re.compile(r"Special Attacks\s+(.+)", re.IGNORECASE)
+RE_SPELL_LIKE_ABILITIES = re.compile(r"(.*)Spell-Like Abilities\s+(.+)", re.IGNORECASE)
+RE_SPELL_LIST = re.compile(r"(.+)—(.+)", re.IGNORECASE)
+RE_SPELL_MODIFIERS = re.compile(r"(.+)\((.+)\)")
+RE_SPELLS_KNOWN = re.compile(r"(.*)Spells Known\s+(.+)", re.IGNORECASE)
+RE_KNOWN_SPELL_LIST = re.compile(r"(.+) (\(.+\))?—(.+)", re.IGNORECASE)
+RE_SPELLS_PREPARED = re.compile(r"(.*)Spells Prepared\s+(.+)", re.IGNORECASE)
+RE_ABILITY_SCORES = re.compile(r"(Str|Dex|Con|Int|Wis|Cha)\s*([+\-]?\d+)", re.IGNORECASE)
+RE_ATTACK_BONUSES = re.compile(r"(Base Atk|CMB|CMD)\s*([+\-]?\d+)", re.IGNORECASE)
+RE_FEATS = re.compile(r"Feats\s+(.+)", re.IGNORECASE)
+RE_SKILLS = re.compile(r"Skills\s+(.+)", re.IGNORECASE)
+RE_RACIAL_MODIFIERS = re.compile(r"Racial Modifiers\s(.+)", re.IGNORECASE)
+RE_SKILL_MODIFIER = re.compile(r"(.+)\s([+\-]?\d+)", re.IGNORECASE)
+RE_LANGUAGES = re.compile(r"Languages\s+(.+)", re.IGNORECASE)
+RE_SPECIAL_QUALITIES = re.compile(r"SQ\s+(.+)", re.IGNORECASE)
+RE_UNIQUE_ITEM = re.compile(r"Unique Item: (.+)", re.IGNORECASE)
+RE_ANYTHING = re.compile(R_ANYTHING, re.IGNORECASE)
+RE_SPECIAL_ABILITY_NAME = re.compile(r"(.+) (\(.+\))", re.IGNORECASE)
+RE_ENVIRONMENT = re.compile(r"Environment\s+(.+)", re.IGNORECASE)
+RE_ORGANIZATION = re.compile(r"Organization\s+(.+)", re.IGNORECASE)
+RE_TREASURE = re.compile(r"Treasure\s+(.+)", re.IGNORECASE)
+RE_CRLF = re.compile(r"\r\n")
+RE_BLANK_LINES = re.compile(r"\n+")
+
 FSM_MAP = [
     #  {'src':, 'dst':, 'condition':, 'callback': },
     {'src': S_INITIAL_LOAD, 'dst': S_FOUND_COMMON_NAME, 'cond': R_COMMON_NAME, 'callback': T_PARSE_COMMON_NAME},  # 2
@@ -723,9 +779,97 @@ FSM_MAP = [
 for map_item in FSM_MAP:
     map_item['condition_re_compiled'] = re.compile(map_item['cond'], re.IGNORECASE)
 
+# FSM_MAP indexed by source state, so each line only tests the transitions that can fire from
+# the current state.  The order within a state is the order in FSM_MAP, first match wins.
+FSM_TRANSITIONS = {}
+for map_item in FSM_MAP:
+    FSM_TRANSITIONS.setdefault(map_item['src'], []).append(
+        (map_item['condition_re_compiled'].match, map_item['dst'], map_item['callback']))
+FSM_TRANSITIONS = {state: tuple(transitions) for state, transitions in FSM_TRANSITIONS.items()}
+
+
+class RegexCounter:
+    """The RE_* calls made through the CountingPatterns of one profiled parse."""
+    __slots__ = ('calls',)
+
+    def __init__(self):
+        self.calls = 0
+
+
+class CountingPattern:
+    """Stands in for an RE_* pattern in a profiled parse, counting every call made through it."""
+    __slots__ = ('pattern', 'counter')
+
+    def __init__(self, pattern, counter):
+        self.pattern = pattern
+        self.counter = counter
+
+    def search(self, *args):
+        self.counter.calls += 1
+        return self.pattern.search(*args)
+
+    def match(self, *args):
+        self.counter.calls += 1
+        return self.pattern.match(*args)
+
+    def fullmatch(self, *args):
+        self.counter.calls += 1
+        return self.pattern.fullmatch(*args)
+
+    def findall(self, *args):
+        self.counter.calls += 1
+        return self.pattern.findall(*args)
+
+    def finditer(self, *args):
+        self.counter.calls += 1
+        return self.pattern.finditer(*args)
+
+    def split(self, *args):
+        self.counter.calls += 1
+        return self.pattern.split(*args)
+
+    def sub(self, *args):
+        self.counter.calls += 1
+        return self.pattern.sub(*args)
+
+    def subn(self, *args):
+        self.counter.calls += 1
+        return self.pattern.subn(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.pattern, name)
+
+
+def counting_callbacks(counter):
+    """
+    Copies of this module's functions that count their RE_* calls on counter, keyed by the original.
+
+    The copies share a namespace of their own in which every RE_* pattern is a CountingPattern,
+    so the callbacks and the helpers they call by name are counted, while the module globals,
+    and every other parse, keep the plain patterns.
+    """
+    namespace = dict(globals())
+    for name, value in list(namespace.items()):
+        if name.startswith('RE_') and isinstance(value, re.Pattern):
+            namespace[name] = CountingPattern(value, counter)
+    copies = {}
+    for name, value in list(namespace.items()):
+        if isinstance(value, FunctionType) and value.__module__ == __name__:
+            copy = FunctionType(value.__code__, namespace, value.__name__, value.__defaults__, value.__closure__)
+            namespace[name] = copies[value] = copy
+    return copies
+
+
 class ParseCreature:
-    def __init__(self, raw_input):
-        self.creature = Creature()
+    def __init__(self, raw_input, trace=None, profile=None):
+        self.trace = trace if trace is not None else get_default_trace()
+        # Resolved once so a disabled trace costs a single boolean test per line
+        self.trace_skips = self.trace.skips
+        self.trace_transitions = self.trace.transitions
+        # Likewise the profile, which swaps in profile_next for the whole parse
+        self.profile = profile if profile is not None else get_default_profile()
+        self.profiling = self.profile.enabled
+        self.creature = ParsedCreature()
         self.creature.space = '5 ft.'
         self.creature.reach = '5 ft.'
         self.gear_item = None
@@ -736,39 +880,57 @@ class ParseCreature:
 
     def run(self):
         text = self.input_str
-        text = re.sub(r"\r\n", "\n", text)
-        text = re.sub(r"\n+", "\n", text)
-
+        text = RE_CRLF.sub("\n", text)
+        text = RE_BLANK_LINES.sub("\n", text)
+
+        if self.profiling:
+            # Built per parse, so the counts of parses in other threads never mix with ours
+            self.regex_counter = RegexCounter()
+            self.counted_callbacks = counting_callbacks(self.regex_counter)
+        start = perf_counter() if self.profiling else 0.0
+        process_next = self.profile_next if self.profiling else self.process_next
         for line in text.split("\n"):
-            if not self.process_next(line):
-                print("skip '{}' in {}".format(line, self.current_state))
+            if not process_next(line) and self.trace_skips:
+                self.trace.skip(self.current_state, line)
 
         # Clean up any unsaved compound objects
         transition_parse_save_special_ability(self)
         transition_parse_save_gear_item(self)
+        set_numeric_values(self.creature)
 
-        print(self.creature)
+        if self.trace_transitions:
+            self.trace.creature(self.creature)
+        if self.profiling:
+            self.profile.creature(perf_counter() - start)
 
     def process_next(self, line):
         self.current_line = line
-        frozen_state = self.current_state
-        for transition in FSM_MAP:
-            if transition['src'] == frozen_state:
-                if self.iterate_re_evaluators(line, transition):
-                    return True
+        for condition, new_state, callback in FSM_TRANSITIONS.get(self.current_state, ()):
+            if condition(line):
+                self.update_state(new_state, callback)
+                return True
         return False
 
-    def iterate_re_evaluators(self, line, transition):
-        condition = transition['condition_re_compiled']
-        if condition.match(line):
-            self.update_state(
-                transition['dst'], transition['callback'])
-            return True
+    def profile_next(self, line):
+        """process_next, counting the transitions tested and the RE_* calls of the callback, and timing both."""
+        state = self.current_state
+        self.current_line = line
+        start = perf_counter()
+        tests = 0
+        for condition, new_state, callback in FSM_TRANSITIONS.get(state, ()):
+            tests += 1
+            if condition(line):
+                regex_calls = self.regex_counter.calls
+                matched = perf_counter()
+                self.update_state(new_state, self.counted_callbacks[callback])
+                self.profile.transition(state, callback.__name__, tests, self.regex_counter.calls - regex_calls,
+                                        matched - start, perf_counter() - matched)
+                return True
+        self.profile.skip(state, tests, perf_counter() - start)
         return False
 
     def update_state(self, new_state, callback):
-        print("{} -> {} : {}".format(self.current_state,
-                                     new_state,
-                                     self.current_line))
+        if self.trace_transitions:
+            self.trace.transition(self.current_state, new_state, self.current_line)
         self.current_state = new_state
         callback(self)
@@ -0,0 +1,63 @@
+"""
+Numeric values of the stats the parser keeps as text.
+
+challenge_rating "1/2", experience_points "3,280,000", fortitude "+5" and the
+rest are stored as they appear in the stat block, and again as numbers in the
+*_value columns so the database can sort and range query them.  A stat with no
+number in it, such as the Constitution "—" of an undead, has no value.
+"""
+import re
+
+RE_INTEGER = re.compile(r"[-+]?\d[\d,]*")
+RE_CHALLENGE_RATING = re.compile(r"(\d+)(?:\s*/\s*(\d+))?")
+
+
+def integer_value(text):
+    """The first whole number in text, ignoring thousands separators, None if there is none."""
+    if not text:
+        return None
+    match = RE_INTEGER.search(str(text))
+    return int(match.group(0).replace(',', '')) if match else None
+
+
+def challenge_rating_value(text):
+    """A challenge rating as a number, 1/2 is 0.5, None if there is none."""
+    if not text:
+        return None
+    match = RE_CHALLENGE_RATING.search(str(text))
+    if not match:
+        return None
+    if match.group(2):
+        denominator = int(match.group(2))
+        return int(match.group(1)) / denominator if denominator else None
+    return float(match.group(1))
+
+
+# (value field, text field, conversion) for every stat with a numeric shadow column
+NUMERIC_STATS = (
+    ('challenge_rating_value', 'challenge_rating', challenge_rating_value),
+    ('experience_points_value', 'experience_points', integer_value),
+    ('hit_points_value', 'hit_points', integer_value),
+    ('armor_class_value', 'base_armor_class', integer_value),
+    ('fortitude_value', 'fortitude', integer_value),
+    ('reflex_value', 'reflex', integer_value),
+    ('will_value', 'will', integer_value),
+    ('strength_value', 'strength', integer_value),
+    ('dexterity_value', 'dexterity', integer_value),
+    ('constitution_value', 'constitution', integer_value),
+    ('intelligence_value', 'intelligence', integer_value),
+    ('wisdom_value', 'wisdom', integer_value),
+    ('charisma_value', 'charisma', integer_value),
+)
+NUMERIC_FIELDS = tuple(value_field for value_field, text_field, conversion in NUMERIC_STATS)
+
+
+def numeric_values(creature):
+    """Return the numeric value of every stat of a creature, keyed by value field."""
+    return {value_field: conversion(getattr(creature, text_field))
+            for value_field, text_field, conversion in NUMERIC_STATS}
+
+
+def set_numeric_values(creature):
+    for value_field, value in numeric_values(creature).items():
+        setattr(creature, value_field, value)
@@ -0,0 +1,190 @@
+"""
+Content addressed on disk cache of ParseCreature results.
+
+An entry is keyed by the SHA-256 of the parser version and the input text after
+the same normalization ParseCreature.run applies, and holds the parsed creature
+as zlib compressed JSON: the creature's fields and the fields of each of its
+child records.  A hit rebuilds the ParsedCreature without running the FSM.
+
+The parser version is a hash of the source of the parser modules, so any
+change to the rules starts a fresh cache directory and the directories of older
+versions are removed the first time the new version stores an entry.
+
+The cache never breaks a parse: an entry that cannot be read is a miss, and when
+entries cannot be written the cache says so once and stops storing them.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from pathlib import Path
+import Parsers.CreatureParser
+import Parsers.NumericStats
+import Parsers.ParsedCreature
+from Parsers.CreatureParser import ParseCreature, RE_CRLF, RE_BLANK_LINES
+from Parsers.ParserTrace import get_default_trace
+from Parsers.ParserProfile import get_default_profile
+from Parsers.ParsedCreature import ParsedCreature, CREATURE_FIELDS, CHILD_RECORDS
+
+CACHE_DIRECTORY_ENV = 'CREATURE_BARN_PARSE_CACHE'
+DEFAULT_CACHE_DIRECTORY = '.parse_cache'
+ENTRY_SUFFIX = '.json.z'
+# Bump when the serialized form changes, it is part of the parser version
+CACHE_FORMAT = '2'
+
+# Modules whose source decides what a parse produces
+PARSER_MODULES = (Parsers.CreatureParser, Parsers.NumericStats, Parsers.ParsedCreature)
+
+PARSER_VERSION = hashlib.sha256(
+    CACHE_FORMAT.encode() + b''.join(Path(module.__file__).read_bytes() for module in PARSER_MODULES)).hexdigest()[:16]
+
+
+
+def normalize(raw_input):
+    text = RE_CRLF.sub("\n", raw_input)
+    return RE_BLANK_LINES.sub("\n", text)
+
+
+def serialize_creature(creature):
+    record = {key: getattr(creature, key) for key in CREATURE_FIELDS if getattr(creature, key) is not None}
+    for relationship_name, record_class in CHILD_RECORDS:
+        children = getattr(creature, relationship_name)
+        if children:
+            record[relationship_name] = [[getattr(child, key) for key in record_class.__slots__] for child in children]
+    return zlib.compress(json.dumps(record, separators=(',', ':')).encode('utf-8'))
+
+
+def deserialize_creature(data):
+    record = json.loads(zlib.decompress(data))
+    creature = ParsedCreature(**{key: record[key] for key in CREATURE_FIELDS if key in record})
+    for relationship_name, record_class in CHILD_RECORDS:
+        if relationship_name in record:
+            setattr(creature, relationship_name, [record_class(**dict(zip(record_class.__slots__, values)))
+                                                  for values in record[relationship_name]])
+    return creature
+
+
+class ParseCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIRECTORY):
+        self.directory = Path(directory)
+        self.version_directory = self.directory / PARSER_VERSION
+        self.pruned = False
+        self.writable = True
+        self.warned = False
+
+    def key(self, text):
+        return hashlib.sha256(PARSER_VERSION.encode() + b'\0' + text.encode('utf-8')).hexdigest()
+
+    def entry_path(self, key):
+        return self.version_directory / key[:2] / (key + ENTRY_SUFFIX)
+
+    def warn(self, message):
+        if not self.warned:
+            self.warned = True
+            print("Parse cache {}: {}".format(self.directory, message))
+
+    def get(self, text):
+        """Return the cached creature for normalized text, None on a miss."""
+        path = self.entry_path(self.key(text))
+        try:
+            data = path.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as e:
+            self.warn("cannot read entries, parsing without them ({})".format(e))
+            return None
+        try:
+            return deserialize_creature(data)
+        except (ValueError, TypeError, KeyError, zlib.error):
+            # A damaged entry is just a miss, the next put replaces it
+            self.warn("ignoring damaged entry {}".format(path.name))
+            return None
+
+    def put(self, text, creature):
+        if not self.writable:
+            return
+        if not self.pruned:
+            self.prune()
+        path = self.entry_path(self.key(text))
+        temp_name = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, batch workers may store the same entry at the same time
+            handle, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(serialize_creature(creature))
+            os.replace(temp_name, path)
+        except OSError as e:
+            self.writable = False
+            self.warn("cannot store entries, parsing without caching ({})".format(e))
+            if temp_name is not None:
+                try:
+                    os.remove(temp_name)
+                except OSError:
+                    pass
+
+    def prune(self):
+        """Remove the entries of every other parser version."""
+        self.pruned = True
+        try:
+            if self.directory.is_dir():
+                for version_directory in self.directory.iterdir():
+                    if version_directory.is_dir() and version_directory.name != PARSER_VERSION:
+                        shutil.rmtree(version_directory, ignore_errors=True)
+        except OSError:
+            # Old versions only waste space, put reports a directory it cannot write to
+            pass
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+_default_cache = None
+_default_cache_configured = False
+
+
+def get_default_cache():
+    """The cache used by parse_creature, by default in CREATURE_BARN_PARSE_CACHE or ./.parse_cache."""
+    if not _default_cache_configured:
+        configure_cache(True)
+    return _default_cache
+
+
+def set_default_cache(cache):
+    """Set the cache used by parse_creature, None turns caching off."""
+    global _default_cache, _default_cache_configured
+    _default_cache = cache
+    _default_cache_configured = True
+
+
+def configure_cache(enabled, directory=None):
+    """Build the cache from command line style settings and make it the default."""
+    cache = None
+    if enabled:
+        cache = ParseCache(directory or os.environ.get(CACHE_DIRECTORY_ENV, DEFAULT_CACHE_DIRECTORY))
+    set_default_cache(cache)
+    return cache
+
+
+def parse_creature(raw_input, cache=None):
+    """
+    Parse a stat block, reusing the cached result when this exact text was parsed before.
+
+    The cache is bypassed while parser tracing or profiling is on, both only see a real parse.
+    """
+    cache = cache if cache is not None else get_default_cache()
+    if cache is None or get_default_trace().skips or get_default_profile().enabled:
+        creature_parser = ParseCreature(raw_input)
+        creature_parser.run()
+        return creature_parser.creature
+
+    text = normalize(raw_input)
+    creature = cache.get(text)
+    if creature is None:
+        creature_parser = ParseCreature(text)
+        creature_parser.run()
+        creature = creature_parser.creature
+        cache.put(text, creature)
+    return creature
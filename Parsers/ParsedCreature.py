@@ -0,0 +1,164 @@
+"""
+Plain records the CreatureParser fills in.
+
+A ParsedCreature has the same attributes as a Database.models.Creature, the
+columns plus one list per child relationship, and every child record has the
+columns of its child table.  They are slotted plain Python objects with no
+SQLAlchemy instrumentation, so building and appending to them costs no more
+than any other object, and the exporters, the bulk insert and the parse cache
+read them exactly like ORM rows.  Database/records.py turns one into ORM rows
+when it is saved through a session.
+"""
+from Parsers.NumericStats import NUMERIC_FIELDS
+
+CREATURE_FIELDS = (
+    'formal_name', 'common_name', 'challenge_rating', 'description', 'experience_points', 'alignment', 'size',
+    'age', 'type', 'sub_type', 'race', 'char_class', 'level', 'initiative', 'perception_modifier',
+    'base_armor_class', 'touch_armor_class', 'flat_footed_armor_class', 'hit_points', 'hit_dice', 'fortitude',
+    'reflex', 'will', 'will_modifiers', 'damage_reduction', 'spell_resistence', 'speed', 'space', 'reach',
+    'reach_modifier', 'spell_like_type', 'spell_like_caster_level', 'spell_known_type', 'spell_known_caster_level',
+    'spell_prepared_type', 'spell_prepared_caster_level', 'strength', 'dexterity', 'constitution', 'intelligence',
+    'wisdom', 'charisma', 'base_attack', 'base_attack_modifier', 'combat_maneuver_bonus',
+    'combat_maneuver_bonus_modifier', 'combat_maneuver_defense', 'combat_maneuver_defense_modifier', 'gear',
+    'tactics', 'racial_modifiers', 'environment', 'organization', 'treasure', 'content', 'barn_type',
+) + NUMERIC_FIELDS
+
+
+class ParsedRecord:
+    """Base of the child records, every field defaults to None."""
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            setattr(self, name, None)
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "<{}: {}>".format(type(self).__name__, {name: getattr(self, name) for name in self.__slots__})
+
+
+class ParsedSense(ParsedRecord):
+    __slots__ = ('sense',)
+
+
+class ParsedAura(ParsedRecord):
+    __slots__ = ('aura', 'radius', 'save_role')
+
+
+class ParsedACModifier(ParsedRecord):
+    __slots__ = ('modifier_amount', 'modifier_type')
+
+
+class ParsedDamageReduction(ParsedRecord):
+    __slots__ = ('reduction_against', 'reduction_amount')
+
+
+class ParsedSpellResistance(ParsedRecord):
+    __slots__ = ('resists', 'resist_amount')
+
+
+class ParsedWeakness(ParsedRecord):
+    __slots__ = ('weakness',)
+
+
+class ParsedImmunity(ParsedRecord):
+    __slots__ = ('immune_to',)
+
+
+class ParsedDefensiveAbility(ParsedRecord):
+    __slots__ = ('ability',)
+
+
+class ParsedSpeedModifier(ParsedRecord):
+    __slots__ = ('speed_modifier',)
+
+
+class ParsedAttack(ParsedRecord):
+    """A melee, ranged or special attack."""
+    __slots__ = ('attack',)
+
+
+class ParsedSpellLikeAbility(ParsedRecord):
+    __slots__ = ('rate', 'name', 'modifiers')
+
+
+class ParsedKnownSpell(ParsedRecord):
+    __slots__ = ('spell_level', 'rate', 'name', 'modifiers')
+
+
+class ParsedPreparedSpell(ParsedRecord):
+    __slots__ = ('spell_level', 'name', 'modifiers')
+
+
+class ParsedDomain(ParsedRecord):
+    __slots__ = ('domain',)
+
+
+class ParsedFeat(ParsedRecord):
+    __slots__ = ('feat',)
+
+
+class ParsedSkill(ParsedRecord):
+    __slots__ = ('skill', 'modifier')
+
+
+class ParsedLanguage(ParsedRecord):
+    __slots__ = ('language',)
+
+
+class ParsedGearItem(ParsedRecord):
+    __slots__ = ('name', 'description')
+
+
+class ParsedSpecialQuality(ParsedRecord):
+    __slots__ = ('special_quality',)
+
+
+class ParsedSpecialAbility(ParsedRecord):
+    __slots__ = ('type', 'ability', 'description')
+
+
+# (relationship name, record class) for every one-to-many relationship on Creature, in mapper order
+CHILD_RECORDS = (
+    ('senses', ParsedSense),
+    ('auras', ParsedAura),
+    ('ac_modifiers', ParsedACModifier),
+    ('dr_modifiers', ParsedDamageReduction),
+    ('sr_modifiers', ParsedSpellResistance),
+    ('weaknesses', ParsedWeakness),
+    ('immune_modifiers', ParsedImmunity),
+    ('defensive_abilities', ParsedDefensiveAbility),
+    ('speed_modifiers', ParsedSpeedModifier),
+    ('melee_attacks', ParsedAttack),
+    ('ranged_attacks', ParsedAttack),
+    ('special_attacks', ParsedAttack),
+    ('spell_like_abilities', ParsedSpellLikeAbility),
+    ('known_spells', ParsedKnownSpell),
+    ('prepared_spells', ParsedPreparedSpell),
+    ('cleric_domains', ParsedDomain),
+    ('feats', ParsedFeat),
+    ('skills', ParsedSkill),
+    ('languages', ParsedLanguage),
+    ('gear_items', ParsedGearItem),
+    ('special_qualities', ParsedSpecialQuality),
+    ('special_abilities', ParsedSpecialAbility),
+)
+CHILD_LISTS = tuple(relationship_name for relationship_name, record_class in CHILD_RECORDS)
+
+
+class ParsedCreature:
+    """A parsed creature, not yet saved, so id is always None."""
+    __slots__ = ('id',) + CREATURE_FIELDS + CHILD_LISTS
+
+    def __init__(self, **values):
+        self.id = None
+        for name in CREATURE_FIELDS:
+            setattr(self, name, None)
+        for name in CHILD_LISTS:
+            setattr(self, name, [])
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        return "<ParsedCreature: {}>".format({name: getattr(self, name) for name in self.__slots__})
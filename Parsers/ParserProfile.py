@@ -0,0 +1,144 @@
+"""
+Opt-in profiling counters for the ParseCreature FSM.
+
+    states     per FSM state: the lines read in it, the transition conditions tested
+               on them, the RE_* calls of the callbacks that fired, the lines no
+               transition accepted, and the time spent on those lines
+    callbacks  per transition callback: its calls, the transition conditions tested
+               on the lines that fired it, the RE_* calls it made, and the time spent
+               inside it
+
+RE_* calls are counted by running each profiled parse's callbacks as copies that see
+CountingPatterns in place of the pattern registry, see counting_callbacks in
+CreatureParser.  Counters from many parses add up in one profile, worker processes
+send theirs back with drain() to be merge()d, and the total is reported as a table
+or JSON.
+"""
+import json
+
+DEFAULT_PROFILE_FILE = 'parser_profile.json'
+
+
+class Counters:
+    __slots__ = ('calls', 'seconds', 'transition_tests', 'regex_calls', 'skipped_lines')
+
+    def __init__(self, calls=0, seconds=0.0, transition_tests=0, regex_calls=0, skipped_lines=0):
+        self.calls = calls
+        self.seconds = seconds
+        self.transition_tests = transition_tests
+        self.regex_calls = regex_calls
+        self.skipped_lines = skipped_lines
+
+    def add(self, other):
+        self.calls += other.calls
+        self.seconds += other.seconds
+        self.transition_tests += other.transition_tests
+        self.regex_calls += other.regex_calls
+        self.skipped_lines += other.skipped_lines
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class ParserProfile:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self.creatures = 0
+        self.seconds = 0.0
+        self.states = {}
+        self.callbacks = {}
+
+    def transition(self, state, callback, tests, regex_calls, dispatch_seconds, callback_seconds):
+        """A line in state passed the tests-th transition condition, whose callback then made regex_calls."""
+        state_counters = self.states.get(state)
+        if state_counters is None:
+            state_counters = self.states[state] = Counters()
+        state_counters.calls += 1
+        state_counters.transition_tests += tests
+        state_counters.regex_calls += regex_calls
+        state_counters.seconds += dispatch_seconds + callback_seconds
+
+        callback_counters = self.callbacks.get(callback)
+        if callback_counters is None:
+            callback_counters = self.callbacks[callback] = Counters()
+        callback_counters.calls += 1
+        callback_counters.transition_tests += tests
+        callback_counters.regex_calls += regex_calls
+        callback_counters.seconds += callback_seconds
+
+    def skip(self, state, tests, seconds):
+        """A line in state that failed all of its tests transition conditions."""
+        state_counters = self.states.get(state)
+        if state_counters is None:
+            state_counters = self.states[state] = Counters()
+        state_counters.calls += 1
+        state_counters.transition_tests += tests
+        state_counters.skipped_lines += 1
+        state_counters.seconds += seconds
+
+    def creature(self, seconds):
+        """A whole parse finished in seconds."""
+        self.creatures += 1
+        self.seconds += seconds
+
+    def as_dict(self):
+        return {
+            'creatures': self.creatures,
+            'seconds': self.seconds,
+            'states': {state: counters.as_dict() for state, counters in self.states.items()},
+            'callbacks': {callback: counters.as_dict() for callback, counters in self.callbacks.items()},
+        }
+
+    def merge(self, data):
+        """Add the counters of another profile, in the as_dict form."""
+        self.creatures += data['creatures']
+        self.seconds += data['seconds']
+        for section, values in ((self.states, data['states']), (self.callbacks, data['callbacks'])):
+            for name, counters in values.items():
+                section.setdefault(name, Counters()).add(Counters(**counters))
+
+    def drain(self):
+        """Return the counters in the as_dict form and start counting afresh."""
+        data = self.as_dict()
+        self.reset()
+        return data
+
+    def table(self):
+        """The report as lines of text, slowest states and callbacks first."""
+        lines = ["Parsed {} creature(s) in {:.1f} ms".format(self.creatures, self.seconds * 1000)]
+        for title, section in (("State", self.states), ("Callback", self.callbacks)):
+            lines.append("")
+            lines.append("{:<44} {:>9} {:>11} {:>11} {:>9} {:>11} {:>9}".format(
+                title, "Calls", "Trans tests", "Regex calls", "Skipped", "Total ms", "Mean us"))
+            for name, counters in sorted(section.items(), key=lambda item: item[1].seconds, reverse=True):
+                lines.append("{:<44} {:>9} {:>11} {:>11} {:>9} {:>11.2f} {:>9.1f}".format(
+                    name, counters.calls, counters.transition_tests, counters.regex_calls, counters.skipped_lines,
+                    counters.seconds * 1000, counters.seconds * 1000000 / counters.calls if counters.calls else 0.0))
+        return lines
+
+    def write_json(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as profile_file:
+            json.dump(self.as_dict(), profile_file, indent=2)
+
+
+_default_profile = ParserProfile(False)
+
+
+def get_default_profile():
+    return _default_profile
+
+
+def set_default_profile(profile):
+    """Set the profile used by every ParseCreature that is not given one explicitly."""
+    global _default_profile
+    _default_profile = profile
+
+
+def configure_profile(enabled):
+    """Build a profile from command line style settings and make it the default."""
+    profile = ParserProfile(enabled)
+    set_default_profile(profile)
+    return profile
@@ -0,0 +1,106 @@
+"""
+Level controlled tracing for the ParseCreature FSM.
+
+    off    nothing is traced, the parser only checks a boolean per line
+    skips  lines that no transition accepted
+    full   skips, every state transition and the finished creature
+
+Trace messages go to a sink: a stream (stdout by default), a file, or an in
+memory ring buffer that keeps only the most recent messages.
+"""
+import sys
+from collections import deque
+
+TRACE_OFF = 0
+TRACE_SKIPS = 1
+TRACE_FULL = 2
+
+TRACE_LEVELS = {
+    'off': TRACE_OFF,
+    'skips': TRACE_SKIPS,
+    'full': TRACE_FULL,
+}
+
+
+class StreamSink:
+    """Write trace messages to an already open stream, stdout by default."""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+
+    def write(self, message):
+        self.stream.write(message + "\n")
+
+    def close(self):
+        self.stream.flush()
+
+
+class FileSink(StreamSink):
+    """Append trace messages to a file."""
+
+    def __init__(self, file_path):
+        # Line buffered so nothing is lost when a worker process exits without closing it
+        super().__init__(open(file_path, 'a', encoding='utf-8', buffering=1))
+
+    def close(self):
+        self.stream.close()
+
+
+class RingBufferSink:
+    """Keep only the last `size` trace messages in memory."""
+
+    def __init__(self, size=1000):
+        self.messages = deque(maxlen=size)
+
+    def write(self, message):
+        self.messages.append(message)
+
+    def close(self):
+        pass
+
+
+class ParserTrace:
+    def __init__(self, level=TRACE_OFF, sink=None):
+        self.level = TRACE_LEVELS.get(level, level)
+        self.sink = sink if sink is not None else StreamSink()
+
+    @property
+    def skips(self):
+        return self.level >= TRACE_SKIPS
+
+    @property
+    def transitions(self):
+        return self.level >= TRACE_FULL
+
+    def skip(self, state, line):
+        self.sink.write("skip '{}' in {}".format(line, state))
+
+    def transition(self, old_state, new_state, line):
+        self.sink.write("{} -> {} : {}".format(old_state, new_state, line))
+
+    def creature(self, creature):
+        self.sink.write(repr(creature))
+
+    def close(self):
+        self.sink.close()
+
+
+_default_trace = ParserTrace(TRACE_OFF)
+
+
+def get_default_trace():
+    return _default_trace
+
+
+def set_default_trace(trace):
+    """Set the trace used by every ParseCreature that is not given one explicitly."""
+    global _default_trace
+    _default_trace = trace
+
+
+def configure_trace(level, file_path=None):
+    """Build a trace from command line style settings and make it the default."""
+    sink = FileSink(file_path) if file_path else StreamSink()
+    trace = ParserTrace(level, sink)
+    set_default_trace(trace)
+    return trace
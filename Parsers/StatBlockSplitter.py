@@ -0,0 +1,122 @@
+"""
+Split a document holding many stat blocks into one text per creature.
+
+Lines are read lazily and only the block being collected plus a few lines of
+look ahead are held in memory, so a whole bestiary can be streamed from a file
+or stdin.  A block starts at a header line the FSM would take as the common
+name and challenge rating ("Basilisk CR 5"), provided an XP line follows within
+the next few non-blank lines before any other such header.
+
+Most sources put the formal name, and sometimes a one line description, before
+the header.  Looking back at most lead_in_lines non-blank lines, the nearest
+title like line (short, not ending like a sentence) and everything after it is
+moved from the end of the previous block to the start of the new one.
+"""
+from collections import deque
+from Parsers.CreatureParser import RE_COMMON_NAME, RE_EXPERIENCE
+
+DEFAULT_LEAD_IN_LINES = 2
+# Non-blank lines after a CR line that are searched for its XP line
+DEFAULT_XP_WINDOW = 3
+# Longest line still taken as the formal name in front of a header
+TITLE_MAX_LENGTH = 80
+SENTENCE_ENDINGS = ('.', '!', '?', ':', ';', ',')
+
+
+def is_title(line):
+    line = line.strip()
+    return 0 < len(line) <= TITLE_MAX_LENGTH and not line.endswith(SENTENCE_ENDINGS)
+
+
+class StatBlockSplitter:
+    def __init__(self, lines, lead_in_lines=DEFAULT_LEAD_IN_LINES, xp_window=DEFAULT_XP_WINDOW):
+        self.lines = lines
+        self.lead_in_lines = lead_in_lines
+        self.xp_window = xp_window
+        self.block = []
+        self.in_block = False
+        self.upcoming = deque()
+        self.upcoming_text_lines = 0
+
+    def __iter__(self):
+        """Yield the text of each stat block in document order."""
+        for line in self.lines:
+            line = line.rstrip("\r\n")
+            self.upcoming.append(line)
+            if line.strip():
+                self.upcoming_text_lines += 1
+            # Keep enough look ahead to confirm the XP line of a header at the front
+            if self.upcoming_text_lines > self.xp_window:
+                finished = self.take_line()
+                if finished is not None:
+                    yield finished
+        while self.upcoming:
+            finished = self.take_line()
+            if finished is not None:
+                yield finished
+        if self.in_block:
+            yield "\n".join(self.block)
+
+    def take_line(self):
+        """Move the first look ahead line into the current block, return the previous block if it ended."""
+        line = self.upcoming.popleft()
+        if line.strip():
+            self.upcoming_text_lines -= 1
+        if RE_COMMON_NAME.match(line) and self.xp_follows():
+            return self.start_block(line)
+        self.block.append(line)
+        if not self.in_block:
+            self.trim_preamble()
+        return None
+
+    def xp_follows(self):
+        text_lines = 0
+        for line in self.upcoming:
+            line = line.strip()
+            if not line:
+                continue
+            if RE_EXPERIENCE.match(line):
+                return True
+            if RE_COMMON_NAME.match(line):
+                # A later header is the real one, this line is just text mentioning a CR
+                return False
+            text_lines += 1
+            if text_lines >= self.xp_window:
+                break
+        return False
+
+    def lead_in_start(self):
+        """Index in the current block where the next block's lead in starts, None when there is none."""
+        text_lines = 0
+        for index in range(len(self.block) - 1, -1, -1):
+            line = self.block[index]
+            if not line.strip():
+                continue
+            if is_title(line):
+                return index
+            text_lines += 1
+            if text_lines >= self.lead_in_lines:
+                break
+        return None
+
+    def start_block(self, header):
+        start = self.lead_in_start()
+        lead_in = []
+        if start is not None:
+            lead_in = self.block[start:]
+            del self.block[start:]
+
+        finished = "\n".join(self.block) if self.in_block else None
+        self.block = lead_in + [header]
+        self.in_block = True
+        return finished
+
+    def trim_preamble(self):
+        # Text before the first header is only kept as a possible lead in
+        while sum(1 for line in self.block if line.strip()) > self.lead_in_lines:
+            self.block.pop(0)
+
+
+def split_stat_blocks(lines, lead_in_lines=DEFAULT_LEAD_IN_LINES):
+    """Yield the text of every stat block in an iterable of lines, such as an open file."""
+    return iter(StatBlockSplitter(lines, lead_in_lines))
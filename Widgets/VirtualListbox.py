@@ -0,0 +1,121 @@
+import tkinter as tk
+from tkinter import ttk
+from collections import OrderedDict
+
+
+class VirtualListbox(ttk.Frame):
+    """
+    A Listbox that only holds the rows currently on screen.
+
+    Rows are fetched a page at a time through fetch_page(offset, limit), which returns a list of
+    (key, label) tuples, and the most recently used pages are kept in a small cache.  Scrolling
+    just re-renders the visible window, so the widget opens instantly however many rows there are.
+    """
+
+    def __init__(self, container, row_count, fetch_page, page_size=200, cached_pages=16, height=20, width=60,
+                 *args, **kwargs):
+        super().__init__(container, *args, **kwargs)
+        self.row_count = row_count
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+        self.height = height
+        self.top = 0
+        self.pages = OrderedDict()
+        self.visible_keys = []
+
+        self.listbox = tk.Listbox(self, height=height, width=width, activestyle="none", exportselection=False)
+        self.listbox.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.listbox.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.listbox.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.listbox.bind("<Button-5>", lambda event: self.scroll_rows(3))
+        self.listbox.bind("<Up>", lambda event: self.move_selection(-1))
+        self.listbox.bind("<Down>", lambda event: self.move_selection(1))
+        self.listbox.bind("<Prior>", lambda event: self.scroll_rows(-self.height))
+        self.listbox.bind("<Next>", lambda event: self.scroll_rows(self.height))
+
+        self.render()
+
+    def bind(self, sequence=None, func=None, add=None):
+        return self.listbox.bind(sequence, func, add)
+
+    def refresh(self, row_count=None):
+        """Drop the cached pages, e.g. after rows were added or deleted, and redraw."""
+        if row_count is not None:
+            self.row_count = row_count
+        self.pages.clear()
+        self.scroll_to(self.top)
+
+    def set_source(self, row_count, fetch_page):
+        """Show a different set of rows, starting again from the top."""
+        self.row_count = row_count
+        self.fetch_page = fetch_page
+        self.pages.clear()
+        self.scroll_to(0)
+
+    def row(self, index):
+        page_number = index // self.page_size
+        page = self.pages.get(page_number)
+        if page is None:
+            page = self.fetch_page(page_number * self.page_size, self.page_size)
+            self.pages[page_number] = page
+            if len(self.pages) > self.cached_pages:
+                self.pages.popitem(last=False)
+        else:
+            self.pages.move_to_end(page_number)
+        offset = index - page_number * self.page_size
+        return page[offset] if offset < len(page) else None
+
+    def render(self):
+        rows = [self.row(index) for index in range(self.top, min(self.top + self.height, self.row_count))]
+        rows = [row for row in rows if row is not None]
+        self.visible_keys = [key for key, label in rows]
+        self.listbox.delete(0, tk.END)
+        if rows:
+            self.listbox.insert(tk.END, *[label for key, label in rows])
+        if self.row_count:
+            self.scrollbar.set(self.top / self.row_count, (self.top + len(rows)) / self.row_count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, top):
+        self.top = max(0, min(top, self.row_count - self.height))
+        self.render()
+
+    def scroll_rows(self, count):
+        self.scroll_to(self.top + count)
+        return "break"
+
+    def yview(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.row_count))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            self.scroll_rows(amount * self.height if args[2] == "pages" else amount)
+
+    def on_mouse_wheel(self, event):
+        return self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def move_selection(self, step):
+        """Arrow keys move the selection and scroll the window when they reach its edge."""
+        selection = self.listbox.curselection()
+        index = (selection[0] if selection else -1) + step
+        if index < 0 or index >= len(self.visible_keys):
+            self.scroll_rows(step)
+            index = max(0, min(index, len(self.visible_keys) - 1))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(index)
+        self.listbox.activate(index)
+        return "break"
+
+    def selected_key(self):
+        """Key of the selected row, None when nothing is selected."""
+        selection = self.listbox.curselection()
+        if selection and selection[0] < len(self.visible_keys):
+            return self.visible_keys[selection[0]]
+        return None
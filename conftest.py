@@ -0,0 +1 @@
+"""Lets the tests under tests/ import the application packages from the repository root."""
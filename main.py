@@ -1,175 +1,15 @@
 """
 CreatureStatBlockParser – version 1.00
 Robust Pathfinder stat-block parser.
+
+Only argparse is imported up front.  Each path imports what it needs when it runs:
+the batch processor for -b and -f, the database exporter for -x, and Tk, the theme
+and the main window for the GUI, so --version and headless runs start quickly.
 """
 import argparse
-from pathlib import Path
-import tkinter as tk
-from tkinter import ttk
-from tkinter import filedialog, messagebox
-from pathlib import Path
-from ttkthemes import ThemedTk
-from Forms.creatures import CreatureForm, CreatureList
-from Parsers.CreatureParser import ParseCreature
-from Database.database import DATABASE_VERSION, Database
-from Database.create_tables import initialize_repository
 
 APPLICATION_VERSION = '1.1.0'
 
-def initialize_database():
-    if messagebox.askyesno("Initialize Database", message="Do you really want to initialize the database?",
-                           detail="This will remove all information currently in the database", icon='question',):
-        initialize_repository(True)
-        messagebox.showinfo("Database", "Database Initialized")
-
-
-class CreatureBarn:
-    def __init__(self, root, args):
-        self.args = args
-        self.root = root
-        self.newWindow = None
-        self.app = None
-        self.root.title("Creature Stat Block Parser")
-        self.text = tk.Text(root, wrap="word", width=120, height=45)
-        self.text.pack(expand=True, fill="both")
-
-        self.menu = tk.Menu(root)
-        self.file_menu = tk.Menu(self.menu, tearoff=0)
-        self.file_menu.add_command(label="Open and Parse", command=self.load)
-        self.file_menu.add_command(label="Parse", command=self.parse_screen)
-        self.file_menu.add_command(label="Exit", command=root.quit)
-        self.menu.add_cascade(label="File", menu=self.file_menu)
-
-        self.database_menu = tk.Menu(self.menu, tearoff=0)
-        self.database_menu.add_command(label="Manage Spells", state="disabled")
-        self.database_menu.add_command(label="Manage Creatures", command=self.show_creature_list)
-        self.database_menu.add_command(label="Manage NPCs", command=self.show_npc_list)
-        self.database_menu.add_separator()
-        self.database_menu.add_command(label="Initialize Database", command=initialize_database, state="disabled")
-        self.menu.add_cascade(label="Database", menu=self.database_menu)
-
-        self.help_menu = tk.Menu(self.menu, tearoff=0)
-        self.help_menu.add_command(label="About", command=self.show_about_dialog)
-        self.menu.add_cascade(label="Help", menu=self.help_menu)
-
-        root.config(menu=self.menu)
-        self.database = Database()
-
-        # Ensure the database is valid and the structure is up to date
-        # Ensure the database is valid and the structure is up to date
-        if not self.database.is_database_valid():
-            self.database_menu.entryconfig("Initialize Database", state="normal")
-        else:
-            self.database.verify_database_version()
-
-        if args.batch:
-            self.process_batch()
-            self.root.destroy()
-        elif self.args.file:
-            self.process_single_file()
-            self.root.destroy()
-
-    # Function to display the "About" dialog box
-    def show_about_dialog(self):
-        """Creates and displays a custom about dialog with specified dimensions."""
-
-        # Create the Toplevel window
-        about_box = tk.Toplevel(self.root)
-        about_box.title("About")
-
-        # Specify the width and height (e.g., 300x200 pixels)
-        about_box.geometry("450x360")
-
-        # Make the window non-resizable
-        about_box.resizable(False, False)
-
-        # Center the dialog over the parent window (optional, but good practice)
-        about_box.transient(self.root) # Makes the dialog box a transient window of the root window
-        about_box.grab_set()     # Makes the dialog modal (forces user interaction)
-
-        # Add content (e.g., Labels, Buttons)
-        # Use a Message widget for multi-line text that wraps properly
-        message_text = "This is a simple creature barn to manage creature and NPC definitions.\n\nVersion {}, Database {}".format(APPLICATION_VERSION, DATABASE_VERSION)
-        about_message = tk.Message(about_box, text=message_text, justify=tk.CENTER,
-                                   width=400)  # width in character units
-        about_message.pack(pady=20, padx=10)
-
-        # Add an OK button to close the dialog
-        ok_button = ttk.Button(about_box, text="OK", command=about_box.destroy)
-        ok_button.pack(pady=10)
-
-    def show_creature_list(self):
-        self.newWindow = tk.Toplevel(self.root)
-        self.app = CreatureList(self.newWindow, "Creature")
-
-    def show_npc_list(self):
-        self.newWindow = tk.Toplevel(self.root)
-        self.app = CreatureList(self.newWindow, "NPC")
-
-    def show_parsed_creature(self, creature):
-        self.newWindow = tk.Toplevel(self.root)
-        self.app = CreatureForm(self.newWindow)
-        self.app.on_load(creature)
-
-    def load(self):
-        file_list = filedialog.askopenfilenames(filetypes=[("Text Files", "*.txt")], initialdir="./samples")
-        if not file_list:
-            return
-        if len(file_list) == 1:
-            raw = Path(file_list[0]).read_text(encoding="utf-8")
-            parser = ParseCreature(raw)
-            parser.run()
-
-            self.text.delete("1.0", tk.END)
-            self.text.insert(tk.END, raw)
-            self.show_parsed_creature(parser.creature)
-        else:
-            self.text.delete("1.0", tk.END)
-            self.text.insert(tk.END, "Processing selected files:\n")
-            for file in file_list:
-                self.parse_and_process_file(file, True)
-
-    def parse_screen(self):
-        text = self.text.get("1.0", tk.END)
-        if len(text) > 5:
-            parser = ParseCreature(text)
-            parser.run()
-            self.show_parsed_creature(parser.creature)
-        else:
-            messagebox.showwarning("No Data", "No text to parse!")
-
-    def process_batch(self):
-        print( "Processing files in {}".format(self.args.path))
-        for file in Path(self.args.path).glob("*.txt"):
-            self.parse_and_process_file(file, False)
-
-    def process_single_file(self):
-        print("Processing file {}".format(self.args.file))
-        self.parse_and_process_file(self.args.file, False)
-
-    def parse_and_process_file(self, file, log_to_screen=False):
-        if log_to_screen:
-            self.text.insert(tk.END, file + "\n")
-        else:
-            print(file)
-
-        raw = Path(file).read_text(encoding="utf-8")
-        creature_parser = ParseCreature(raw)
-        creature_parser.run()
-        creature_parser.creature.barn_type = self.args.type
-        self.show_parsed_creature(creature_parser.creature)
-
-        if self.args.action == "export":
-            self.app.on_export()
-        elif self.args.action == "save":
-            self.app.on_save()
-        elif self.args.action == "both":
-            self.app.on_export()
-            self.app.on_save()
-
-        self.app.root.destroy()
-        self.app = None
-
 
 def init_argparse() -> argparse.ArgumentParser:
     arg_parser = argparse.ArgumentParser(
@@ -199,14 +39,72 @@ def init_argparse() -> argparse.ArgumentParser:
         "-a", "--action", choices=['export', 'save', 'both'], default='export',
         help="Action to perform on the batch or file, defaults to export"
     )
+    arg_parser.add_argument(
+        "-w", "--workers", type=int, default=1,
+        help="Number of processes used to parse a batch, defaults to 1"
+    )
+    arg_parser.add_argument(
+        "-x", "--export-db", type=str, metavar="SELECTION",
+        help="Export from the database without a GUI: all, NPC, Creature or a comma separated list of ids"
+    )
+    arg_parser.add_argument(
+        "-o", "--output", type=str, default='output',
+        help="Where exports are written: a directory, or a .jsonl, .tsv or .zip bundle file, defaults to ./output"
+    )
+    arg_parser.add_argument(
+        "-s", "--split", action='store_true',
+        help="Each file holds many stat blocks, split it into one creature per block. Use -f - to read stdin"
+    )
+    arg_parser.add_argument(
+        "--no-parse-cache", action='store_true',
+        help="Always run the parser instead of reusing cached results from ./.parse_cache"
+    )
+    arg_parser.add_argument(
+        "--trace", choices=['off', 'skips', 'full'], default='off',
+        help="Parser tracing: skipped lines only or every state transition, defaults to off"
+    )
+    arg_parser.add_argument(
+        "--trace-file", type=str,
+        help="File to append the parser trace to, defaults to the console"
+    )
+    arg_parser.add_argument(
+        "--profile", action='store_true',
+        help="Count the calls, regex attempts, skipped lines and time of every parser state and callback"
+    )
+    arg_parser.add_argument(
+        "--profile-file", type=str, default='parser_profile.json',
+        help="File the parser profile is written to as JSON, defaults to ./parser_profile.json"
+    )
     return arg_parser
 
 
 def main() -> None:
     arg_parser = init_argparse()
     args = arg_parser.parse_args()
+    if args.export_db:
+        from Exporters.DatabaseExporter import export_database
+        try:
+            written, failed = export_database(args.export_db, args.output)
+        except ValueError as e:
+            arg_parser.error(str(e))
+        if failed:
+            raise SystemExit(1)
+        return
+    from Parsers.ParseCache import configure_cache
+    from Parsers.ParserTrace import configure_trace
+    from Parsers.ParserProfile import configure_profile
+    configure_trace(args.trace, args.trace_file)
+    configure_profile(args.profile)
+    configure_cache(not args.no_parse_cache)
+    if args.batch or args.file:
+        # Batch runs never need a window, so skip Tk entirely
+        from Batch.processor import BatchProcessor
+        BatchProcessor(args).run()
+        return
+    from ttkthemes import ThemedTk
+    from Forms.barn import CreatureBarn
     root_widget = ThemedTk(theme='Black')
-    app = CreatureBarn(root_widget, args)
+    app = CreatureBarn(root_widget, args, APPLICATION_VERSION)
     root_widget.mainloop()
 
 if __name__ == "__main__":
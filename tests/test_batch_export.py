@@ -0,0 +1,47 @@
+"""
+A batch export skips a creature that cannot be exported and carries on with the rest.
+"""
+import argparse
+from pathlib import Path
+from Batch.processor import BatchProcessor
+from Exporters.ExportTargets import read_bundle
+from Parsers.CreatureParser import ParseCreature
+from Parsers.ParsedCreature import ParsedAura
+
+SAMPLES = Path(__file__).resolve().parent.parent / "samples"
+
+
+def parse_samples():
+    creatures = []
+    for sample in sorted(SAMPLES.glob("Creatures/*.txt")):
+        creature_parser = ParseCreature(sample.read_text(encoding="utf-8"))
+        creature_parser.run()
+        creatures.append((str(sample), creature_parser.creature))
+    return creatures
+
+
+def run_export(tmp_path, creatures):
+    output = tmp_path / "barn.jsonl"
+    messages = []
+    args = argparse.Namespace(action='export', output=str(output), type='Creature', workers=1)
+    BatchProcessor(args, log=messages.append).process_parsed(creature for creature in creatures)
+    return [record['formal_name'] for record in read_bundle(output)], messages
+
+
+def test_creature_without_formal_name_is_skipped(tmp_path):
+    creatures = parse_samples()
+    creatures[1][1].formal_name = None
+    names, messages = run_export(tmp_path, creatures)
+    assert names == [creature.formal_name for label, creature in creatures if creature.formal_name]
+    assert "Could not export: A creature has no formal name" in messages
+
+
+def test_missing_fields_export_as_empty_text(tmp_path):
+    creatures = parse_samples()
+    creature = creatures[0][1]
+    creature.perception_modifier = None
+    creature.hit_points = None
+    creature.auras = [ParsedAura(aura='frightful presence')]
+    names, messages = run_export(tmp_path, creatures)
+    assert names == [creature.formal_name for label, creature in creatures]
+    assert not [message for message in messages if message.startswith("Could not export")]
@@ -0,0 +1,57 @@
+"""
+The encounter XP budget and the solver that picks creatures to fill it.
+"""
+import random
+from Database.encounters import encounter_budget, experience_for_challenge_rating, solve_budget
+
+
+def test_budget_for_an_average_party():
+    assert encounter_budget(4, 1, 'Average') == 400
+    assert encounter_budget(4, 5, 'Hard') == experience_for_challenge_rating(7)
+
+
+def test_budget_adjusts_for_party_size():
+    assert encounter_budget(6, 1, 'Challenging') == encounter_budget(4, 1, 'Hard')
+    assert encounter_budget(3, 1, 'Challenging') == encounter_budget(4, 1, 'Average')
+
+
+def test_budget_below_challenge_rating_1_at_level_1():
+    assert encounter_budget(4, 1, 'Easy') == 200
+    assert encounter_budget(3, 1, 'Easy') == 135
+    assert experience_for_challenge_rating(-4) == 50
+    assert experience_for_challenge_rating(-9) == 50
+
+
+def test_budget_above_the_table_is_capped():
+    assert experience_for_challenge_rating(40) == experience_for_challenge_rating(30)
+
+
+def test_no_experience_values_gives_no_creatures():
+    assert solve_budget([], 1000, rng=random.Random(1)) == []
+    assert solve_budget([0, -5], 1000, rng=random.Random(1)) == []
+
+
+def test_budget_smaller_than_every_creature_gives_no_creatures():
+    assert solve_budget([400, 600, 800], 100, rng=random.Random(1)) == []
+
+
+def test_solution_is_within_tolerance_and_creature_limits():
+    values = [135, 200, 400, 600, 800, 1200]
+    for seed in range(20):
+        chosen = solve_budget(values, 1600, min_creatures=2, max_creatures=4, rng=random.Random(seed))
+        assert 2 <= len(chosen) <= 4
+        assert set(chosen) <= set(values)
+        assert abs(sum(chosen) - 1600) <= 160
+
+
+def test_same_seed_gives_the_same_solution():
+    values = [135, 200, 400, 600, 800, 1200]
+    assert solve_budget(values, 2400, rng=random.Random(5)) == solve_budget(values, 2400, rng=random.Random(5))
+
+
+def test_creature_repeated_to_fill_the_budget():
+    assert solve_budget([400], 1200, rng=random.Random(1)) == [400, 400, 400]
+
+
+def test_closest_total_when_nothing_is_within_tolerance():
+    assert solve_budget([1000], 1500, rng=random.Random(1)) == [1000]
@@ -0,0 +1,80 @@
+"""
+The import manifest decides which source files a batch save skips and which it imports again.
+"""
+import os
+import pytest
+from sqlalchemy import create_engine, delete, insert
+from Database.database import Base
+from Database.manifest import check_file, load_manifest, record_imports
+from Database.models import Creature
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine("sqlite:///" + str(tmp_path / "manifest.db"))
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+def import_file(engine, file, creature_id):
+    """Record file as imported into a new creature, the way a batch save does."""
+    with engine.begin() as connection:
+        connection.execute(insert(Creature.__table__).values(id=creature_id, formal_name=file.stem))
+        entry, changed = check_file(file, load_manifest(connection))
+        record_imports(connection, [dict(entry, creature_id=creature_id)])
+    return entry
+
+
+def check(engine, file):
+    with engine.connect() as connection:
+        return check_file(file, load_manifest(connection))
+
+
+def test_new_file_is_imported(engine, tmp_path):
+    file = tmp_path / "Goblin.txt"
+    file.write_text("Goblin CR 1/3", encoding="utf-8")
+    entry, changed = check(engine, file)
+    assert changed
+    assert entry['creature_id'] is None
+
+
+def test_unchanged_file_is_skipped(engine, tmp_path):
+    file = tmp_path / "Goblin.txt"
+    file.write_text("Goblin CR 1/3", encoding="utf-8")
+    import_file(engine, file, 1)
+    entry, changed = check(engine, file)
+    assert not changed
+    assert entry['creature_id'] == 1
+
+
+def test_touched_file_with_the_same_content_is_skipped(engine, tmp_path):
+    file = tmp_path / "Goblin.txt"
+    file.write_text("Goblin CR 1/3", encoding="utf-8")
+    previous = import_file(engine, file, 1)
+    os.utime(file, ns=(previous['mtime_ns'] + 1000000000, previous['mtime_ns'] + 1000000000))
+    entry, changed = check(engine, file)
+    assert not changed
+    assert entry['creature_id'] == 1
+
+
+def test_changed_file_replaces_its_creature(engine, tmp_path):
+    file = tmp_path / "Goblin.txt"
+    file.write_text("Goblin CR 1/3", encoding="utf-8")
+    previous = import_file(engine, file, 1)
+    file.write_text("Goblin Chief CR 2", encoding="utf-8")
+    entry, changed = check(engine, file)
+    assert changed
+    assert entry['creature_id'] == 1
+    assert entry['content_hash'] != previous['content_hash']
+
+
+def test_file_of_a_deleted_creature_is_imported_again(engine, tmp_path):
+    file = tmp_path / "Goblin.txt"
+    file.write_text("Goblin CR 1/3", encoding="utf-8")
+    import_file(engine, file, 1)
+    with engine.begin() as connection:
+        connection.execute(delete(Creature.__table__).where(Creature.__table__.c.id == 1))
+    entry, changed = check(engine, file)
+    assert changed
+    assert entry['creature_id'] is None
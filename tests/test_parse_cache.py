@@ -0,0 +1,67 @@
+"""
+A cached parse gives back the creature a fresh parse gives, and a cache that cannot be used falls back to parsing.
+"""
+from pathlib import Path
+import Parsers.ParseCache
+from Parsers.CreatureParser import ParseCreature
+from Parsers.ParseCache import ParseCache, normalize, parse_creature
+
+SAMPLES = Path(__file__).resolve().parent.parent / "samples"
+
+
+def sample_raw():
+    return sorted(SAMPLES.glob("Creatures/*.txt"))[0].read_text(encoding="utf-8")
+
+
+def fresh_parse(raw):
+    creature_parser = ParseCreature(raw)
+    creature_parser.run()
+    return creature_parser.creature
+
+
+def fields(creature):
+    return {name: repr(getattr(creature, name)) for name in dir(creature) if not name.startswith('_')}
+
+
+def test_stored_entry_reads_back_as_a_fresh_parse(tmp_path):
+    cache = ParseCache(tmp_path)
+    for sample in sorted(SAMPLES.glob("[CN]*/*.txt")):
+        raw = sample.read_text(encoding="utf-8")
+        assert cache.get(normalize(raw)) is None
+        assert fields(parse_creature(raw, cache)) == fields(fresh_parse(raw))
+        assert fields(cache.get(normalize(raw))) == fields(fresh_parse(raw))
+
+
+def test_damaged_entry_falls_back_to_parsing(tmp_path):
+    raw = sample_raw()
+    text = normalize(raw)
+    cache = ParseCache(tmp_path)
+    parse_creature(raw, cache)
+    entry = cache.entry_path(cache.key(text))
+
+    entry.write_bytes(entry.read_bytes()[:20])
+    assert cache.get(text) is None
+    assert fields(parse_creature(raw, cache)) == fields(fresh_parse(raw))
+
+    entry.write_bytes(b'not a cache entry')
+    assert cache.get(text) is None
+    assert fields(parse_creature(raw, cache)) == fields(fresh_parse(raw))
+    # The second parse stored a good entry again
+    assert fields(cache.get(text)) == fields(fresh_parse(raw))
+
+
+def test_new_parser_version_misses_the_cache(tmp_path, monkeypatch):
+    raw = sample_raw()
+    text = normalize(raw)
+    old_cache = ParseCache(tmp_path)
+    parse_creature(raw, old_cache)
+    assert old_cache.get(text) is not None
+    old_key = old_cache.key(text)
+
+    monkeypatch.setattr(Parsers.ParseCache, 'PARSER_VERSION', 'changed-parser')
+    new_cache = ParseCache(tmp_path)
+    assert new_cache.key(text) != old_key
+    assert new_cache.get(text) is None
+    assert fields(parse_creature(raw, new_cache)) == fields(fresh_parse(raw))
+    # Storing the first entry of the new version removes the old version's entries
+    assert not old_cache.version_directory.exists()
@@ -0,0 +1,40 @@
+"""
+Profiling a parse must not change it, nor the parser module other parses share.
+"""
+import re
+from pathlib import Path
+import Parsers.CreatureParser
+from Parsers.CreatureParser import ParseCreature
+from Parsers.ParserProfile import ParserProfile
+
+SAMPLES = Path(__file__).resolve().parent.parent / "samples"
+
+
+def parse(raw, profile):
+    creature_parser = ParseCreature(raw, profile=profile)
+    creature_parser.run()
+    return creature_parser.creature
+
+
+def fields(creature):
+    return {name: repr(getattr(creature, name)) for name in dir(creature) if not name.startswith('_')}
+
+
+def test_profiled_parse_matches_plain_parse_and_counts_callback_regexes():
+    profile = ParserProfile(True)
+    for sample in sorted(SAMPLES.glob("Creatures/*.txt")):
+        raw = sample.read_text(encoding="utf-8")
+        assert fields(parse(raw, profile)) == fields(parse(raw, ParserProfile(False)))
+    skills = profile.callbacks['transition_parse_skills']
+    assert skills.calls > 0 and skills.regex_calls >= skills.calls
+    # transition_parse_common_name calls transition_parse_experience_points, its search counts too
+    common_name = profile.callbacks['transition_parse_common_name']
+    assert common_name.regex_calls == 3 * common_name.calls
+
+
+def test_profiled_parse_leaves_registry_patterns_plain():
+    raw = next(SAMPLES.glob("Creatures/*.txt")).read_text(encoding="utf-8")
+    parse(raw, ParserProfile(True))
+    parse(raw, ParserProfile(False))
+    registry = {name: value for name, value in vars(Parsers.CreatureParser).items() if name.startswith('RE_')}
+    assert registry and all(isinstance(value, re.Pattern) for value in registry.values())
@@ -0,0 +1,42 @@
+"""
+The parser callbacks must only use the precompiled pattern registry.
+
+Every transition_parse_* callback in Parsers/CreatureParser.py matches through
+one of the module level RE_* compiled patterns.  Calling re.search/re.match/
+re.findall/... with a pattern inside a function goes back through the re module
+cache on every line, so any such call fails the test.
+"""
+import ast
+from pathlib import Path
+
+PARSER_SOURCE = Path(__file__).resolve().parent.parent / "Parsers" / "CreatureParser.py"
+UNCOMPILED_CALLS = {"search", "match", "fullmatch", "findall", "finditer", "split", "sub", "subn", "compile"}
+
+
+def find_uncompiled_calls(source):
+    """Return (function name, line number, call) for every re.<call>() made inside a function."""
+    violations = []
+    for function in ast.walk(ast.parse(source)):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        for node in ast.walk(function):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and isinstance(node.func.value, ast.Name) and node.func.value.id == "re"
+                    and node.func.attr in UNCOMPILED_CALLS):
+                violations.append((function.name, node.lineno, "re." + node.func.attr))
+    return violations
+
+
+def test_parser_callbacks_use_compiled_registry():
+    violations = find_uncompiled_calls(PARSER_SOURCE.read_text(encoding="utf-8"))
+    assert violations == [], "Add these patterns to the RE_* registry in CreatureParser.py: {}".format(violations)
+
+
+def test_uncompiled_pattern_in_callback_is_found():
+    source = (
+        "import re\n"
+        "RE_HP = re.compile(r'hp (\\d+)')\n"
+        "def transition_parse_hp(fsm_obj):\n"
+        "    return re.search(r'hp (\\d+)', fsm_obj.current_line)\n"
+    )
+    assert find_uncompiled_calls(source) == [("transition_parse_hp", 4, "re.search")]
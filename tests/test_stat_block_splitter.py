@@ -0,0 +1,41 @@
+"""
+Splitting a document of many stat blocks gives back each stat block on its own.
+"""
+from pathlib import Path
+from Parsers.StatBlockSplitter import split_stat_blocks
+
+SAMPLES = Path(__file__).resolve().parent.parent / "samples"
+
+
+def sample_texts():
+    return [sample.read_text(encoding="utf-8").replace("\r\n", "\n").strip()
+            for sample in sorted(SAMPLES.glob("[CN]*/*.txt"))]
+
+
+def split(document):
+    return [block.strip() for block in split_stat_blocks(document.splitlines(keepends=True))]
+
+
+def test_document_of_many_blocks_splits_into_each_block():
+    texts = sample_texts()
+    assert split("\n\n".join(texts)) == texts
+
+
+def test_leading_and_trailing_text_is_not_a_block():
+    texts = sample_texts()[:3]
+    preamble = ("This appendix collects the monsters of the campaign, ready to be imported.\n"
+                "Encounters in it range from CR 1 to CR 20, pick them by the table below.\n\n")
+    afterword = "\n\nThat is all of them, more will follow in the next issue of the gazette."
+    blocks = split(preamble + "\n\n".join(texts) + afterword)
+    assert blocks[:-1] == texts[:-1]
+    # Nothing marks where the last block ends, so the text after it stays part of it
+    assert blocks[-1] == texts[-1] + afterword
+
+
+def test_single_block_is_returned_whole():
+    for text in sample_texts():
+        assert split(text) == [text]
+
+
+def test_text_without_a_block_gives_nothing():
+    assert split("Nothing to see here.\nNot even a CR 3 mention with its experience.\n") == []